@@ -7,6 +7,7 @@ from django.contrib.auth import get_user_model
 from django.http import HttpRequest, HttpResponseForbidden
 from ninja.security import HttpBearer
 
+from accounts import permissions
 from accounts.models import ApiToken
 
 
@@ -25,11 +26,11 @@ class ApiTokenAuth(HttpBearer):
         except ValueError:
             return None
 
-        if ApiToken.objects.filter(token=token).exists():
-            request.user = ApiToken.objects.get(token=token).user
-            return token
-        else:
+        api_token = ApiToken.objects.select_related("user").filter(token=token).first()
+        if api_token is None:
             return None
+        request.user = api_token.user
+        return token
 
 
 class JWTAuth(HttpBearer):
@@ -50,7 +51,7 @@ def require_permission(permission_name):
     def decorator(func):
         @wraps(func)
         def wrapper(request, *args, **kwargs):
-            if not request.user.has_perm(permission_name):
+            if not permissions.has_perm(request.user, permission_name):
                 return HttpResponseForbidden("You don't have the required permission!")
             return func(request, *args, **kwargs)
 
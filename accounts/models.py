@@ -2,12 +2,19 @@ import uuid
 from django.db import models
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, BaseUserManager, User, PermissionsMixin
+from tasks.thumbnails import thumbnail_urls
 
 
 class UserProfile(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     biography = models.TextField()
     photo = models.ImageField(upload_to="user_photos/", blank=False)
+    # SHA-256 of photo, set once its thumbnails are generated
+    photo_sha256 = models.CharField(max_length=64, blank=True, default="")
+
+    @property
+    def photo_thumbnails(self) -> dict[str, str]:
+        return thumbnail_urls(self.photo, self.photo_sha256)
 
 
 class Organization(models.Model):
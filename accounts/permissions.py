@@ -0,0 +1,67 @@
+"""
+Permission engine: a user's permission set is loaded with a single query,
+kept on the user object for the rest of the request and in the cache
+across requests.
+
+Cached sets are invalidated by bumping a generation counter whenever
+group membership, group permissions or user permissions change (see
+accounts.signals).
+"""
+from django.conf import settings
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.db.models import Q
+
+GENERATION_KEY = "permissions:generation"
+
+
+def generation() -> int:
+    return cache.get_or_set(GENERATION_KEY, 1, timeout=None)
+
+
+def invalidate_all() -> None:
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, 1, timeout=None)
+
+
+def cache_key(user_id: int) -> str:
+    return f"permissions:{generation()}:{user_id}"
+
+
+def invalidate_user(user_id: int) -> None:
+    cache.delete(cache_key(user_id))
+
+
+def load_permissions(user) -> set[str]:
+    permissions = Permission.objects.all()
+    if not user.is_superuser:
+        permissions = permissions.filter(Q(user=user) | Q(group__user=user))
+    return {
+        f"{app_label}.{codename}"
+        for app_label, codename in permissions.values_list(
+            "content_type__app_label", "codename"
+        ).distinct()
+    }
+
+
+def get_permissions(user) -> set[str]:
+    """The "app_label.codename" permissions of `user`, directly or via groups."""
+    if not user.is_active or user.is_anonymous:
+        return set()
+    # Same attribute as ModelBackend's per-instance cache
+    if not hasattr(user, "_perm_cache"):
+        key = cache_key(user.pk)
+        permissions = cache.get(key)
+        if permissions is None:
+            permissions = load_permissions(user)
+            cache.set(key, permissions, settings.PERMISSION_CACHE_TIMEOUT)
+        user._perm_cache = permissions
+    return user._perm_cache
+
+
+def has_perm(user, permission: str) -> bool:
+    if user.is_active and user.is_superuser:
+        return True
+    return permission in get_permissions(user)
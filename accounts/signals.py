@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.contrib.auth.models import Group, Permission, User
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from accounts import permissions
+from accounts.models import UserProfile
+from tasks import thumbnails
+
+
+@receiver(pre_save, sender=UserProfile)
+def reset_photo_digest(sender, instance, **kwargs):
+    # A replaced photo needs its thumbnails generated again
+    photo = instance.photo
+    if not photo or not instance.photo_sha256:
+        return
+    if (
+        not photo._committed
+        or UserProfile.objects.filter(pk=instance.pk).exclude(photo=photo.name).exists()
+    ):
+        instance.photo_sha256 = ""
+
+
+@receiver(post_save, sender=UserProfile)
+def generate_photo_thumbnails(sender, instance, **kwargs):
+    if instance.photo and not instance.photo_sha256:
+        thumbnails.schedule(instance, "photo", "photo_sha256")
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+@receiver(m2m_changed, sender=Group.permissions.through)
+def invalidate_permissions(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        permissions.invalidate_all()
+
+
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Permission)
+def invalidate_deleted_permissions(sender, **kwargs):
+    permissions.invalidate_all()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_user_permissions(sender, instance, **kwargs):
+    # A new user may reuse the id of a deleted one
+    permissions.invalidate_user(instance.pk)
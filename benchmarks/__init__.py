@@ -0,0 +1,7 @@
+"""
+Standalone performance benchmarks.
+
+Each module is runnable with ``python -m benchmarks.<name>`` from the
+project root and works against a throwaway SQLite database, so the
+development ``db.sqlite3`` is never touched.
+"""
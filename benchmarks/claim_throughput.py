@@ -0,0 +1,63 @@
+"""
+Many worker threads claiming tasks from one shared pool.
+
+    python -m benchmarks.claim_throughput --threads 16 --tasks 2000 --batch 10
+
+Reports claim throughput and verifies that no task was handed out twice.
+"""
+import argparse
+import threading
+from collections import Counter
+
+from benchmarks.utils import setup_django, timer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=10)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.contrib.auth.models import User
+    from django.db import connection, OperationalError
+    from tasks import services
+    from tasks.models import Task
+
+    creator = User.objects.create(username="creator")
+    workers = [User.objects.create(username=f"worker-{i}") for i in range(args.threads)]
+    Task.objects.bulk_create(
+        [Task(title=f"Task {i}", creator=creator) for i in range(args.tasks)]
+    )
+    claims = Counter()
+    claims_lock = threading.Lock()
+
+    def work(user):
+        while True:
+            try:
+                claimed = services.claim_next_tasks(user.id, args.batch)
+            except OperationalError:
+                # SQLite gave up waiting for the write lock; try again
+                continue
+            if not claimed:
+                break
+            with claims_lock:
+                claims.update(claimed)
+        connection.close()
+
+    threads = [threading.Thread(target=work, args=(user,)) for user in workers]
+    with timer(f"{args.threads} threads claiming in batches of {args.batch}", args.tasks):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    duplicates = [task_id for task_id, count in claims.items() if count > 1]
+    print(f"claimed {len(claims)} of {args.tasks} tasks, {len(duplicates)} claimed twice")
+    assert not duplicates
+    assert len(claims) == args.tasks
+
+
+if __name__ == "__main__":
+    main()
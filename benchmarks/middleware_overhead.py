@@ -0,0 +1,69 @@
+"""
+Per-request middleware cost of token-authenticated API calls.
+
+    python -m benchmarks.middleware_overhead --requests 2000
+
+Times the same GET /api/v1/tasks/<id>, sent with session and CSRF
+cookies as a browser client would, through the configured MIDDLEWARE
+(with the API fast path), through Django's stock session, CSRF,
+authentication and messages middleware, and with no middleware at all.
+"""
+import argparse
+
+from benchmarks.utils import setup_django, timer
+
+STOCK_MIDDLEWARE = {
+    "tasks.middlewares.BrowserSessionMiddleware": "django.contrib.sessions.middleware.SessionMiddleware",
+    "tasks.middlewares.BrowserCsrfViewMiddleware": "django.middleware.csrf.CsrfViewMiddleware",
+    "tasks.middlewares.BrowserAuthenticationMiddleware": "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "tasks.middlewares.BrowserMessageMiddleware": "django.contrib.messages.middleware.MessageMiddleware",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.contrib.auth.models import User
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.test import RequestFactory, override_settings
+    from accounts.models import ApiToken
+    from tasks.models import Task
+
+    # Persistent connection, so that connection setup doesn't drown the
+    # middleware cost
+    settings.DATABASES["default"]["CONN_MAX_AGE"] = None
+    user = User.objects.create(username="api-user")
+    token = ApiToken.objects.create(user=user)
+    task = Task.objects.create(title="Task", creator=user)
+    environ = RequestFactory()._base_environ(
+        PATH_INFO=f"/api/v1/tasks/{task.id}",
+        REQUEST_METHOD="GET",
+        HTTP_AUTHORIZATION=f"Bearer {token.token}",
+        # Browser clients calling the API also carry their cookies
+        HTTP_COOKIE="sessionid=0123456789abcdefghijklmnopqrstuv; csrftoken=x",
+    )
+    statuses = []
+
+    def start_response(status, headers):
+        statuses.append(status)
+
+    stacks = {
+        "fast path": settings.MIDDLEWARE,
+        "stock middleware": [STOCK_MIDDLEWARE.get(path, path) for path in settings.MIDDLEWARE],
+        "no middleware": [],
+    }
+    for label, middleware in stacks.items():
+        with override_settings(MIDDLEWARE=middleware, ALLOWED_HOSTS=["*"]):
+            handler = WSGIHandler()
+            with timer(f"{label}: {len(middleware)} middleware", args.requests):
+                for _ in range(args.requests):
+                    b"".join(handler(dict(environ), start_response))
+            assert set(statuses) == {"200 OK"}, set(statuses)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Burndown and velocity of many sprints at once.
+
+    python -m benchmarks.sprint_burndown --sprints 300 --tasks 30
+
+Times computing every sprint in one batched pass, and reading them back
+once the finished sprints are cached.
+"""
+import argparse
+import random
+from datetime import datetime, time, timedelta
+
+from benchmarks.utils import setup_django, timer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sprints", type=int, default=300)
+    parser.add_argument("--tasks", type=int, default=30, help="Tasks per sprint.")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.contrib.auth.models import User
+    from django.core.cache import cache
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from django.utils import timezone
+    from tasks import burndown
+    from tasks.enums import TaskStatus
+    from tasks.models import Sprint, Task, TaskTransition
+
+    codes = TaskTransition.STATUS_CODES
+    creator = User.objects.create(username="planner")
+    first_day = timezone.localdate() - timedelta(days=14 * args.sprints)
+    sprints = Sprint.objects.bulk_create(
+        Sprint(
+            name=f"Sprint {number}",
+            start_date=first_day + timedelta(days=14 * number),
+            end_date=first_day + timedelta(days=14 * number + 13),
+            creator=creator,
+        )
+        for number in range(args.sprints)
+    )
+    tasks = Task.objects.bulk_create(
+        Task(title=f"Task {i}", creator=creator, status=TaskStatus.DONE.value)
+        for i in range(args.sprints * args.tasks)
+    )
+    transitions = []
+    for number, sprint in enumerate(sprints):
+        members = tasks[number * args.tasks:(number + 1) * args.tasks]
+        sprint.tasks.set(members)
+        start = datetime.combine(sprint.start_date, time(9), tzinfo=timezone.get_current_timezone())
+        for task in members:
+            done = start + timedelta(days=random.randrange(14))
+            transitions += [
+                TaskTransition(task_id=task.id, to_status=codes["UNASSIGNED"], at=start),
+                TaskTransition(task_id=task.id, from_status=codes["UNASSIGNED"], to_status=codes["DONE"], at=done),
+            ]
+    TaskTransition.objects.bulk_create(transitions, batch_size=1000)
+    sprints = list(Sprint.objects.order_by("start_date"))
+
+    cache.clear()
+    with CaptureQueriesContext(connection) as queries:
+        with timer(f"{args.sprints} sprints computed"):
+            burndown.sprint_burndowns(sprints)
+    print(f"{len(queries)} queries")
+    with timer(f"{args.sprints} sprints cached"):
+        burndown.sprint_burndowns(sprints)
+
+
+if __name__ == "__main__":
+    main()
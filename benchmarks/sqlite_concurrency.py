@@ -0,0 +1,128 @@
+"""
+Concurrent readers and writers against one SQLite file.
+
+    python -m benchmarks.sqlite_concurrency --readers 8 --writers 4 --writes 500
+    python -m benchmarks.sqlite_concurrency --untuned
+
+Writers record form submissions and claim tasks while readers list tasks
+until the writers are done. Reports both throughputs and the number of
+writes that failed with "database is locked". --untuned runs the same
+workload with SQLite's defaults (rollback journal, no busy timeout, no
+retries, a single connection alias) for comparison.
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from benchmarks.utils import setup_django
+
+
+def configure(database_path: Path, tuned: bool):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "taskmanager.settings")
+    from django.conf import settings
+
+    if tuned:
+        settings.DATABASES["read"] = {
+            **settings.DATABASES["default"],
+            "NAME": f"file:{database_path}?mode=ro",
+            "OPTIONS": {"uri": True},
+        }
+        settings.DATABASE_ROUTERS = ["taskmanager.routers.SQLiteReadRouter"]
+    else:
+        settings.DATABASES["default"]["OPTIONS"] = {}
+        settings.SQLITE_PRAGMAS = {
+            "journal_mode": "DELETE",
+            "synchronous": "FULL",
+            "busy_timeout": 0,
+            "mmap_size": 0,
+            "cache_size": -2000,
+            "temp_store": "DEFAULT",
+        }
+        settings.SQLITE_LOCK_RETRIES = 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--writes", type=int, default=500, help="per writer")
+    parser.add_argument("--untuned", action="store_true")
+    args = parser.parse_args()
+
+    database_path = Path(tempfile.mkdtemp()) / "benchmark.sqlite3"
+    configure(database_path, tuned=not args.untuned)
+    setup_django(database_path)
+    from django.contrib.auth.models import User
+    from django.db import OperationalError, connections
+    from tasks import services
+    from tasks.forms import record_submission
+    from tasks.models import Task
+
+    creator = User.objects.create(username="creator")
+    workers = [User.objects.create(username=f"worker-{i}") for i in range(args.writers)]
+    tasks = Task.objects.bulk_create(
+        [Task(title=f"Task {i}", creator=creator) for i in range(args.writers * args.writes)]
+    )
+    task_ids = [task.id for task in tasks]
+
+    done = threading.Event()
+    counts_lock = threading.Lock()
+    counts = {"writes": 0, "locked": 0, "reads": 0}
+
+    def write(index, user):
+        writes = locked = 0
+        for task_id in task_ids[index :: args.writers]:
+            try:
+                record_submission(uuid.uuid4())
+                services.claim_task(user.id, task_id)
+                writes += 2
+            except OperationalError:
+                locked += 1
+        with counts_lock:
+            counts["writes"] += writes
+            counts["locked"] += locked
+        connections.close_all()
+
+    def read():
+        reads = 0
+        while not done.is_set():
+            try:
+                list(Task.objects.filter(owner__isnull=True).order_by("-id")[:50])
+                Task.objects.filter(status="IN_PROGRESS").count()
+                reads += 2
+            except OperationalError:
+                pass
+        with counts_lock:
+            counts["reads"] += reads
+        connections.close_all()
+
+    readers = [threading.Thread(target=read) for _ in range(args.readers)]
+    writers = [
+        threading.Thread(target=write, args=(index, user))
+        for index, user in enumerate(workers)
+    ]
+    start = time.perf_counter()
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    done.set()
+    for thread in readers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    mode = "untuned" if args.untuned else "tuned"
+    print(
+        f"{mode}, {args.writers} writers / {args.readers} readers: {elapsed:.3f}s, "
+        f"{counts['writes'] / elapsed:,.0f} writes/s, "
+        f"{counts['reads'] / elapsed:,.0f} reads/s, "
+        f"{counts['locked']} writes failed with database is locked"
+    )
+
+
+if __name__ == "__main__":
+    main()
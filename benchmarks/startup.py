@@ -0,0 +1,55 @@
+"""
+Cold-start cost of short management commands and WSGI workers.
+
+    python -m benchmarks.startup --runs 5
+
+Each measurement starts a fresh interpreter: `manage.py check`, loading
+the WSGI application, and loading it then resolving the first API URL
+(which imports the ninja API on demand).
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+COMMANDS = {
+    "manage.py check": [sys.executable, "manage.py", "check"],
+    "WSGI application load": [
+        sys.executable,
+        "-c",
+        "from taskmanager.wsgi import application",
+    ],
+    "WSGI load + first API URL": [
+        sys.executable,
+        "-c",
+        "from taskmanager.wsgi import application; "
+        "from django.urls import resolve; resolve('/api/v1/tasks/')",
+    ],
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "taskmanager.settings"}
+    for label, command in COMMANDS.items():
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            subprocess.run(command, cwd=ROOT, env=env, check=True, capture_output=True)
+            timings.append(time.perf_counter() - start)
+        print(
+            f"{label}: median {statistics.median(timings) * 1000:.0f} ms, "
+            f"min {min(timings) * 1000:.0f} ms over {args.runs} runs"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Per-render cost of the task board with and without the cached loader.
+
+    python -m benchmarks.template_render --renders 500 --tasks 50
+
+"discovering" mirrors the former configuration: uncached loaders that
+search the whole project root before the template directory.
+"""
+import argparse
+
+from benchmarks.utils import setup_django, timer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--renders", type=int, default=500)
+    parser.add_argument("--tasks", type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.template.backends.django import DjangoTemplates
+    from tasks.models import Task
+
+    options = {"context_processors": []}
+    loaders = settings.TEMPLATE_LOADERS
+    backends = {
+        "discovering": DjangoTemplates(
+            {
+                "NAME": "discovering",
+                "DIRS": [settings.BASE_DIR, "templates", settings.BASE_DIR / "templates"],
+                "APP_DIRS": False,
+                "OPTIONS": {**options, "loaders": loaders},
+            }
+        ),
+        "cached": DjangoTemplates(
+            {
+                "NAME": "cached",
+                "DIRS": [settings.BASE_DIR / "templates"],
+                "APP_DIRS": False,
+                "OPTIONS": {
+                    **options,
+                    "loaders": [("django.template.loaders.cached.Loader", loaders)],
+                },
+            }
+        ),
+    }
+    tasks = [Task(id=i, title=f"Task {i}", version=1) for i in range(args.tasks)]
+    context = {
+        "unassigned_tasks": tasks,
+        "in_progress_tasks": tasks,
+        "done_tasks": tasks,
+        "csrf_token": "benchmark",
+    }
+
+    for name, backend in backends.items():
+        # The first render fills the fragment cache and the loader cache
+        backend.get_template("tasks/home.html").render(context)
+        with timer(f"{name}: load + render tasks/home.html", args.renders):
+            for _ in range(args.renders):
+                backend.get_template("tasks/home.html").render(context)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+def setup_django(database_path: str | Path | None = None) -> Path:
+    """
+    Configures Django against a fresh, migrated SQLite database and returns
+    its path.
+    """
+    import django
+    from django.conf import settings
+    from django.core.management import call_command
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "taskmanager.settings")
+    if database_path is None:
+        database_path = Path(tempfile.mkdtemp()) / "benchmark.sqlite3"
+    settings.DATABASES["default"]["NAME"] = database_path
+    django.setup()
+    call_command("migrate", verbosity=0)
+    return Path(database_path)
+
+
+@contextmanager
+def timer(label: str, operations: int = 1):
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label}: {elapsed:.3f}s total, "
+        f"{operations / elapsed:,.0f} ops/s, "
+        f"{elapsed / operations * 1e6:,.1f} us/op"
+    )
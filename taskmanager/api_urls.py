@@ -0,0 +1,3 @@
+from taskmanager.api import api_v1
+
+urlpatterns, _, _ = api_v1.urls
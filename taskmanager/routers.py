@@ -0,0 +1,100 @@
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Set once the current request (or thread) has written to the primary
+_wrote_primary: ContextVar[bool] = ContextVar("wrote_primary", default=False)
+# Set when a recent write by the same client may not have reached replicas
+_sticky: ContextVar[bool] = ContextVar("sticky", default=False)
+
+
+def wrote_primary() -> bool:
+    return _wrote_primary.get()
+
+
+def primary_pinned() -> bool:
+    return _wrote_primary.get() or _sticky.get()
+
+
+def start_request(sticky: bool = False):
+    """Resets stickiness for a new request; pass the tokens to `end_request`."""
+    return _wrote_primary.set(False), _sticky.set(sticky)
+
+
+def end_request(tokens) -> None:
+    wrote_token, sticky_token = tokens
+    _wrote_primary.reset(wrote_token)
+    _sticky.reset(sticky_token)
+
+
+def read_db() -> str:
+    """
+    The database alias a read-only service call should query: a random
+    replica, or the primary after a write (read-your-writes), inside a
+    transaction or when no replicas are configured.
+    """
+    replicas = getattr(settings, "DATABASE_REPLICAS", [])
+    if (
+        not replicas
+        or primary_pinned()
+        or connections[DEFAULT_DB_ALIAS].in_atomic_block
+    ):
+        return DEFAULT_DB_ALIAS
+    return random.choice(replicas)
+
+
+class ReplicaRouter:
+    """
+    Routes every write (including select_for_update) to the primary and
+    pins the rest of the request to it.
+
+    Reads stay on the primary unless a service opts into a replica with
+    `.using(read_db())`, since replicas may lag behind; related lookups
+    follow the database their instance was loaded from.
+    """
+
+    def db_for_read(self, model, **hints):
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db and not primary_pinned():
+            return instance._state.db
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        _wrote_primary.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class SQLiteReadRouter:
+    """
+    Sends reads to the read-only connection to the same SQLite file, so
+    they never queue behind the writer.
+
+    Reads made inside a transaction on the default connection stay on it:
+    the transaction's uncommitted writes are invisible to other connections.
+    """
+
+    read_alias = "read"
+
+    def db_for_read(self, model, **hints):
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return self.read_alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases are the same database
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
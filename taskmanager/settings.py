@@ -11,22 +11,50 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 import os
 from pathlib import Path
-from tasks.api.pagination import TaskManagerPagination
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
-# Quick-start development settings - unsuitable for production
+def env_bool(name, default=False):
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes")
+
+
+def env_list(name, default=""):
+    return [item.strip() for item in os.getenv(name, default).split(",") if item.strip()]
+
+
+def env_secret(name, dev_default):
+    # Development and test profiles fall back to a fixed, insecure value;
+    # production refuses to start without the real secret.
+    value = os.getenv(name)
+    if value:
+        return value
+    if PROFILE == "prod":
+        raise ImproperlyConfigured(f"The {name} environment variable is required in production.")
+    return dev_default
+
+
+# Settings profile: "dev" (default), "test" or "prod"
+PROFILE = os.getenv("DJANGO_PROFILE", "dev")
+if PROFILE not in ("dev", "test", "prod"):
+    raise ImproperlyConfigured(f"Unknown DJANGO_PROFILE {PROFILE!r}.")
+
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = "django-insecure-5-h)hafj#z3ouu+$wyvmvsc=^pca0wm5!1dzy!7#342h&3zr&n"
+SECRET_KEY = env_secret(
+    "DJANGO_SECRET_KEY",
+    "django-insecure-5-h)hafj#z3ouu+$wyvmvsc=^pca0wm5!1dzy!7#342h&3zr&n",
+)
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = env_bool("DJANGO_DEBUG", PROFILE == "dev")
 
-ALLOWED_HOSTS = []
+ALLOWED_HOSTS = env_list(
+    "DJANGO_ALLOWED_HOSTS", "" if PROFILE == "prod" else "localhost,127.0.0.1,testserver"
+)
 
 
 # Application definition
@@ -48,25 +76,38 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "tasks.middlewares.RequestTimeMiddleware",
+    "tasks.middlewares.ReplicaStickinessMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    # Sessions, CSRF, authentication and messages are skipped for
+    # bearer-token requests under API_PREFIX (see tasks.middlewares)
+    "tasks.middlewares.BrowserSessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    "tasks.middlewares.BrowserCsrfViewMiddleware",
+    "tasks.middlewares.BrowserAuthenticationMiddleware",
+    "tasks.middlewares.BrowserMessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+API_PREFIX = "/api/"
+
 ROOT_URLCONF = "taskmanager.urls"
 
+TEMPLATE_LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+
+# Outside of development, compile every template once per process and
+# precompile them all at startup (see taskmanager.templating)
+TEMPLATE_CACHE = env_bool("DJANGO_TEMPLATE_CACHE", not DEBUG)
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [
-            BASE_DIR,
-            "templates",
+            BASE_DIR / "templates",
         ],
-        "APP_DIRS": True,
+        "APP_DIRS": not TEMPLATE_CACHE,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.request",
@@ -78,29 +119,93 @@ TEMPLATES = [
     },
 ]
 
+if TEMPLATE_CACHE:
+    TEMPLATES[0]["OPTIONS"]["loaders"] = [
+        ("django.template.loaders.cached.Loader", TEMPLATE_LOADERS),
+    ]
+
+
 WSGI_APPLICATION = "taskmanager.wsgi.application"
 
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+# Keep connections open between requests outside of tests (seconds, 0 closes
+# them after every request) and check them before reuse.
+CONN_MAX_AGE = int(os.getenv("DB_CONN_MAX_AGE", 600 if PROFILE == "prod" else 0))
+
+if os.getenv("DB_ENGINE", "sqlite") == "postgresql":
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.getenv("DB_NAME", "mydatabase"),
+            "USER": os.getenv("DB_USER", "postgres"),
+            "PASSWORD": env_secret("DB_PASSWORD", "mysecretpassword"),
+            "HOST": os.getenv("DB_HOST", "db"),
+            "PORT": os.getenv("DB_PORT", "5432"),
+            "CONN_MAX_AGE": CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {},
+        }
     }
-}
-# Postgres config
-# DATABASES = {
-#     "default": {
-#         "ENGINE": "django.db.backends.postgresql",
-#         "NAME": os.getenv("DB_NAME", "mydatabase"),
-#         "USER": os.getenv("DB_USER", "postgres"),
-#         "PASSWORD": os.getenv("DB_PASSWORD", "mysecretpassword"),
-#         "HOST": os.getenv("DB_HOST", "db"),
-#         "PORT": os.getenv("DB_PORT", "5432"),
-#     }
-# }
+    # psycopg's connection pool replaces persistent connections
+    if env_bool("DB_POOL"):
+        DATABASES["default"]["CONN_MAX_AGE"] = 0
+        DATABASES["default"]["OPTIONS"]["pool"] = {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", 2)),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", 10)),
+        }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.getenv("DB_NAME", BASE_DIR / "db.sqlite3"),
+            "CONN_MAX_AGE": CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {
+                # Writes take the lock up front instead of failing when a
+                # read transaction tries to upgrade. Connection pragmas (WAL,
+                # busy_timeout, ...) are set by taskmanager.sqlite.
+                "transaction_mode": "IMMEDIATE",
+            },
+        }
+    }
+    # A separate read-only connection to the same file serves reads, so
+    # they never wait behind the writer. Not used with DB_REPLICAS, whose
+    # ReplicaRouter takes over the routing of reads (see below).
+    if env_bool("DB_READ_CONNECTION", PROFILE == "prod") and not env_list("DB_REPLICAS"):
+        DATABASES["read"] = {
+            **DATABASES["default"],
+            "NAME": f"file:{DATABASES['default']['NAME']}?mode=ro",
+            "OPTIONS": {"uri": True},
+            "TEST": {"MIRROR": "default"},
+        }
+        DATABASE_ROUTERS = ["taskmanager.routers.SQLiteReadRouter"]
+
+# Read replicas, as comma-separated PostgreSQL hosts or SQLite files.
+# Read-only service calls use them; a request that writes, and the same
+# client's requests for REPLICA_STICKY_SECONDS afterwards, stay on the
+# primary so they read their own writes. ReplicaRouter replaces
+# SQLiteReadRouter, and no read-only connection is set up then.
+DATABASE_REPLICAS = []
+for index, replica in enumerate(env_list("DB_REPLICAS"), start=1):
+    DATABASES[f"replica{index}"] = {
+        **DATABASES["default"],
+        ("NAME" if DATABASES["default"]["ENGINE"].endswith("sqlite3") else "HOST"): replica,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica{index}")
+if DATABASE_REPLICAS:
+    DATABASE_ROUTERS = ["taskmanager.routers.ReplicaRouter"]
+REPLICA_STICKY_SECONDS = int(os.getenv("DB_REPLICA_STICKY_SECONDS", 10))
+
+# Overrides of taskmanager.sqlite.DEFAULT_PRAGMAS
+SQLITE_PRAGMAS = {}
+# Writes failing with "database is locked" are retried this many times,
+# backing off exponentially from SQLITE_LOCK_BACKOFF seconds
+SQLITE_LOCK_RETRIES = 5
+SQLITE_LOCK_BACKOFF = 0.05
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -143,6 +248,24 @@ STATICFILES_DIRS = [
     (os.path.join(BASE_DIR, "tasks/static")),
 ]
 
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+    # Task attachments, deduplicated by content. "backend" may be any
+    # storage class, e.g. "storages.backends.s3.S3Storage" with its options.
+    "attachments": {
+        "BACKEND": "tasks.storage.ContentAddressedStorage",
+        "OPTIONS": {
+            "backend": "django.core.files.storage.FileSystemStorage",
+            "options": {},
+        },
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -150,16 +273,42 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
-# Redis config
-# CACHES = {
-#     "default": {
-#         "BACKEND": "django_redis.cache.RedisCache",
-#         "LOCATION": "redis://127.0.0.1:6379/1",
-#         "OPTIONS": {
-#             "CLIENT_CLASS": "django_redis.client.DefaultClient",
-#         },
-#     }
-# }
+# Cache: "locmem" (per process), "file" (shared by the processes of one
+# host) or a redis:// URL for a Redis-compatible server
+CACHE_URL = os.getenv("DJANGO_CACHE", "file" if PROFILE == "prod" else "locmem")
+
+if CACHE_URL.startswith(("redis://", "rediss://")):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_URL,
+        }
+    }
+elif CACHE_URL == "file":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": os.getenv("DJANGO_CACHE_DIR", BASE_DIR / "cache"),
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        }
+    }
+elif CACHE_URL == "locmem":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+else:
+    raise ImproperlyConfigured(f"Unknown DJANGO_CACHE {CACHE_URL!r}.")
+
+# Serve sessions from the cache; the database stays the source of truth
+# unless the cache is shared and persistent (Redis).
+if PROFILE == "prod":
+    SESSION_ENGINE = (
+        "django.contrib.sessions.backends.cache"
+        if CACHE_URL.startswith(("redis://", "rediss://"))
+        else "django.contrib.sessions.backends.cached_db"
+    )
 
 # AUTH_USER_MODEL = 'accounts.TaskManagerUser'
 
@@ -167,10 +316,57 @@ EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 #     "accounts.backends.OrganizationUsernameOrEmailBackend",
 # ]
 
+# Serves user.has_perm() from the cached permission sets of accounts.permissions
+AUTHENTICATION_BACKENDS = ["accounts.backends.CachedPermissionBackend"]
+PERMISSION_CACHE_TIMEOUT = 15 * 60
+
+# Seconds tasks fetched by id in bulk stay cached (see services.get_tasks);
+# 0 turns the cache off. Writes through the services drop cached copies.
+TASK_CACHE_TIMEOUT = int(os.getenv("TASK_CACHE_TIMEOUT", 0))
+
 LOGIN_REDIRECT_ULR = "tasks:task-home"
 LOGOUT_REDIRECT_ULR = "accounts:login"
 
-NINJA_PAGINATION_CLASS = TaskManagerPagination
-
-JWT_SECRET_KEY = "74d98426-d7b9-43d6-91d2-2e21c46a1db9"
-JWT_REFRESH_SECRET_KEY = "2e21c46a1db9-74d98426-d7b9-43d6-91d2"
+# A dotted path keeps ninja and pydantic out of the settings import. The
+# API pages with limit/offset; tasks.api.pagination.TaskManagerPagination
+# is not in use.
+NINJA_PAGINATION_CLASS = "ninja.pagination.LimitOffsetPagination"
+
+# Live task events; switch to "tasks.events.SQLiteBroadcaster" to share
+# events between several worker processes on one host.
+TASK_EVENTS_BROADCASTER = "tasks.events.LocalBroadcaster"
+TASK_EVENTS_OPTIONS = {}
+
+# Suggested chunk size for resumable attachment uploads
+TASK_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Bounding boxes of the thumbnails generated for uploaded images
+THUMBNAIL_SIZES = {"small": (64, 64), "medium": (320, 320)}
+
+# Hand attachment downloads off to the web server: "X-Accel-Redirect"
+# (nginx, with an internal location at the prefix) or "X-Sendfile".
+TASK_ATTACHMENT_SENDFILE = None
+TASK_ATTACHMENT_SENDFILE_PREFIX = "/protected/"
+
+# ARCHIVED tasks older than this are moved to cold storage by the
+# `archive_tasks` management command
+TASK_ARCHIVE_AFTER_DAYS = 90
+
+# Days before the rollup watermark recomputed by `rollup_task_stats`,
+# to pick up late changes to recent tasks
+TASK_REPORT_LOOKBACK_DAYS = 7
+
+JWT_SECRET_KEY = env_secret("JWT_SECRET_KEY", "74d98426-d7b9-43d6-91d2-2e21c46a1db9")
+JWT_REFRESH_SECRET_KEY = env_secret(
+    "JWT_REFRESH_SECRET_KEY", "2e21c46a1db9-74d98426-d7b9-43d6-91d2"
+)
+
+if PROFILE == "test":
+    # Fast, isolated test runs
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+if PROFILE == "prod":
+    SESSION_COOKIE_SECURE = env_bool("DJANGO_SECURE_COOKIES", True)
+    CSRF_COOKIE_SECURE = SESSION_COOKIE_SECURE
+    CSRF_TRUSTED_ORIGINS = env_list("DJANGO_CSRF_TRUSTED_ORIGINS")
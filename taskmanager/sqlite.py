@@ -0,0 +1,87 @@
+"""
+SQLite tuning: pragmas applied to every new connection and retrying of
+writes that lose the race for the database write lock.
+
+The read-only connection used for reads is configured in settings and
+selected by `taskmanager.routers.SQLiteReadRouter`.
+"""
+import functools
+import random
+import time
+
+from django.conf import settings
+from django.db import OperationalError, connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+DEFAULT_PRAGMAS = {
+    # Readers never block the writer and the writer never blocks readers
+    "journal_mode": "WAL",
+    # Durable across application crashes; only an OS crash can lose the
+    # last transactions, never corrupt the database
+    "synchronous": "NORMAL",
+    # Milliseconds to wait for a lock before raising "database is locked"
+    "busy_timeout": 5000,
+    "mmap_size": 256 * 1024 * 1024,
+    # Negative values are KiB
+    "cache_size": -20000,
+    "temp_store": "MEMORY",
+}
+
+# Pragmas that write to the database file and fail on read-only connections
+WRITE_PRAGMAS = {"journal_mode"}
+
+
+def pragmas() -> dict:
+    return {**DEFAULT_PRAGMAS, **getattr(settings, "SQLITE_PRAGMAS", {})}
+
+
+def is_read_only(settings_dict: dict) -> bool:
+    return "mode=ro" in str(settings_dict["NAME"])
+
+
+@receiver(connection_created)
+def apply_pragmas(sender, connection, **kwargs):
+    if connection.vendor != "sqlite":
+        return
+    read_only = is_read_only(connection.settings_dict)
+    with connection.cursor() as cursor:
+        for name, value in pragmas().items():
+            if read_only and name in WRITE_PRAGMAS:
+                continue
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def is_lock_error(exc: Exception) -> bool:
+    message = str(exc)
+    return "database is locked" in message or "database table is locked" in message
+
+
+def retry_on_lock(func=None, *, attempts: int | None = None, backoff: float | None = None):
+    """
+    Retries `func` when SQLite reports the database as locked, sleeping
+    with exponential backoff and jitter between attempts.
+
+    Only an outermost call is retried: inside an enclosing transaction the
+    error has already broken that transaction, so it is re-raised.
+    """
+    if func is None:
+        return functools.partial(retry_on_lock, attempts=attempts, backoff=backoff)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        max_attempts = attempts or getattr(settings, "SQLITE_LOCK_RETRIES", 5)
+        delay = backoff or getattr(settings, "SQLITE_LOCK_BACKOFF", 0.05)
+        for attempt in range(max_attempts):
+            try:
+                return func(*args, **kwargs)
+            except OperationalError as exc:
+                if (
+                    not is_lock_error(exc)
+                    or attempt == max_attempts - 1
+                    or connections["default"].in_atomic_block
+                ):
+                    raise
+                time.sleep(delay * 2**attempt * random.uniform(0.5, 1.5))
+
+    return wrapper
@@ -0,0 +1,52 @@
+"""
+Template precompilation.
+
+With the cached template loader every worker compiles a template the
+first time it renders it. `warm_templates` compiles all of them up front,
+so no request pays for template discovery and parsing.
+"""
+import logging
+import time
+from pathlib import Path
+
+from django.template import TemplateSyntaxError, engines
+from django.template.utils import get_app_template_dirs
+
+logger = logging.getLogger(__name__)
+
+
+def template_dirs(engine) -> list[Path]:
+    dirs = [Path(directory) for directory in engine.dirs]
+    if engine.app_dirs or any(
+        "app_directories" in str(loader) for loader in engine.engine.loaders
+    ):
+        dirs += [Path(directory) for directory in get_app_template_dirs("templates")]
+    return dirs
+
+
+def iter_template_names(engine):
+    for directory in template_dirs(engine):
+        for path in sorted(directory.rglob("*.html")):
+            yield path.relative_to(directory).as_posix()
+
+
+def warm_templates(engine_name: str = "django") -> dict:
+    """
+    Compiles every template of the engine into its loader cache and returns
+    the names that compiled and those that failed.
+    """
+    engine = engines[engine_name]
+    compiled, failed = [], {}
+    start = time.perf_counter()
+    for name in dict.fromkeys(iter_template_names(engine)):
+        try:
+            engine.get_template(name)
+            compiled.append(name)
+        except TemplateSyntaxError as exc:
+            failed[name] = str(exc)
+            logger.warning("Template %s does not compile: %s", name, exc)
+    return {
+        "compiled": compiled,
+        "failed": failed,
+        "seconds": time.perf_counter() - start,
+    }
@@ -18,11 +18,12 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
-from taskmanager.api import api_v1
 
 urlpatterns = [
     path("admin/", admin.site.urls),
-    path("api/v1/", api_v1.urls),
+    # A module path rather than include(): the ninja API is only imported
+    # once a request is routed under api/v1/
+    path("api/v1/", ("taskmanager.api_urls", "ninja", "api-v1")),
     path("accounts/", include("accounts.urls")),
     path(
         "", include("tasks.urls", namespace="tasks")
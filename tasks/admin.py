@@ -1,6 +1,8 @@
 from django.contrib import admin
 from django.http.request import HttpRequest
 
+from tasks import services
+from tasks.enums import TaskStatus, TaskTransitionResult
 from tasks.models import Epic, Task, Sprint
 
 @admin.register(Task)
@@ -10,9 +12,21 @@ class TaskAdmin(admin.ModelAdmin):
     actions = ['mark_archived']
     def mark_archived(self, request, queryset):
         """ method update status ARCHIVED all tasks"""
-        queryset.update(status='ARCHIVED')
+        results = services.bulk_transition_tasks(
+            list(queryset.values_list("id", flat=True)),
+            TaskStatus.ARCHIVED,
+            actor_id=request.user.pk,
+        )
+        archived = sum(
+            result == TaskTransitionResult.TRANSITIONED for result in results.values()
+        )
+        self.message_user(request, f"{archived} of {len(results)} tasks archived.")
     mark_archived.short_description = 'Mark selected tasks as archived'
 
+    def save_model(self, request, obj, form, change):
+        obj._actor_id = request.user.pk
+        super().save_model(request, obj, form, change)
+
     def has_change_permission(self, request, obj=None):
         if request.user.has_perm('tasks.change_task'):
             return True
@@ -6,9 +6,9 @@ from ninja import Schema
 class TaskManagerPagination(PaginationBase):
     # only `skip` param, defaults to 5 per page
     class Input(Schema):
-        skip_records: int
+        skip_records: int = 0
 
-    class Ouput(Schema):
+    class Output(Schema):
         items: list[Any]
         count: int
         page_size: int
@@ -16,7 +16,7 @@ class TaskManagerPagination(PaginationBase):
     def paginate_queryset(self, queryset, pagination: Input, **params):
         skip_records = pagination.skip_records
         return {
-            "data": queryset[skip_records: skip_records + 5],
+            "items": queryset[skip_records: skip_records + 5],
             "count": queryset.count(),
             "page_size": 5,
         }
\ No newline at end of file
@@ -0,0 +1,70 @@
+from datetime import date
+from http import HTTPStatus
+from django.http import HttpRequest
+from ninja import Query, Router
+from ninja.errors import HttpError
+from tasks.schemas import (
+    OwnerThroughputSchemaOut,
+    SprintBurndownSchemaOut,
+    SprintVelocitySchemaOut,
+    ThroughputSchemaOut,
+)
+from accounts.api.security import ApiTokenAuth
+from tasks.enums import ReportPeriod
+from tasks import burndown, reports
+from tasks.models import Sprint
+
+router = Router(auth=ApiTokenAuth(), tags=["reports"])
+
+
+MAX_SPRINTS = 500
+
+
+def select_sprints(ids: list[int] | None, epic_id: int | None) -> list[Sprint]:
+    sprints = Sprint.objects.only("id", "name", "start_date", "end_date").order_by(
+        "start_date", "id"
+    )
+    if ids:
+        sprints = sprints.filter(id__in=ids)
+    if epic_id is not None:
+        sprints = sprints.filter(epic_id=epic_id)
+    return list(sprints[:MAX_SPRINTS])
+
+
+def check_range(start: date, end: date) -> None:
+    if start > end:
+        raise HttpError(
+            status_code=HTTPStatus.BAD_REQUEST, message="start must not be after end"
+        )
+
+
+@router.get("/throughput", response=list[ThroughputSchemaOut])
+def throughput(
+    request: HttpRequest, start: date, end: date, period: ReportPeriod = ReportPeriod.DAY
+):
+    """Tasks created and completed, and their average cycle time, per day or week."""
+    check_range(start, end)
+    return reports.throughput(start, end, period)
+
+
+@router.get("/owners", response=list[OwnerThroughputSchemaOut])
+def owner_throughput(request: HttpRequest, start: date, end: date):
+    """Tasks completed and average cycle time per owner."""
+    check_range(start, end)
+    return reports.owner_throughput(start, end)
+
+
+@router.get("/sprints", response=list[SprintBurndownSchemaOut])
+def sprint_burndowns(
+    request: HttpRequest, ids: list[int] = Query(None), epic_id: int | None = None
+):
+    """Daily remaining tasks, scope and velocity of the selected sprints."""
+    return burndown.sprint_burndowns(select_sprints(ids, epic_id))
+
+
+@router.get("/sprints/velocity", response=list[SprintVelocitySchemaOut])
+def sprint_velocity(
+    request: HttpRequest, ids: list[int] = Query(None), epic_id: int | None = None
+):
+    """Scope and velocity of the selected sprints, without the daily series."""
+    return burndown.sprint_burndowns(select_sprints(ids, epic_id))
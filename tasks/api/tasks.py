@@ -1,5 +1,7 @@
 from http import HTTPStatus
+from uuid import UUID
 from django.http import HttpRequest, HttpResponse, Http404
+from django_ratelimit.core import is_ratelimited
 from django_ratelimit.decorators import ratelimit
 from ninja import Router, Path, Query
 from ninja.errors import HttpError
@@ -10,42 +12,156 @@ from tasks.schemas import (
     TaskSchemaOut,
     PathDate,
     TaskFilterSchema,
+    TaskChangeFeedSchemaOut,
+    ClaimedTasksSchemaOut,
+    TaskTransitionSchemaIn,
+    TaskTransitionResultSchemaOut,
+    TaskBatchSchemaIn,
+    TaskBatchResultSchemaOut,
+    TaskBulkSchemaOut,
+    UploadStartSchemaIn,
+    UploadSessionSchemaOut,
+    UploadCompleteSchemaOut,
 )
 from accounts.api.security import ApiTokenAuth, require_permission
-from tasks.enums import TaskStatus
-from tasks import services
-from tasks.services import TaskAlreadyClaimedException
+from tasks.enums import TaskExpansion, TaskStatus
+from tasks import batch, downloads, services, uploads
+from tasks.models import UploadSession
+from tasks.services import TaskAlreadyClaimedException, TaskVersionConflictException
 
 router = Router(auth=ApiTokenAuth(), tags=["tasks"])
 
+# Task creation budget per client IP, shared by single and batch creates
+CREATE_RATE = "100/h"
+CREATE_RATE_GROUP = "tasks.create"
+
 
 @router.post("/", response={201: CreateSchemaOut})
 @require_permission("tasks.add_tasks")
-@ratelimit(key="ip", rate="100/h")
+@ratelimit(key="ip", rate=CREATE_RATE, group=CREATE_RATE_GROUP)
 def create_task(request: HttpRequest, task_in: TaskSchemaIn):
     creator = request.user
     return services.create_task(creator, **task_in.dict())
 
 
+def parse_expand(request: HttpRequest, expand: str) -> set[TaskExpansion]:
+    """
+    Parses a comma separated `expand` parameter and remembers the result on
+    the request, where TaskSchemaOut looks for it.
+    """
+    try:
+        request.task_expand = {
+            TaskExpansion(item.strip()) for item in expand.split(",") if item.strip()
+        }
+    except ValueError:
+        choices = ", ".join(item.value for item in TaskExpansion)
+        raise HttpError(
+            status_code=HTTPStatus.BAD_REQUEST, message=f"expand accepts: {choices}"
+        )
+    return request.task_expand
+
+
 @router.get("/", response=list[TaskSchemaOut], auth=ApiTokenAuth())
 @paginate
 # def list_tasks(request: HttpRequest, filters: TaskFilterSchema = Query(...)):
 #     return services.list_tasks(**filters.dict())
-def list_tasks(request: HttpRequest):
-    return services.list_tasks()
+def list_tasks(request: HttpRequest, expand: str = ""):
+    """Tasks; `expand=owner,creator,epics,sprints` embeds related objects."""
+    return services.list_tasks(expand=parse_expand(request, expand))
+
+
+MAX_BULK_IDS = 500
+
+
+@router.get("/bulk", response=TaskBulkSchemaOut)
+def get_tasks(request: HttpRequest, ids: str, expand: str = ""):
+    """
+    Tasks by id (`ids=1,2,3`) in one call, in the order asked for; ids of
+    tasks that don't exist are listed under `missing`.
+    """
+    try:
+        task_ids = list(dict.fromkeys(int(task_id) for task_id in ids.split(",") if task_id))
+    except ValueError:
+        raise HttpError(
+            status_code=HTTPStatus.BAD_REQUEST, message="ids must be comma separated integers"
+        )
+    if len(task_ids) > MAX_BULK_IDS:
+        raise HttpError(
+            status_code=HTTPStatus.BAD_REQUEST, message=f"At most {MAX_BULK_IDS} ids at once"
+        )
+    found = services.get_tasks(task_ids, expand=parse_expand(request, expand))
+    return {
+        "tasks": [found[task_id] for task_id in task_ids if task_id in found],
+        "missing": [task_id for task_id in task_ids if task_id not in found],
+    }
+
+
+@router.get("/changes", response=TaskChangeFeedSchemaOut)
+def task_changes(request: HttpRequest, since: int = 0, limit: int = 100):
+    """
+    Change feed for incremental sync: pass the returned `next_token`
+    as `since` to receive only what changed afterwards.
+    """
+    limit = max(1, min(limit, 500))
+    return services.get_task_changes(since=since, limit=limit)
+
+
+def etag(task) -> str:
+    return f'"{task.version}"'
+
+
+def if_match_version(request: HttpRequest) -> int | None:
+    """Returns the task version the client based its update on, if any."""
+    header = request.headers.get("If-Match", "").strip()
+    if not header or header == "*":
+        return None
+    version = header.removeprefix("W/").strip('"')
+    if not version.isdigit():
+        raise HttpError(
+            status_code=HTTPStatus.PRECONDITION_FAILED, message="Invalid If-Match header"
+        )
+    return int(version)
+
 
 @router.get("/{int:task_id}", response=TaskSchemaOut)
-def get_task(request: HttpRequest, task_id: int):
-    task = services.get_task(task_id)
+def get_task(request: HttpRequest, response: HttpResponse, task_id: int, expand: str = ""):
+    task = services.get_task(task_id, expand=parse_expand(request, expand))
     if task is None:
         raise Http404("Task not found.")
+    response["ETag"] = etag(task)
     return task
 
 
+@router.get("/{int:task_id}/attachments/{str:name}")
+def download_attachment(request: HttpRequest, task_id: int, name: str):
+    """Streams the task's `file` or `image` attachment, honouring Range."""
+    task = services.get_task(task_id)
+    if task is None:
+        raise Http404("Task not found.")
+    return downloads.attachment_response(
+        request, downloads.get_attachment(task, name)
+    )
+
+
 @router.put("/{int:task_id}")
 def update_task(request: HttpRequest, task_id: int, task_data: TaskSchemaIn):
-    services.update_task(task_id=task_id, task_data=task_data.dict())
-    return HttpResponse(status=HTTPStatus.NO_CONTENT)
+    try:
+        task = services.update_task(
+            task_id=task_id,
+            task_data=task_data.dict(exclude_unset=True),
+            expected_version=if_match_version(request),
+            actor_id=request.user.pk,
+        )
+    except TaskVersionConflictException:
+        raise HttpError(
+            status_code=HTTPStatus.PRECONDITION_FAILED,
+            message="Task was modified by someone else",
+        )
+    if task is None:
+        raise Http404("Task not found.")
+    response = HttpResponse(status=HTTPStatus.NO_CONTENT)
+    response["ETag"] = etag(task)
+    return response
 
 
 @router.delete("/{int:task_id}")
@@ -57,9 +173,7 @@ def delete_task(request: HttpRequest, task_id: int):
 @router.get("/archive/{int:year}/{int:month}/{int:day}", response=list[TaskSchemaOut])
 @paginate
 def archived_tasks(request, created_at: PathDate = Path(...)):
-    return services.search_tasks(
-        created_at=created_at, status=TaskStatus.ARCHIVED.value
-    )
+    return services.search_archived_tasks(created_at=created_at)
 
 @router.get("/error")
 def generate_error(request):
@@ -77,3 +191,89 @@ def claim_task_api(request: HttpRequest, task_id: int):
         raise HttpError(
             status_code=HTTPStatus.BAD_REQUEST, message="Task already claimed"
         )
+
+
+@router.post("/claim-next", response=ClaimedTasksSchemaOut)
+@require_permission("tasks.change_task")
+def claim_next_tasks_api(request: HttpRequest, limit: int = 1):
+    """Claims up to `limit` of the oldest unassigned tasks for the caller."""
+    limit = max(1, min(limit, 100))
+    return {"claimed": services.claim_next_tasks(request.user.pk, limit)}
+
+
+
+@router.post("/transitions", response=list[TaskTransitionResultSchemaOut])
+@require_permission("tasks.change_task")
+def transition_tasks(request: HttpRequest, transition: TaskTransitionSchemaIn):
+    """Moves many tasks to another status in one set-based operation."""
+    results = services.bulk_transition_tasks(
+        transition.ids, transition.status, actor_id=request.user.pk
+    )
+    return [{"id": task_id, "result": result} for task_id, result in results.items()]
+
+
+@router.post("/batch", response=list[TaskBatchResultSchemaOut])
+def run_batch(request: HttpRequest, batch_in: TaskBatchSchemaIn):
+    """
+    Creates, updates, claims and deletes many tasks in one request. Returns
+    a result per operation; with `atomic` nothing is applied if any fails.
+    """
+    operations = [operation.dict(exclude_unset=True) for operation in batch_in.operations]
+    limited = False
+
+    def allow_create() -> bool:
+        # Each create counts against the same budget as POST /tasks/
+        nonlocal limited
+        limited = limited or is_ratelimited(
+            request, group=CREATE_RATE_GROUP, key="ip", rate=CREATE_RATE, increment=True
+        )
+        return not limited
+
+    return batch.run_batch(
+        request.user, operations, atomic=batch_in.atomic, allow_create=allow_create
+    )
+
+
+@router.post("/{int:task_id}/uploads", response={201: UploadSessionSchemaOut})
+@require_permission("tasks.change_task")
+def start_upload(request: HttpRequest, task_id: int, upload_in: UploadStartSchemaIn):
+    """Starts a chunked upload of an attachment for the task."""
+    task = services.get_task(task_id)
+    if task is None:
+        raise Http404("Task not found.")
+    try:
+        return 201, uploads.start_upload(task, request.user, **upload_in.dict())
+    except uploads.UploadError as exc:
+        raise HttpError(status_code=HTTPStatus.BAD_REQUEST, message=str(exc))
+
+
+@router.get("/uploads/{uuid:upload_id}", response=UploadSessionSchemaOut)
+def upload_status(request: HttpRequest, upload_id: UUID):
+    """Shows how many bytes arrived, i.e. where to resume the upload."""
+    return UploadSession.objects.get(id=upload_id, user=request.user)
+
+
+@router.put("/uploads/{uuid:upload_id}", response=UploadSessionSchemaOut)
+def append_upload_chunk(request: HttpRequest, upload_id: UUID, offset: int):
+    """Appends the raw request body as the chunk starting at `offset`."""
+    session = UploadSession.objects.get(id=upload_id, user=request.user)
+    length = int(request.META.get("CONTENT_LENGTH") or 0)
+    try:
+        uploads.append_chunk(session, offset, request, length)
+    except uploads.UploadOffsetMismatch as exc:
+        raise HttpError(status_code=HTTPStatus.CONFLICT, message=str(exc))
+    except uploads.UploadError as exc:
+        raise HttpError(status_code=HTTPStatus.BAD_REQUEST, message=str(exc))
+    return session
+
+
+@router.post("/uploads/{uuid:upload_id}/complete", response=UploadCompleteSchemaOut)
+def complete_upload(request: HttpRequest, upload_id: UUID):
+    """Assembles the chunks and attaches the file to the task."""
+    session = UploadSession.objects.get(id=upload_id, user=request.user)
+    try:
+        return {"name": uploads.complete_upload(session)}
+    except uploads.UploadIntegrityError as exc:
+        raise HttpError(status_code=HTTPStatus.UNPROCESSABLE_ENTITY, message=str(exc))
+    except uploads.UploadError as exc:
+        raise HttpError(status_code=HTTPStatus.BAD_REQUEST, message=str(exc))
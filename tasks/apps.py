@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "tasks"
+
+    def ready(self):
+        # Register the signal handlers
+        from tasks import signals  # noqa: F401
+        # Tune SQLite connections as they are opened
+        from taskmanager import sqlite  # noqa: F401
@@ -0,0 +1,168 @@
+"""
+Many task operations sent in one API request (POST /api/v1/tasks/batch).
+
+Operations of the same type are grouped and run as bulk statements:
+creates as batched INSERTs, claims as conditional UPDATEs and deletes as
+set-based DELETEs without per-task signals. Updates carry different values per task and still run one
+conditional UPDATE each (see `services.update_task`), so a stale `version`
+only fails its own operation. The groups run in `TaskBatchOperation`
+order, whatever the order of the operations in the request.
+
+Each group commits on its own and every operation reports its own outcome,
+unless the batch is atomic: then nothing is applied if any operation fails.
+"""
+from collections import defaultdict
+from contextlib import nullcontext
+from http import HTTPStatus
+
+from django.db import transaction
+
+from accounts import permissions
+from tasks import services
+from tasks.enums import TaskBatchOperation, TaskStatus
+
+NOT_FOUND = HTTPStatus.NOT_FOUND, "Task not found."
+
+# As required by the single-operation endpoints
+PERMISSIONS = {
+    TaskBatchOperation.CREATE: "tasks.add_tasks",
+    TaskBatchOperation.CLAIM: "tasks.change_task",
+}
+
+
+class BatchAborted(Exception):
+    pass
+
+
+def result(index, operation, status: HTTPStatus, error=None, task_id=None) -> dict:
+    return {
+        "index": index,
+        "op": operation["op"],
+        "id": task_id if task_id is not None else operation.get("id"),
+        "status": status.value,
+        "error": error,
+    }
+
+
+def check(user, operation, allow_create) -> tuple[HTTPStatus, str] | None:
+    """Why the operation can't run, if it can't."""
+    op = TaskBatchOperation(operation["op"])
+    if op in PERMISSIONS and not permissions.has_perm(user, PERMISSIONS[op]):
+        return HTTPStatus.FORBIDDEN, "You don't have the required permission!"
+    if op != TaskBatchOperation.CREATE and operation.get("id") is None:
+        return HTTPStatus.BAD_REQUEST, "id is required"
+    if op in (TaskBatchOperation.CREATE, TaskBatchOperation.UPDATE):
+        if not operation.get("data"):
+            return HTTPStatus.BAD_REQUEST, "data is required"
+        status = operation["data"].get("status")
+        if status is not None and status not in {item.value for item in TaskStatus}:
+            return HTTPStatus.UNPROCESSABLE_ENTITY, f"Invalid status {status}"
+    if op == TaskBatchOperation.CREATE and not allow_create():
+        return HTTPStatus.TOO_MANY_REQUESTS, "Task creation rate limit exceeded"
+    return None
+
+
+def run_creates(user, items, results):
+    tasks = services.bulk_create_tasks(user, [operation["data"] for _, operation in items])
+    for (index, operation), task in zip(items, tasks):
+        results[index] = result(index, operation, HTTPStatus.CREATED, task_id=task.id)
+
+
+def run_updates(user, items, results):
+    for index, operation in items:
+        try:
+            task = services.update_task(
+                operation["id"],
+                operation["data"],
+                expected_version=operation.get("version"),
+                actor_id=user.pk,
+            )
+        except services.TaskVersionConflictException:
+            results[index] = result(
+                index,
+                operation,
+                HTTPStatus.PRECONDITION_FAILED,
+                error="Task was modified by someone else",
+            )
+            continue
+        if task is None:
+            results[index] = result(index, operation, *NOT_FOUND)
+        else:
+            results[index] = result(index, operation, HTTPStatus.OK)
+
+
+def run_claims(user, items, results):
+    claimed = services.bulk_claim_tasks(user.pk, [operation["id"] for _, operation in items])
+    for index, operation in items:
+        if operation["id"] not in claimed:
+            results[index] = result(index, operation, *NOT_FOUND)
+        elif claimed[operation["id"]]:
+            results[index] = result(index, operation, HTTPStatus.OK)
+            # A task listed twice is only claimed once
+            claimed[operation["id"]] = False
+        else:
+            # Same answer as PATCH /tasks/{id}/claim
+            results[index] = result(
+                index, operation, HTTPStatus.BAD_REQUEST, error="Task already claimed"
+            )
+
+
+def run_deletes(user, items, results):
+    deleted = services.bulk_delete_tasks([operation["id"] for _, operation in items])
+    for index, operation in items:
+        if operation["id"] in deleted:
+            results[index] = result(index, operation, HTTPStatus.OK)
+            deleted.discard(operation["id"])
+        else:
+            results[index] = result(index, operation, *NOT_FOUND)
+
+
+def has_failures(results) -> bool:
+    return any(item["status"] >= 400 for item in results if item)
+
+
+RUNNERS = {
+    TaskBatchOperation.CREATE: run_creates,
+    TaskBatchOperation.UPDATE: run_updates,
+    TaskBatchOperation.CLAIM: run_claims,
+    TaskBatchOperation.DELETE: run_deletes,
+}
+
+
+def run_batch(
+    user, operations: list[dict], atomic: bool = False, allow_create=lambda: True
+) -> list[dict]:
+    """
+    Runs `operations` (dicts with `op`, `id`, `version` and `data` keys) on
+    behalf of `user` and returns one result per operation, in order.
+    `allow_create` is asked once per valid create, e.g. to rate limit them.
+    """
+    results: list[dict | None] = [None] * len(operations)
+    groups = defaultdict(list)
+    for index, operation in enumerate(operations):
+        problem = check(user, operation, allow_create)
+        if problem:
+            results[index] = result(index, operation, *problem)
+        else:
+            groups[TaskBatchOperation(operation["op"])].append((index, operation))
+
+    try:
+        with transaction.atomic() if atomic else nullcontext():
+            if atomic and has_failures(results):
+                raise BatchAborted
+            for op, run in RUNNERS.items():
+                if groups[op]:
+                    with transaction.atomic():
+                        run(user, groups[op], results)
+            if atomic and has_failures(results):
+                raise BatchAborted
+    except BatchAborted:
+        for index, item in enumerate(results):
+            if item is None or item["status"] < 400:
+                results[index] = result(
+                    index,
+                    operations[index],
+                    HTTPStatus.FAILED_DEPENDENCY,
+                    error="Not applied: another operation in the batch failed",
+                )
+    return results
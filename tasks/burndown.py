@@ -0,0 +1,143 @@
+"""
+Sprint burndown and velocity.
+
+Any number of sprints are computed in one pass over a handful of queries
+(sprint membership, the members' current state and their status
+transitions, each also covering tasks moved to cold storage since),
+whatever their length: each task contributes a +1/-1 step on the days its
+status opens or closes, and the daily remaining-work series is the
+running sum of those steps. Finished sprints no longer change and are
+cached without expiry; edits to a sprint or its membership drop its entry.
+"""
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from tasks.enums import TaskStatus
+from tasks.models import ArchivedSprintTask, ArchivedTask, Sprint, Task, TaskTransition
+
+OPEN_STATUSES = {TaskStatus.UNASSIGNED.value, TaskStatus.IN_PROGRESS.value}
+STATUS_NAMES = {code: status for status, code in TaskTransition.STATUS_CODES.items()}
+
+
+def cache_key(sprint_id: int) -> str:
+    return f"sprint-burndown:{sprint_id}"
+
+
+def invalidate(sprint_ids) -> None:
+    cache.delete_many([cache_key(sprint_id) for sprint_id in sprint_ids])
+
+
+def status_history(task_ids) -> dict[int, list[tuple[datetime, str | None]]]:
+    """
+    (time, status) changes per task, the first one at the task's creation.
+    Tasks older than the transition log start out in the source status of
+    their first logged change, or their current status when none is logged.
+    """
+    task_ids = set(task_ids)
+    tasks = list(Task.objects.filter(id__in=task_ids).values_list("id", "status", "created_at"))
+    # Archived tasks no longer in the hot table
+    archived = task_ids - {task_id for task_id, _, _ in tasks}
+    if archived:
+        tasks += ArchivedTask.objects.filter(id__in=archived).values_list(
+            "id", "status", "created_at"
+        )
+    history = {task_id: [(created_at, status)] for task_id, status, created_at in tasks}
+    transitions = (
+        TaskTransition.objects.filter(task_id__in=history.keys())
+        .order_by("task_id", "at", "id")
+        .values_list("task_id", "from_status", "to_status", "at")
+    )
+    logged = set()
+    for task_id, from_status, to_status, at in transitions:
+        changes = history[task_id]
+        if task_id not in logged:
+            logged.add(task_id)
+            created_at = changes[0][0]
+            if from_status is None:
+                changes[0] = (created_at, STATUS_NAMES[to_status])
+                continue
+            changes[0] = (created_at, STATUS_NAMES[from_status])
+        changes.append((at, STATUS_NAMES[to_status]))
+    return history
+
+
+def sprint_members(sprint_ids) -> dict[int, list[int]]:
+    """Task ids of each sprint, including tasks moved to cold storage."""
+    members = defaultdict(list)
+    for through in (Sprint.tasks.through, ArchivedSprintTask):
+        for sprint_id, task_id in through.objects.filter(
+            sprint_id__in=sprint_ids
+        ).values_list("sprint_id", "task_id"):
+            members[sprint_id].append(task_id)
+    return members
+
+
+def compute(sprints: list[Sprint], today: date | None = None) -> dict[int, dict]:
+    """Burndown series, scope and velocity of each sprint, keyed by sprint id."""
+    today = today or timezone.localdate()
+    members = sprint_members([sprint.id for sprint in sprints])
+    history = status_history({task_id for ids in members.values() for task_id in ids})
+
+    results = {}
+    for sprint in sprints:
+        days = max(0, (min(sprint.end_date, today) - sprint.start_date).days + 1)
+        steps = [0] * days
+        initial = scope = velocity = 0
+        for task_id in members[sprint.id]:
+            open_before = done_in_sprint = False
+            for at, status in history.get(task_id, ()):
+                index = (timezone.localdate(at) - sprint.start_date).days
+                if index >= days:
+                    break
+                is_open = status in OPEN_STATUSES
+                if index < 0:
+                    initial += is_open - open_before
+                else:
+                    steps[index] += is_open - open_before
+                # Archiving a completed task keeps it completed
+                if status != TaskStatus.ARCHIVED.value:
+                    done_in_sprint = status == TaskStatus.DONE.value and index >= 0
+                open_before = is_open
+            velocity += done_in_sprint
+            scope += task_id in history
+        remaining = list(accumulate(steps, initial=initial))[1:]
+        results[sprint.id] = {
+            "sprint_id": sprint.id,
+            "name": sprint.name,
+            "start_date": sprint.start_date,
+            "end_date": sprint.end_date,
+            "finished": sprint.end_date < today,
+            "scope": scope,
+            "velocity": velocity,
+            "burndown": [
+                {"day": sprint.start_date + timedelta(days=index), "remaining": count}
+                for index, count in enumerate(remaining)
+            ],
+        }
+    return results
+
+
+def sprint_burndowns(sprints) -> list[dict]:
+    """
+    Burndown of each of `sprints`, in order: finished sprints from the
+    cache where possible, the rest computed together.
+    """
+    sprints = list(sprints)
+    cached = cache.get_many([cache_key(sprint.id) for sprint in sprints])
+    missing = [sprint for sprint in sprints if cache_key(sprint.id) not in cached]
+    if missing:
+        computed = compute(missing)
+        cache.set_many(
+            {
+                cache_key(sprint_id): result
+                for sprint_id, result in computed.items()
+                if result["finished"]
+            },
+            timeout=None,
+        )
+        cached.update({cache_key(sprint_id): result for sprint_id, result in computed.items()})
+    return [cached[cache_key(sprint.id)] for sprint in sprints]
@@ -0,0 +1,126 @@
+"""
+Streaming attachment downloads with HTTP range and conditional requests.
+
+Whole files are returned as a `FileResponse`, which lets the WSGI server
+use `wsgi.file_wrapper`/sendfile where available. Byte ranges are streamed
+in chunks. With `TASK_ATTACHMENT_SENDFILE` set to `X-Accel-Redirect`
+(nginx) or `X-Sendfile` (Apache, lighttpd) the transfer is handed off to
+the web server altogether and Python only checks permissions.
+"""
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, quote_etag
+
+# Maps the public attachment name to the Task field
+ATTACHMENT_FIELDS = {"file": "file_upload", "image": "image_upload"}
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+CHUNK_SIZE = 64 * 1024
+
+
+def get_attachment(task, name: str):
+    field = ATTACHMENT_FIELDS.get(name)
+    attachment = getattr(task, field) if field else None
+    if not attachment:
+        raise Http404("Attachment not found.")
+    return attachment
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Returns the inclusive (start, end) of a single byte range, or None when
+    the header is absent or not something we serve partially. Raises
+    ValueError for a range outside of the file.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if not match or match.groups() == ("", ""):
+        return None
+    start, end = match.groups()
+    if start:
+        start, end = int(start), min(int(end) if end else size - 1, size - 1)
+    else:
+        # Suffix range: the last N bytes
+        start, end = max(size - int(end), 0), size - 1
+    if start > end or start >= size:
+        raise ValueError("Unsatisfiable range.")
+    return start, end
+
+
+def _stream_range(file, start: int, length: int):
+    with file:
+        file.seek(start)
+        while length > 0:
+            data = file.read(min(CHUNK_SIZE, length))
+            if not data:
+                break
+            length -= len(data)
+            yield data
+
+
+def attachment_response(request, attachment) -> HttpResponse:
+    storage, name = attachment.storage, attachment.name
+    try:
+        size = storage.size(name)
+    except FileNotFoundError:
+        raise Http404("Attachment not found.")
+    try:
+        last_modified = int(storage.get_modified_time(name).timestamp())
+    except NotImplementedError:
+        last_modified = None
+    etag = quote_etag(f"{size:x}-{last_modified or 0:x}")
+
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if response is not None:
+        return response
+
+    content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    # Blob names are content hashes; prefer the name the file was uploaded with
+    filename = getattr(
+        attachment.instance, f"{attachment.field.name}_name", ""
+    ) or os.path.basename(name)
+    sendfile = getattr(settings, "TASK_ATTACHMENT_SENDFILE", None)
+
+    if sendfile == "X-Accel-Redirect":
+        response = HttpResponse(content_type=content_type)
+        prefix = getattr(settings, "TASK_ATTACHMENT_SENDFILE_PREFIX", "/protected/")
+        response[sendfile] = prefix.rstrip("/") + "/" + name
+    elif sendfile == "X-Sendfile":
+        response = HttpResponse(content_type=content_type)
+        response[sendfile] = storage.path(name)
+    else:
+        range_header = request.META.get("HTTP_RANGE", "")
+        if_range = request.META.get("HTTP_IF_RANGE")
+        if if_range and if_range != etag:
+            # The client's copy is stale, so it gets the whole file
+            range_header = ""
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+        if byte_range is None:
+            response = FileResponse(storage.open(name, "rb"), content_type=content_type)
+        else:
+            start, end = byte_range
+            response = StreamingHttpResponse(
+                _stream_range(storage.open(name, "rb"), start, end - start + 1),
+                status=206,
+                content_type=content_type,
+            )
+            response["Content-Length"] = str(end - start + 1)
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    response["Content-Disposition"] = content_disposition_header(False, filename)
+    return response
@@ -6,3 +6,45 @@ class TaskStatus(str, Enum):
     IN_PROGRESS = "IN_PROGRESS"
     DONE = "DONE"
     ARCHIVED = "ARCHIVED"
+
+
+class TaskChangeAction(str, Enum):
+    CREATED = "CREATED"
+    UPDATED = "UPDATED"
+    DELETED = "DELETED"
+
+
+class TaskEventType(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    CLAIMED = "claimed"
+    DELETED = "deleted"
+    # One event for a bulk status change of many tasks
+    TRANSITIONED = "transitioned"
+
+
+class TaskTransitionResult(str, Enum):
+    TRANSITIONED = "transitioned"
+    NOT_ALLOWED = "not_allowed"
+    NOT_FOUND = "not_found"
+
+
+class TaskBatchOperation(str, Enum):
+    # Listed in the order a batch applies them
+    CREATE = "create"
+    UPDATE = "update"
+    CLAIM = "claim"
+    DELETE = "delete"
+
+
+class ReportPeriod(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+
+
+class TaskExpansion(str, Enum):
+    """Related objects the task API can embed on request (`?expand=`)."""
+    OWNER = "owner"
+    CREATOR = "creator"
+    EPICS = "epics"
+    SPRINTS = "sprints"
@@ -0,0 +1,325 @@
+"""
+Publish/subscribe of task events for live boards.
+
+Events are fanned out to subscribers of the current process by an
+`EventHub`. A broadcaster decides how events reach the hubs: the default
+`LocalBroadcaster` delivers in-process only, while `SQLiteBroadcaster`
+shares events between processes through a small SQLite file. The
+broadcaster is chosen with the `TASK_EVENTS_BROADCASTER` setting.
+"""
+import asyncio
+import contextlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+from tasks.enums import TaskEventType
+from tasks.models import Epic, Sprint
+
+logger = logging.getLogger(__name__)
+
+# Aggregated events list at most this many task ids; `task_count` has the total
+MAX_EVENT_TASK_IDS = 500
+# Ids per membership lookup, below every backend's bound parameter limit
+LOOKUP_CHUNK_SIZE = 5000
+
+
+@dataclass
+class TaskEvent:
+    type: TaskEventType
+    task_id: int | None
+    status: str | None = None
+    owner_id: int | None = None
+    sprint_ids: list[int] = field(default_factory=list)
+    epic_ids: list[int] = field(default_factory=list)
+    # Aggregated events cover many tasks at once instead of `task_id`
+    task_ids: list[int] = field(default_factory=list)
+    owner_ids: list[int] = field(default_factory=list)
+    task_count: int = 0
+
+    def matches(self, sprint=None, epic=None, owner=None) -> bool:
+        if sprint is not None and sprint not in self.sprint_ids:
+            return False
+        if epic is not None and epic not in self.epic_ids:
+            return False
+        if owner is not None and owner != self.owner_id and owner not in self.owner_ids:
+            return False
+        return True
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, payload: str) -> "TaskEvent":
+        data = json.loads(payload)
+        data["type"] = TaskEventType(data["type"])
+        return cls(**data)
+
+    def to_sse(self) -> str:
+        return f"event: {self.type.value}\ndata: {self.to_json()}\n\n"
+
+
+class Subscription:
+    """A bounded queue of events matching the subscriber's filters."""
+
+    def __init__(self, hub, loop, filters, maxsize=100):
+        self.hub = hub
+        self.loop = loop
+        self.filters = filters
+        self.queue = asyncio.Queue(maxsize=maxsize)
+
+    def push(self, event: TaskEvent) -> None:
+        # Called from whichever thread published the event, often from a
+        # commit hook: a subscriber whose loop is gone must not fail the write
+        if self.loop.is_closed():
+            self.close()
+            return
+        if event.matches(**self.filters):
+            try:
+                self.loop.call_soon_threadsafe(self._put, event)
+            except RuntimeError:
+                # The loop closed after the check above
+                self.close()
+
+    def _put(self, event: TaskEvent) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A slow client must not hold up everyone else; it misses the event
+            logger.warning("Dropping task event for a slow subscriber.")
+
+    async def get(self, timeout: float | None = None) -> TaskEvent | None:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+
+class EventHub:
+    """Keeps the subscriptions of this process."""
+
+    def __init__(self):
+        self._subscriptions: set[Subscription] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, **filters) -> Subscription:
+        subscription = Subscription(self, asyncio.get_running_loop(), filters)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def dispatch(self, event: TaskEvent) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            try:
+                subscription.push(event)
+            except Exception:
+                logger.exception("Dropping a failing task event subscriber.")
+                self.unsubscribe(subscription)
+
+
+class LocalBroadcaster:
+    """Delivers events to subscribers of the current process only."""
+
+    def __init__(self, hub: EventHub, **options):
+        self.hub = hub
+
+    def start(self) -> None:
+        pass
+
+    def publish(self, event: TaskEvent) -> None:
+        self.hub.dispatch(event)
+
+
+class SQLiteBroadcaster:
+    """
+    Cross-process stand-in for a message broker: events are appended to a
+    shared SQLite file and a background thread in every process polls it
+    for rows it has not seen yet.
+    """
+
+    def __init__(self, hub: EventHub, path=None, poll_interval=0.5, retention=60):
+        self.hub = hub
+        self.path = str(path or settings.BASE_DIR / "events.sqlite3")
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self._thread = None
+        self._lock = threading.Lock()
+        # The connection's context manager only ends the transaction
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS task_events ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "payload TEXT NOT NULL, "
+                "created REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5)
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+    def start(self) -> None:
+        # The poller is only needed once somebody in this process listens
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._poll, name="task-events-poller", daemon=True
+                )
+                self._thread.start()
+
+    def publish(self, event: TaskEvent) -> None:
+        now = time.time()
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT INTO task_events (payload, created) VALUES (?, ?)",
+                (event.to_json(), now),
+            )
+            connection.execute(
+                "DELETE FROM task_events WHERE created < ?", (now - self.retention,)
+            )
+
+    def _poll(self) -> None:
+        connection = self._connect()
+        (last_id,) = connection.execute(
+            "SELECT COALESCE(MAX(id), 0) FROM task_events"
+        ).fetchone()
+        while True:
+            try:
+                rows = connection.execute(
+                    "SELECT id, payload FROM task_events WHERE id > ? ORDER BY id",
+                    (last_id,),
+                ).fetchall()
+                for last_id, payload in rows:
+                    self.hub.dispatch(TaskEvent.from_json(payload))
+            except Exception:
+                # E.g. "database is locked"; the next round picks up from last_id
+                logger.exception("Polling task events failed.")
+            time.sleep(self.poll_interval)
+
+
+hub = EventHub()
+_broadcaster = None
+
+
+def get_broadcaster():
+    global _broadcaster
+    if _broadcaster is None:
+        broadcaster_class = import_string(
+            getattr(
+                settings, "TASK_EVENTS_BROADCASTER", "tasks.events.LocalBroadcaster"
+            )
+        )
+        _broadcaster = broadcaster_class(
+            hub, **getattr(settings, "TASK_EVENTS_OPTIONS", {})
+        )
+    return _broadcaster
+
+
+def subscribe(**filters) -> Subscription:
+    get_broadcaster().start()
+    return hub.subscribe(**filters)
+
+
+def publish(event: TaskEvent) -> None:
+    get_broadcaster().publish(event)
+
+
+def publish_task_event(
+    event_type: TaskEventType, task, sprint_ids=None, epic_ids=None
+) -> None:
+    """
+    Broadcasts an event about the task once the surrounding transaction
+    commits, so listeners never see rolled back changes. Sprint and epic
+    membership is looked up at that point unless given explicitly.
+    """
+
+    def send():
+        publish(
+            TaskEvent(
+                type=event_type,
+                task_id=task_id,
+                status=task.status,
+                owner_id=task.owner_id,
+                sprint_ids=(
+                    sprint_ids
+                    if sprint_ids is not None
+                    else list(task.sprints.values_list("id", flat=True))
+                ),
+                epic_ids=(
+                    epic_ids
+                    if epic_ids is not None
+                    else list(task.epics.values_list("id", flat=True))
+                ),
+            )
+        )
+
+    # Deleted instances lose their pk before the transaction commits
+    task_id = task.pk
+    transaction.on_commit(send)
+
+
+def publish_bulk_task_event(
+    event_type: TaskEventType,
+    task_ids: list[int],
+    status: str | None,
+    owner_ids=(),
+    sprint_ids=None,
+    epic_ids=None,
+) -> None:
+    """
+    Broadcasts a single event for a set-based change of many tasks once
+    the surrounding transaction commits. Only the first
+    `MAX_EVENT_TASK_IDS` ids are listed, so frames stay small; boards
+    refetch when `task_count` says there are more. Sprint and epic
+    membership is looked up at that point unless given explicitly.
+    """
+
+    def memberships(through, column) -> list[int]:
+        ids = set()
+        for start in range(0, len(task_ids), LOOKUP_CHUNK_SIZE):
+            ids.update(
+                through.objects.filter(
+                    task_id__in=task_ids[start : start + LOOKUP_CHUNK_SIZE]
+                ).values_list(column, flat=True)
+            )
+        return sorted(ids)
+
+    def send():
+        publish(
+            TaskEvent(
+                type=event_type,
+                task_id=None,
+                status=status,
+                task_ids=task_ids[:MAX_EVENT_TASK_IDS],
+                task_count=len(task_ids),
+                owner_ids=list(owner_ids),
+                sprint_ids=(
+                    sprint_ids
+                    if sprint_ids is not None
+                    else memberships(Sprint.tasks.through, "sprint_id")
+                ),
+                epic_ids=(
+                    epic_ids
+                    if epic_ids is not None
+                    else memberships(Epic.tasks.through, "epic_id")
+                ),
+            )
+        )
+
+    transaction.on_commit(send)
@@ -6,6 +6,15 @@ from django.core.exceptions import ValidationError
 from django.db import IntegrityError,transaction
 from .models import FormSubmission, SubscribedEmail, Task
 from tasks.fields import EmailsListField
+from taskmanager.sqlite import retry_on_lock
+
+
+@retry_on_lock
+def record_submission(uuid_value):
+    # Record the form submission by UUID
+    with transaction.atomic():
+        FormSubmission.objects.create(uuid=uuid_value)
+
 
 class TaskForm(forms.ModelForm):
     """Form for create Task"""
@@ -29,13 +38,11 @@ class TaskForm(forms.ModelForm):
         # if not was_set:
         #     # If 'was_set' is False, the UUID already exists in the cache.
         #     raise ValidationError("This form has already been submitted.")
-        with transaction.atomic():
-            # Try to record the form submission by UUID
-            try:
-                FormSubmission.objects.create(uuid=uuid_value)
-            except IntegrityError:
-                # The UUID already exists, so the form was already submitted
-                raise ValidationError("This form has already been submitted.")
+        try:
+            record_submission(uuid_value)
+        except IntegrityError:
+            # The UUID already exists, so the form was already submitted
+            raise ValidationError("This form has already been submitted.")
         return uuid_value
 
     def save(self, commit=True):
@@ -0,0 +1,33 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tasks import services
+
+
+class Command(BaseCommand):
+    help = "Move old ARCHIVED tasks from the hot Task table into cold storage."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=getattr(settings, "TASK_ARCHIVE_AFTER_DAYS", 90),
+            help="Only move tasks archived at least this many days ago.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop after this many batches; run again to continue.",
+        )
+
+    def handle(self, *args, **options):
+        moved = services.archive_tasks(
+            timedelta(days=options["days"]),
+            batch_size=options["batch_size"],
+            max_batches=options["max_batches"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Moved {moved} tasks to cold storage."))
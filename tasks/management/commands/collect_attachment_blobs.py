@@ -0,0 +1,33 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from tasks.storage import collect_blobs
+
+
+class Command(BaseCommand):
+    help = "Delete attachment blobs no longer referenced by any task."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours",
+            type=int,
+            default=24,
+            help="Keep unreferenced blobs younger than this.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be deleted.",
+        )
+
+    def handle(self, *args, **options):
+        stats = collect_blobs(
+            timedelta(hours=options["grace_hours"]), dry_run=options["dry_run"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                "{referenced} blobs referenced, {updated} reference counts "
+                "updated, {deleted} blobs deleted.".format(**stats)
+            )
+        )
@@ -0,0 +1,68 @@
+import os
+import re
+import subprocess
+import sys
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# "import time:       self [us] |  cumulative | imported package"
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_import_times(output: str) -> list[tuple[str, int, int, int]]:
+    """(module, self us, cumulative us, nesting depth) per `-X importtime` line."""
+    rows = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Report what importing the project costs: Django setup followed by the "
+        "given modules, measured in a fresh interpreter with -X importtime."
+    )
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "modules",
+            nargs="*",
+            default=["taskmanager.wsgi", "taskmanager.urls"],
+            help="Modules imported after django.setup().",
+        )
+        parser.add_argument("--limit", type=int, default=25)
+
+    def handle(self, *args, **options):
+        imports = "".join(f"import {module}; " for module in options["modules"])
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import django; django.setup(); {imports}"],
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE},
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode:
+            raise CommandError(result.stderr.strip().splitlines()[-1])
+        rows = parse_import_times(result.stderr)
+        total = sum(row[1] for row in rows)
+
+        self.stdout.write(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for module, self_us, cumulative_us, _ in sorted(
+            rows, key=lambda row: row[2], reverse=True
+        )[: options["limit"]]:
+            self.stdout.write(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {module}")
+
+        packages = Counter()
+        for module, self_us, _, _ in rows:
+            packages[module.split(".")[0]] += self_us
+        self.stdout.write(f"\n{'total ms':>14} {'share':>9}  package")
+        for package, self_us in packages.most_common(options["limit"]):
+            self.stdout.write(
+                f"{self_us / 1000:14.1f} {self_us / total:9.1%}  {package}"
+            )
+        self.stdout.write(f"\n{len(rows)} modules imported in {total / 1000:.1f} ms.")
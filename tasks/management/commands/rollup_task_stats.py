@@ -0,0 +1,27 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from tasks import reports
+
+
+class Command(BaseCommand):
+    help = "Update the daily task statistics rollup behind the reports API."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--start",
+            type=date.fromisoformat,
+            default=None,
+            help="First day to recompute (default: a few days before the last rolled-up day).",
+        )
+        parser.add_argument(
+            "--end",
+            type=date.fromisoformat,
+            default=None,
+            help="Last day to recompute (default: yesterday).",
+        )
+
+    def handle(self, *args, **options):
+        rows = reports.rollup_daily_stats(options["start"], options["end"])
+        self.stdout.write(self.style.SUCCESS(f"Wrote {rows} daily statistics rows."))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from taskmanager.templating import warm_templates
+
+
+class Command(BaseCommand):
+    help = "Compile every project template and report templates that fail."
+
+    def handle(self, *args, **options):
+        result = warm_templates()
+        for name, error in result["failed"].items():
+            self.stderr.write(f"{name}: {error}")
+        self.stdout.write(
+            f"Compiled {len(result['compiled'])} templates "
+            f"in {result['seconds'] * 1000:.1f} ms."
+        )
+        if result["failed"]:
+            raise CommandError(f"{len(result['failed'])} templates failed to compile.")
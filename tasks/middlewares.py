@@ -1,5 +1,12 @@
 import time
 import logging
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+from taskmanager import routers
 
 
 logger = logging.getLogger(__name__)
@@ -22,3 +29,90 @@ class RequestTimeMiddleware:
         # logger.info("Request to %s took %s seconds.", request.path, duration)
         # logger.info(("Request to {} took {} seconds.").format(request.path, duration))
         return response
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Keeps a request's reads on the primary database once it has written,
+    and for `REPLICA_STICKY_SECONDS` afterwards via a cookie, so clients
+    read their own writes despite replication lag. API clients don't get
+    the cookie; only the rest of the writing request stays on the primary.
+    """
+    cookie_name = "primary_until"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    @staticmethod
+    def is_api_request(request) -> bool:
+        return (
+            request.path_info.startswith(settings.API_PREFIX)
+            or "HTTP_AUTHORIZATION" in request.META
+        )
+
+    def __call__(self, request):
+        try:
+            sticky = float(request.COOKIES.get(self.cookie_name, 0)) > time.time()
+        except ValueError:
+            sticky = False
+        tokens = routers.start_request(sticky)
+        try:
+            response = self.get_response(request)
+            if routers.wrote_primary() and not self.is_api_request(request):
+                response.set_cookie(
+                    self.cookie_name,
+                    str(time.time() + settings.REPLICA_STICKY_SECONDS),
+                    max_age=settings.REPLICA_STICKY_SECONDS,
+                    httponly=True,
+                    samesite="Lax",
+                )
+        finally:
+            routers.end_request(tokens)
+        return response
+
+
+def is_token_api_request(request) -> bool:
+    """
+    API requests authenticated with a bearer token need no session,
+    messages or CSRF protection: nothing about them lives in cookies.
+    """
+    fast_path = getattr(request, "_api_fast_path", None)
+    if fast_path is None:
+        fast_path = request._api_fast_path = request.path_info.startswith(
+            settings.API_PREFIX
+        ) and request.META.get("HTTP_AUTHORIZATION", "").startswith("Bearer ")
+    return fast_path
+
+
+class BrowserOnlyMixin:
+    """Skips a browser-only middleware for bearer-token API requests."""
+
+    def __call__(self, request):
+        if is_token_api_request(request):
+            self.skip(request)
+            return self.get_response(request)
+        return super().__call__(request)
+
+    def skip(self, request):
+        pass
+
+
+class BrowserSessionMiddleware(BrowserOnlyMixin, SessionMiddleware):
+    pass
+
+
+class BrowserCsrfViewMiddleware(BrowserOnlyMixin, CsrfViewMiddleware):
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if is_token_api_request(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class BrowserAuthenticationMiddleware(BrowserOnlyMixin, AuthenticationMiddleware):
+    def skip(self, request):
+        # Replaced by the API's token authentication
+        request.user = AnonymousUser()
+
+
+class BrowserMessageMiddleware(BrowserOnlyMixin, MessageMiddleware):
+    pass
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0012_uploadsession'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='image_sha256',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
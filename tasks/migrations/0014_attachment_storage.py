@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:30
+
+import tasks.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0013_task_image_sha256'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttachmentBlob',
+            fields=[
+                ('sha256', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('size', models.PositiveBigIntegerField()),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='file_upload',
+            field=models.FileField(blank=True, null=True, storage=tasks.storage.attachment_storage, upload_to='tasks/files/'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='image_upload',
+            field=models.ImageField(blank=True, null=True, storage=tasks.storage.attachment_storage, upload_to='tasks/images/'),
+        ),
+    ]
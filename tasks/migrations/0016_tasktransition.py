@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 19:51
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0015_task_completed_at_daily_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_id', models.BigIntegerField()),
+                ('from_status', models.PositiveSmallIntegerField(choices=[(1, 'UNASSIGNED'), (2, 'IN_PROGRESS'), (3, 'DONE'), (4, 'ARCHIVED')], null=True)),
+                ('to_status', models.PositiveSmallIntegerField(choices=[(1, 'UNASSIGNED'), (2, 'IN_PROGRESS'), (3, 'DONE'), (4, 'ARCHIVED')])),
+                ('actor_id', models.BigIntegerField(null=True)),
+                ('at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['task_id', 'at'], name='task_transition_task_at_idx'), models.Index(fields=['at'], name='task_transition_at_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:09
+
+import django.utils.timezone
+import tasks.storage
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_last_seen_at(apps, schema_editor):
+    AttachmentBlob = apps.get_model("tasks", "AttachmentBlob")
+    AttachmentBlob.objects.update(last_seen_at=F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0016_tasktransition'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedtask',
+            name='file_upload_name',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='archivedtask',
+            name='image_upload_name',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='attachmentblob',
+            name='last_seen_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(backfill_last_seen_at, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='task',
+            name='file_upload_name',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='image_upload_name',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='file_upload',
+            field=tasks.storage.AttachmentFileField(blank=True, null=True, storage=tasks.storage.attachment_storage, upload_to='tasks/files/'),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='image_upload',
+            field=tasks.storage.AttachmentImageField(blank=True, null=True, storage=tasks.storage.attachment_storage, upload_to='tasks/images/'),
+        ),
+    ]
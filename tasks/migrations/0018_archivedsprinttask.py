@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-19 20:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_memberships(apps, schema_editor):
+    ArchivedTask = apps.get_model("tasks", "ArchivedTask")
+    ArchivedSprintTask = apps.get_model("tasks", "ArchivedSprintTask")
+    Sprint = apps.get_model("tasks", "Sprint")
+    sprint_ids = set(Sprint.objects.values_list("id", flat=True))
+    memberships = [
+        ArchivedSprintTask(sprint_id=sprint_id, task_id=task_id)
+        for task_id, task_sprint_ids in ArchivedTask.objects.exclude(
+            sprint_ids=[]
+        ).values_list("id", "sprint_ids").iterator()
+        for sprint_id in set(task_sprint_ids) & sprint_ids
+    ]
+    ArchivedSprintTask.objects.bulk_create(memberships, batch_size=5000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0017_attachment_names_blob_last_seen'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedSprintTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sprint', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_memberships', to='tasks.sprint')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sprint_memberships', to='tasks.archivedtask')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('sprint', 'task'), name='archived_sprint_task_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_memberships, migrations.RunPython.noop),
+    ]
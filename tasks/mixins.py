@@ -3,18 +3,32 @@ from django.http import HttpResponseBadRequest
 
 from .services import can_add_task_to_sprint
 
+
+class ObjectCacheMixin:
+    """
+    Resolves a single-object view's object once per request: `get_object`,
+    permission checks and other mixins all share the first fetch.
+    """
+    def get_object(self, queryset=None):
+        if queryset is not None:
+            return super().get_object(queryset)
+        if "_resolved_object" not in self.__dict__:
+            self._resolved_object = super().get_object()
+        return self._resolved_object
+
+
 class SprintTaskMixin:
     """
     Mixin to ensure a task  being created or updated is within
     the date range of its associated sprint.
     """
     def dispatch(self, request, *args, **kwargs):
-        task = self.get_object() if hasattr(self, "get_object") else None
         sprint_id = request.POST.get('sprint')
 
         if sprint_id:
-            # If a task exists (for UpdateView) 
-            # or is about to be created (for CreateView)
+            # The task being updated (for UpdateView)
+            # or None if it is about to be created (for CreateView)
+            task = self.get_object() if self.kwargs.get("pk") is not None else None
             if task or request.method == "POST":
                 if not can_add_task_to_sprint(task, sprint_id):
                     return HttpResponseBadRequest(
@@ -1,7 +1,12 @@
+import uuid
 from django.contrib.auth.models import User, AbstractUser, BaseUserManager
 from django.db import models
 from django.conf import settings
-from tasks.enums import TaskStatus
+from django.utils import timezone
+from tasks.enums import TaskChangeAction, TaskStatus
+from tasks.storage import AttachmentFileField, AttachmentImageField, attachment_storage
+from tasks.thumbnails import thumbnail_urls
+
 
 class Task(models.Model):
     STATUS_CHOICES = [
@@ -17,6 +22,10 @@ class Task(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # When the task last became DONE; cleared if it is reopened
+    completed_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    # Incremented on every write; used for optimistic concurrency control
+    version = models.PositiveIntegerField(default=1)
     creator = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         related_name="created_tasks",
@@ -29,8 +38,17 @@ class Task(models.Model):
         on_delete=models.SET_NULL,
         null=True,
     )
-    file_upload = models.FileField(upload_to="tasks/files/", null=True, blank=True)
-    image_upload = models.ImageField(upload_to="tasks/images/", null=True, blank=True)
+    file_upload = AttachmentFileField(
+        upload_to="tasks/files/", storage=attachment_storage, null=True, blank=True
+    )
+    image_upload = AttachmentImageField(
+        upload_to="tasks/images/", storage=attachment_storage, null=True, blank=True
+    )
+    # Names the attachments were uploaded with, for downloads
+    file_upload_name = models.CharField(max_length=255, blank=True, default="")
+    image_upload_name = models.CharField(max_length=255, blank=True, default="")
+    # SHA-256 of image_upload, set once its thumbnails are generated
+    image_sha256 = models.CharField(max_length=64, blank=True, default="")
 
     class Meta:
         constraints = [
@@ -45,6 +63,30 @@ class Task(models.Model):
         permissions = [
             ("custom_task", "Custom Task Permission"),
         ]
+        indexes = [
+            # Finds archived tasks due to move to cold storage
+            models.Index(fields=["status", "updated_at"], name="task_status_updated_idx"),
+            # Range scans of the live part of the reports (tasks.reports)
+            models.Index(fields=["created_at"], name="task_created_at_idx"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        task = super().from_db(db, field_names, values)
+        # Lets a later save() tell whether the status changed
+        task._loaded_status = task.__dict__.get("status")
+        return task
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields and "version" not in update_fields:
+            # Every write moves the version, or ETags and cached cards go stale
+            kwargs["update_fields"] = [*update_fields, "version"]
+        super().save(*args, **kwargs)
+
+    @property
+    def image_thumbnails(self) -> dict[str, str]:
+        return thumbnail_urls(self.image_upload, self.image_sha256)
 
 
 class Epic(models.Model):
@@ -94,3 +136,148 @@ class SubscribedEmail(models.Model):
 
 class FormSubmission(models.Model):
     uuid = models.UUIDField(unique=True)
+
+
+class TaskChange(models.Model):
+    """
+    Append-only log of task mutations used by the change feed.
+    The auto-increment id doubles as the monotonic sync token.
+    """
+    ACTION_CHOICES = [
+        (action.value, action.name.title()) for action in TaskChangeAction
+    ]
+
+    # Plain integer instead of a FK so the row survives the task's deletion
+    task_id = models.BigIntegerField()
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+
+class ArchivedTask(models.Model):
+    """
+    Cold storage for archived tasks moved out of the hot Task table.
+    Rows keep the original task id and a copy of its columns.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=200)
+    description = models.TextField(blank=True, default="")
+    status = models.CharField(max_length=20, choices=Task.STATUS_CHOICES)
+    created_at = models.DateTimeField(db_index=True)
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    creator = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="archived_created_tasks",
+        on_delete=models.CASCADE,
+    )
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="archived_owned_tasks",
+        on_delete=models.SET_NULL,
+        null=True,
+    )
+    file_upload = models.CharField(max_length=100, blank=True, default="")
+    image_upload = models.CharField(max_length=100, blank=True, default="")
+    file_upload_name = models.CharField(max_length=255, blank=True, default="")
+    image_upload_name = models.CharField(max_length=255, blank=True, default="")
+    # Sprint and epic membership at the time the task was archived
+    sprint_ids = models.JSONField(default=list)
+    epic_ids = models.JSONField(default=list)
+
+
+class ArchivedSprintTask(models.Model):
+    """
+    Sprint membership of an archived task, queryable by sprint: the
+    `ArchivedTask.sprint_ids` copy can't be filtered efficiently everywhere.
+    """
+    sprint = models.ForeignKey(
+        Sprint, on_delete=models.CASCADE, related_name="archived_memberships"
+    )
+    task = models.ForeignKey(
+        ArchivedTask, on_delete=models.CASCADE, related_name="sprint_memberships"
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["sprint", "task"], name="archived_sprint_task_unique"
+            ),
+        ]
+
+
+class UploadSession(models.Model):
+    """A resumable, chunked upload of an attachment for a task."""
+    FIELD_CHOICES = [
+        ("file_upload", "File"),
+        ("image_upload", "Image"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name="uploads")
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    field = models.CharField(max_length=20, choices=FIELD_CHOICES)
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    # Optional SHA-256 announced by the client, verified on completion
+    sha256 = models.CharField(max_length=64, blank=True, default="")
+    received = models.PositiveBigIntegerField(default=0)
+    # Storage names of the received chunks, in order
+    parts = models.JSONField(default=list)
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+
+class AttachmentBlob(models.Model):
+    """A deduplicated attachment stored by `tasks.storage.ContentAddressedStorage`."""
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    name = models.CharField(max_length=100, unique=True)
+    size = models.PositiveBigIntegerField()
+    # Tasks (live and archived) referencing the blob, as of the last collection
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Last time the content was saved, whether or not it was stored already
+    last_seen_at = models.DateTimeField(default=timezone.now)
+
+
+class TaskDailyStats(models.Model):
+    """
+    Daily rollup behind the reports (tasks.reports): tasks created by and
+    completed by each user on each day. `user_id` is 0 for tasks completed
+    without an owner.
+    """
+    day = models.DateField()
+    user_id = models.BigIntegerField()
+    created = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    # Sum of created-to-done durations of the completed tasks
+    cycle_seconds = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["day", "user_id"], name="task_daily_stats_unique"),
+        ]
+
+
+class TaskTransition(models.Model):
+    """
+    Append-only log of task status changes, kept compact for long
+    retention: statuses are small integer codes and task and actor are
+    plain integers, so rows survive deletions and need no joins.
+    """
+    STATUS_CODES = {status.value: code for code, status in enumerate(TaskStatus, start=1)}
+    STATUS_CHOICES = [(code, status) for status, code in STATUS_CODES.items()]
+
+    task_id = models.BigIntegerField()
+    # Null for the task's creation
+    from_status = models.PositiveSmallIntegerField(choices=STATUS_CHOICES, null=True)
+    to_status = models.PositiveSmallIntegerField(choices=STATUS_CHOICES)
+    # Null when the change wasn't made on behalf of a known user
+    actor_id = models.BigIntegerField(null=True)
+    at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            # Range scans over the tasks of a sprint or an epic
+            models.Index(fields=["task_id", "at"], name="task_transition_task_at_idx"),
+            models.Index(fields=["at"], name="task_transition_at_idx"),
+        ]
@@ -0,0 +1,202 @@
+"""
+Task throughput and cycle-time reports.
+
+Days up to the rollup watermark (the last day in `TaskDailyStats`) are
+read from the rollup, which `rollup_daily_stats` maintains incrementally
+(see the `rollup_task_stats` command). The few days after it are
+aggregated live from the Task table, using range filters on the indexed
+`created_at` and `completed_at` columns.
+"""
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Max, Min, Sum
+from django.db.models.functions import TruncDate, TruncWeek
+from django.utils import timezone
+
+from tasks.enums import ReportPeriod
+from tasks.models import Task, TaskDailyStats
+
+
+def day_range(start: date, end: date) -> tuple[datetime, datetime]:
+    """Aware bounds [start 00:00, end + 1 day 00:00) in the current timezone."""
+    tz = timezone.get_current_timezone()
+    return (
+        datetime.combine(start, time.min, tzinfo=tz),
+        datetime.combine(end + timedelta(days=1), time.min, tzinfo=tz),
+    )
+
+
+def aggregate_days(start: date, end: date) -> dict[tuple[date, int], dict[str, int]]:
+    """
+    Per (day, user id) counts for `start`..`end` computed from the Task
+    table: tasks created by the user and tasks completed while owned by them.
+    """
+    lower, upper = day_range(start, end)
+    stats: dict[tuple[date, int], dict[str, int]] = defaultdict(
+        lambda: {"created": 0, "completed": 0, "cycle_seconds": 0}
+    )
+    created = (
+        Task.objects.filter(created_at__gte=lower, created_at__lt=upper)
+        .annotate(day=TruncDate("created_at"))
+        .values("day", "creator_id")
+        .annotate(count=Count("id"))
+    )
+    for row in created:
+        stats[row["day"], row["creator_id"]]["created"] = row["count"]
+    completed = (
+        Task.objects.filter(completed_at__gte=lower, completed_at__lt=upper)
+        .annotate(day=TruncDate("completed_at"))
+        .values("day", "owner_id")
+        .annotate(
+            count=Count("id"),
+            cycle=Sum(
+                ExpressionWrapper(
+                    F("completed_at") - F("created_at"), output_field=DurationField()
+                )
+            ),
+        )
+    )
+    for row in completed:
+        entry = stats[row["day"], row["owner_id"] or 0]
+        entry["completed"] = row["count"]
+        entry["cycle_seconds"] = int(row["cycle"].total_seconds()) if row["cycle"] else 0
+    return stats
+
+
+def watermark() -> date | None:
+    """The last day covered by the rollup."""
+    return TaskDailyStats.objects.aggregate(day=Max("day"))["day"]
+
+
+def rollup_daily_stats(start: date | None = None, end: date | None = None) -> int:
+    """
+    Recomputes the rollup for `start`..`end`, by default from a few days
+    before the watermark (to pick up late changes) through yesterday.
+    Returns the number of rows written.
+    """
+    if end is None:
+        end = timezone.localdate() - timedelta(days=1)
+    if start is None:
+        last = watermark()
+        if last is not None:
+            start = last - timedelta(days=settings.TASK_REPORT_LOOKBACK_DAYS)
+        else:
+            first = Task.objects.aggregate(created_at=Min("created_at"))["created_at"]
+            if first is None:
+                return 0
+            start = timezone.localdate(first)
+    if start > end:
+        return 0
+
+    stats = aggregate_days(start, end)
+    with transaction.atomic():
+        TaskDailyStats.objects.filter(day__gte=start, day__lte=end).delete()
+        TaskDailyStats.objects.bulk_create(
+            [
+                TaskDailyStats(day=day, user_id=user_id, **values)
+                for (day, user_id), values in stats.items()
+            ],
+            batch_size=1000,
+        )
+    return len(stats)
+
+
+def _split(start: date, end: date) -> tuple[date | None, date]:
+    """The last day to read from the rollup (None for none) and the first live day."""
+    last = watermark()
+    if last is None or last < start:
+        return None, start
+    return min(last, end), min(last, end) + timedelta(days=1)
+
+
+def _period_start(day: date, period: ReportPeriod) -> date:
+    if period == ReportPeriod.WEEK:
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def _average(cycle_seconds: int, completed: int) -> float | None:
+    return cycle_seconds / completed if completed else None
+
+
+def throughput(start: date, end: date, period: ReportPeriod = ReportPeriod.DAY) -> list[dict]:
+    """Created and completed counts and average cycle time per day or week."""
+    period = ReportPeriod(period)
+    totals: dict[date, dict[str, int]] = defaultdict(
+        lambda: {"created": 0, "completed": 0, "cycle_seconds": 0}
+    )
+    rollup_end, live_start = _split(start, end)
+    if rollup_end is not None:
+        trunc = TruncWeek("day") if period == ReportPeriod.WEEK else F("day")
+        rows = (
+            TaskDailyStats.objects.filter(day__gte=start, day__lte=rollup_end)
+            .annotate(period=trunc)
+            .values("period")
+            .annotate(
+                created=Sum("created"),
+                completed=Sum("completed"),
+                cycle_seconds=Sum("cycle_seconds"),
+            )
+        )
+        for row in rows:
+            entry = totals[row["period"]]
+            for field in ("created", "completed", "cycle_seconds"):
+                entry[field] += row[field]
+    if live_start <= end:
+        for (day, _), values in aggregate_days(live_start, end).items():
+            entry = totals[_period_start(day, period)]
+            for field, value in values.items():
+                entry[field] += value
+
+    return [
+        {
+            "period": day,
+            "created": entry["created"],
+            "completed": entry["completed"],
+            "avg_cycle_seconds": _average(entry["cycle_seconds"], entry["completed"]),
+        }
+        for day, entry in sorted(totals.items())
+    ]
+
+
+def owner_throughput(start: date, end: date) -> list[dict]:
+    """Completed tasks and average cycle time per owner, busiest first."""
+    totals: dict[int, dict[str, int]] = defaultdict(lambda: {"completed": 0, "cycle_seconds": 0})
+    rollup_end, live_start = _split(start, end)
+    if rollup_end is not None:
+        rows = (
+            TaskDailyStats.objects.filter(
+                day__gte=start, day__lte=rollup_end, completed__gt=0
+            )
+            .values("user_id")
+            .annotate(completed=Sum("completed"), cycle_seconds=Sum("cycle_seconds"))
+        )
+        for row in rows:
+            totals[row["user_id"]]["completed"] += row["completed"]
+            totals[row["user_id"]]["cycle_seconds"] += row["cycle_seconds"]
+    if live_start <= end:
+        for (_, user_id), values in aggregate_days(live_start, end).items():
+            if values["completed"]:
+                totals[user_id]["completed"] += values["completed"]
+                totals[user_id]["cycle_seconds"] += values["cycle_seconds"]
+
+    usernames = dict(
+        get_user_model()
+        .objects.filter(id__in=[user_id for user_id in totals if user_id])
+        .values_list("id", "username")
+    )
+    return [
+        {
+            "owner_id": user_id or None,
+            "username": usernames.get(user_id),
+            "completed": entry["completed"],
+            "avg_cycle_seconds": _average(entry["cycle_seconds"], entry["completed"]),
+        }
+        for user_id, entry in sorted(
+            totals.items(), key=lambda item: item[1]["completed"], reverse=True
+        )
+    ]
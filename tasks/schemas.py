@@ -2,8 +2,14 @@ import datetime
 from ninja import Schema, ModelSchema, Field, FilterSchema
 from pydantic import model_validator
 from django.contrib.auth.models import User
-from tasks.enums import TaskStatus
-from .models import Task
+from tasks.enums import (
+    TaskBatchOperation,
+    TaskChangeAction,
+    TaskExpansion,
+    TaskStatus,
+    TaskTransitionResult,
+)
+from .models import Epic, Sprint, Task, UploadSession
 
 class UserSchema(ModelSchema):
     class Config:
@@ -23,11 +29,181 @@ class TaskSchemaIn(ModelSchema):
         model_fields_optional = ["status"]
 
 
+class EpicSummarySchema(ModelSchema):
+    class Config:
+        model = Epic
+        model_fields = ["id", "name"]
+
+
+class SprintSummarySchema(ModelSchema):
+    class Config:
+        model = Sprint
+        model_fields = ["id", "name", "start_date", "end_date"]
+
+
+def expanded(context, expansion: TaskExpansion) -> bool:
+    """Whether the request asked for `expansion` (see tasks.api.tasks.parse_expand)."""
+    request = (context or {}).get("request")
+    return expansion in getattr(request, "task_expand", ())
+
+
 class TaskSchemaOut(ModelSchema):
-    # owner: UserSchema | None = Field(None)
+    # Related objects are only included when asked for with `?expand=`;
+    # the endpoints load them up front, never one query per task
+    owner: UserSchema | None = None
+    creator: UserSchema | None = None
+    epics: list[EpicSummarySchema] | None = None
+    sprints: list[SprintSummarySchema] | None = None
+    image_thumbnails: dict[str, str] = Field({}, example={"small": "/media/thumbnails/.../small.jpg"})
+
     class Config:
         model = Task
-        model_fields = ["title", "description"]
+        model_fields = ["id", "title", "description"]
+
+    @staticmethod
+    def resolve_owner(obj, context):
+        return obj.owner if expanded(context, TaskExpansion.OWNER) else None
+
+    @staticmethod
+    def resolve_creator(obj, context):
+        return obj.creator if expanded(context, TaskExpansion.CREATOR) else None
+
+    @staticmethod
+    def resolve_epics(obj, context):
+        return obj.epics.all() if expanded(context, TaskExpansion.EPICS) else None
+
+    @staticmethod
+    def resolve_sprints(obj, context):
+        return obj.sprints.all() if expanded(context, TaskExpansion.SPRINTS) else None
+
+class TaskBulkSchemaOut(Schema):
+    # In the order requested
+    tasks: list[TaskSchemaOut]
+    missing: list[int] = Field(..., example=[7])
+
+
+class TaskSyncSchemaOut(ModelSchema):
+    class Config:
+        model = Task
+        model_fields = [
+            "id",
+            "title",
+            "description",
+            "status",
+            "owner",
+            "created_at",
+            "updated_at",
+        ]
+
+
+class TaskChangeSchemaOut(Schema):
+    token: int
+    task_id: int
+    action: TaskChangeAction
+    changed_at: datetime.datetime
+    task: TaskSyncSchemaOut | None = None
+
+
+class TaskChangeFeedSchemaOut(Schema):
+    changes: list[TaskChangeSchemaOut]
+    next_token: int = Field(..., example=42)
+    has_more: bool
+
+class ClaimedTasksSchemaOut(Schema):
+    claimed: list[int] = Field(..., example=[3, 4])
+
+class TaskTransitionSchemaIn(Schema):
+    ids: list[int] = Field(..., example=[1, 2, 3])
+    status: TaskStatus = Field(..., example=TaskStatus.ARCHIVED)
+
+
+class TaskTransitionResultSchemaOut(Schema):
+    id: int
+    result: TaskTransitionResult
+
+
+class TaskBatchOperationSchemaIn(Schema):
+    op: TaskBatchOperation = Field(..., example=TaskBatchOperation.UPDATE)
+    # Required by all operations but create
+    id: int | None = Field(None, example=1)
+    # Task version an update is based on, like the If-Match header
+    version: int | None = None
+    data: TaskSchemaIn | None = None
+
+
+class TaskBatchSchemaIn(Schema):
+    operations: list[TaskBatchOperationSchemaIn] = Field(..., max_length=1000)
+    # Apply all operations or, if any fails, none
+    atomic: bool = False
+
+
+class TaskBatchResultSchemaOut(Schema):
+    index: int
+    op: TaskBatchOperation
+    id: int | None
+    # HTTP status the operation would have had as a request of its own
+    status: int = Field(..., example=200)
+    error: str | None = None
+
+class UploadStartSchemaIn(Schema):
+    field: str = Field("file_upload", example="file_upload")
+    filename: str = Field(..., example="satellite-data.tar.gz")
+    size: int = Field(..., gt=0, example=524288000)
+    sha256: str = Field("", max_length=64)
+
+
+class UploadSessionSchemaOut(ModelSchema):
+    chunk_size: int
+
+    class Config:
+        model = UploadSession
+        model_fields = ["id", "field", "filename", "size", "received", "completed_at"]
+
+    @staticmethod
+    def resolve_chunk_size(obj) -> int:
+        from tasks.uploads import chunk_size
+
+        return chunk_size()
+
+
+class UploadCompleteSchemaOut(Schema):
+    name: str
+
+
+class ThroughputSchemaOut(Schema):
+    period: datetime.date
+    created: int
+    completed: int
+    # Average created-to-done time of the completed tasks
+    avg_cycle_seconds: float | None
+
+
+class OwnerThroughputSchemaOut(Schema):
+    owner_id: int | None
+    username: str | None
+    completed: int
+    avg_cycle_seconds: float | None
+
+
+class BurndownDaySchemaOut(Schema):
+    day: datetime.date
+    # Member tasks not yet done or archived at the end of the day
+    remaining: int
+
+
+class SprintVelocitySchemaOut(Schema):
+    sprint_id: int
+    name: str
+    start_date: datetime.date
+    end_date: datetime.date
+    finished: bool
+    scope: int
+    # Member tasks completed during the sprint
+    velocity: int
+
+
+class SprintBurndownSchemaOut(SprintVelocitySchemaOut):
+    burndown: list[BurndownDaySchemaOut]
 
 class TaskFilterSchema(FilterSchema):
     title: str | None
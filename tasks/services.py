@@ -1,19 +1,67 @@
 from typing import Any
-from datetime import date, datetime
-from django.shortcuts import get_object_or_404
+from datetime import date, datetime, timedelta
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.db import models, transaction
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.db import connection, models, transaction
+from django.db.models import ExpressionWrapper, F, Prefetch, Q
 from django.db.models.functions import TruncDate
 from django.core.exceptions import ValidationError
 from django.core.mail import send_mail
-from .models import Epic, Sprint, Task
-from tasks.enums import TaskStatus
+from django.http import Http404
+from django.utils import timezone
+from .models import (
+    ArchivedSprintTask,
+    ArchivedTask,
+    Epic,
+    Sprint,
+    SubscribedEmail,
+    Task,
+    TaskChange,
+    TaskTransition,
+    UploadSession,
+)
+from tasks.enums import (
+    TaskChangeAction,
+    TaskEventType,
+    TaskExpansion,
+    TaskStatus,
+    TaskTransitionResult,
+)
+from tasks import burndown, events
+from taskmanager.routers import read_db
+from taskmanager.sqlite import retry_on_lock
 
 
 class TaskAlreadyClaimedException(Exception):
     pass
 
 
+class TaskVersionConflictException(Exception):
+    pass
+
+
+# Statuses a task may move to from each status
+ALLOWED_TRANSITIONS: dict[TaskStatus, set[TaskStatus]] = {
+    TaskStatus.UNASSIGNED: {
+        TaskStatus.IN_PROGRESS,
+        TaskStatus.DONE,
+        TaskStatus.ARCHIVED,
+    },
+    TaskStatus.IN_PROGRESS: {
+        TaskStatus.UNASSIGNED,
+        TaskStatus.DONE,
+        TaskStatus.ARCHIVED,
+    },
+    TaskStatus.DONE: {TaskStatus.IN_PROGRESS, TaskStatus.ARCHIVED},
+    TaskStatus.ARCHIVED: {TaskStatus.UNASSIGNED},
+}
+
+# Upper bound of ids bound into a single statement
+BULK_CHUNK_SIZE = 5000
+
+
 def create_task(creator: User, **task_data: Any) -> Task:
     task = Task(**task_data)
     task.creator = creator
@@ -21,17 +69,65 @@ def create_task(creator: User, **task_data: Any) -> Task:
     return task
 
 
-def update_task(task_id: int, task_data: dict) -> None:
+def completion_fields(status: TaskStatus, stamp: datetime) -> dict[str, Any]:
+    """The `completed_at` change implied by moving a task to `status`."""
+    status = TaskStatus(status)
+    if status == TaskStatus.DONE:
+        return {"completed_at": stamp}
+    if status == TaskStatus.ARCHIVED:
+        # Archiving keeps the completion time of a finished task
+        return {}
+    return {"completed_at": None}
+
+
+@retry_on_lock
+def update_task(
+    task_id: int,
+    task_data: dict,
+    expected_version: int | None = None,
+    actor_id: int | None = None,
+) -> Task | None:
+    """
+    Applies `task_data` to the task with a conditional UPDATE that only
+    touches the changed columns and succeeds only if nobody else wrote the
+    row in the meantime. Pass `expected_version` to also reject updates
+    based on a stale copy of the task.
+    """
     task = Task.objects.filter(id=task_id).first()
     if not task:
-        return
-
-    # Iterate over the task data and set the attributes on the task instance
-    for field, value in task_data.items():
-        setattr(task, field, value)
-
-    # Save the task instance, which applies the updates to the database
-    task.save()
+        return None
+    if expected_version is not None and task.version != expected_version:
+        raise TaskVersionConflictException("Task was modified by someone else.")
+
+    changed = {
+        field: value
+        for field, value in task_data.items()
+        if getattr(task, field) != value
+    }
+    if not changed:
+        return task
+
+    updated_at = timezone.now()
+    previous_status = task.status
+    if "status" in changed:
+        changed.update(completion_fields(changed["status"], updated_at))
+    with transaction.atomic():
+        updated = Task.objects.filter(id=task_id, version=task.version).update(
+            **changed, version=F("version") + 1, updated_at=updated_at
+        )
+        if not updated:
+            raise TaskVersionConflictException("Task was modified by someone else.")
+
+        for field, value in changed.items():
+            setattr(task, field, value)
+        task.version += 1
+        task.updated_at = updated_at
+        if "status" in changed:
+            record_task_transitions(
+                [(task_id, previous_status, task.status)], actor_id, updated_at
+            )
+        task_changed(task)
+    return task
 
 
 def delete_task(task_id: int) -> None:
@@ -41,41 +137,249 @@ def delete_task(task_id: int) -> None:
     task.delete()
 
 
-def get_task(task_id: int) -> Task | None:
-    return (
-        Task.objects.select_related("owner")
+# Columns loaded for expanded epics and sprints
+EXPANSION_PREFETCHES = {
+    TaskExpansion.EPICS: lambda: Epic.objects.only("id", "name"),
+    TaskExpansion.SPRINTS: lambda: Sprint.objects.only("id", "name", "start_date", "end_date"),
+}
+
+
+def expand_tasks(tasks: models.QuerySet, expand=()) -> models.QuerySet:
+    """
+    Loads the requested related objects along with `tasks`: users in the
+    same query, epics and sprints in one extra query each, however many
+    tasks there are.
+    """
+    expand = {TaskExpansion(item) for item in expand}
+    users = [item.value for item in (TaskExpansion.OWNER, TaskExpansion.CREATOR) if item in expand]
+    if users:
+        tasks = tasks.select_related(*users)
+    return tasks.prefetch_related(
+        *(
+            Prefetch(item.value, queryset=queryset())
+            for item, queryset in EXPANSION_PREFETCHES.items()
+            if item in expand
+        )
+    )
+
+
+def get_task(task_id: int, expand=()) -> Task | None:
+    return expand_tasks(
+        Task.objects.using(read_db())
+        .select_related("owner")
         .select_related("creator")
-        .filter(pk=task_id)
-        .first()
+        .filter(pk=task_id),
+        expand,
+    ).first()
+
+
+def list_tasks(expand=()):
+    return expand_tasks(Task.objects.using(read_db()), expand)
+
+
+def task_cache_key(task_id: int) -> str:
+    return f"task:{task_id}"
+
+
+def forget_tasks(task_ids) -> None:
+    """Drops cached copies of the tasks, now and once the transaction commits."""
+    keys = [task_cache_key(task_id) for task_id in task_ids]
+    if settings.TASK_CACHE_TIMEOUT and keys:
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def forget_task(task_id: int) -> None:
+    forget_tasks([task_id])
+
+
+# Template fragments cached per task id and version
+TASK_FRAGMENTS = ("task_card", "task_list_item")
+
+
+def delete_task_fragments(task_versions) -> None:
+    cache.delete_many(
+        [
+            make_template_fragment_key(fragment, [task_id, version])
+            for task_id, version in task_versions
+            for fragment in TASK_FRAGMENTS
+        ]
     )
 
 
-def list_tasks():
-    return Task.objects.all()
+def get_tasks(task_ids: list[int], expand=()) -> dict[int, Task]:
+    """
+    The existing tasks among `task_ids`, by id, fetched with one query.
+    With TASK_CACHE_TIMEOUT set, tasks without expansions are served from
+    the cache where possible and only the rest is queried - from the
+    primary, as a lagging replica would put stale rows back in the cache.
+    """
+    use_cache = settings.TASK_CACHE_TIMEOUT and not expand
+    found = {}
+    if use_cache:
+        cached = cache.get_many([task_cache_key(task_id) for task_id in task_ids])
+        found = {task.id: task for task in cached.values()}
+    missing = [task_id for task_id in task_ids if task_id not in found]
+    if missing:
+        database = "default" if use_cache else read_db()
+        loaded = expand_tasks(Task.objects.using(database), expand).in_bulk(missing)
+        if use_cache:
+            cache.set_many(
+                {task_cache_key(task_id): task for task_id, task in loaded.items()},
+                settings.TASK_CACHE_TIMEOUT,
+            )
+        found.update(loaded)
+    return found
 
 
 def search_tasks(
     created_at: date,
     status: TaskStatus,
 ) -> list[Task]:
-    tasks = Task.objects.filter(created_at__date=created_at, status=status).order_by(
-        "status", "created_at"
+    tasks = (
+        Task.objects.using(read_db())
+        .filter(created_at__date=created_at, status=status)
+        .order_by("status", "created_at")
     )
     return tasks
 
 
+def search_archived_tasks(created_at: date):
+    """
+    Archived tasks created on the given day, from both the hot Task table
+    and the ArchivedTask cold storage.
+    """
+    fields = ("id", "title", "description", "created_at")
+    db = read_db()
+    hot = Task.objects.using(db).filter(
+        created_at__date=created_at, status=TaskStatus.ARCHIVED.value
+    ).values(*fields)
+    cold = ArchivedTask.objects.using(db).filter(created_at__date=created_at).values(*fields)
+    return hot.union(cold, all=True).order_by("created_at", "id")
+
+
+def delete_task_rows(task_ids: list[int]) -> None:
+    """
+    Deletes the Task rows themselves with one DELETE, without fetching them
+    or sending per-task delete signals. Rows referencing the tasks must be
+    removed first, and callers record the deletions themselves.
+    """
+    if not task_ids:
+        return
+    quote = connection.ops.quote_name
+    placeholders = ", ".join(["%s"] * len(task_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {quote(Task._meta.db_table)} "
+            f"WHERE {quote(Task._meta.pk.column)} IN ({placeholders})",
+            task_ids,
+        )
+
+
+def archive_tasks(
+    older_than: timedelta, batch_size: int = 500, max_batches: int | None = None
+) -> int:
+    """
+    Moves ARCHIVED tasks untouched for `older_than` into cold storage, one
+    bounded batch per transaction so the hot table is never locked for long.
+    Returns the number of tasks moved.
+    """
+    cutoff = timezone.now() - older_than
+    candidates = Task.objects.filter(
+        status=TaskStatus.ARCHIVED.value, updated_at__lt=cutoff
+    ).order_by("updated_at", "id")
+    moved = batches = 0
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic():
+            tasks = list(candidates[:batch_size])
+            if not tasks:
+                break
+            task_ids = [task.id for task in tasks]
+            sprint_ids: dict[int, list[int]] = {}
+            for task_id, sprint_id in Sprint.tasks.through.objects.filter(
+                task_id__in=task_ids
+            ).values_list("task_id", "sprint_id"):
+                sprint_ids.setdefault(task_id, []).append(sprint_id)
+            epic_ids: dict[int, list[int]] = {}
+            for task_id, epic_id in Epic.tasks.through.objects.filter(
+                task_id__in=task_ids
+            ).values_list("task_id", "epic_id"):
+                epic_ids.setdefault(task_id, []).append(epic_id)
+
+            ArchivedTask.objects.bulk_create(
+                [
+                    ArchivedTask(
+                        id=task.id,
+                        title=task.title,
+                        description=task.description,
+                        status=task.status,
+                        created_at=task.created_at,
+                        updated_at=task.updated_at,
+                        creator_id=task.creator_id,
+                        owner_id=task.owner_id,
+                        file_upload=task.file_upload.name or "",
+                        image_upload=task.image_upload.name or "",
+                        file_upload_name=task.file_upload_name,
+                        image_upload_name=task.image_upload_name,
+                        sprint_ids=sprint_ids.get(task.id, []),
+                        epic_ids=epic_ids.get(task.id, []),
+                    )
+                    for task in tasks
+                ]
+            )
+            ArchivedSprintTask.objects.bulk_create(
+                [
+                    ArchivedSprintTask(sprint_id=sprint_id, task_id=task_id)
+                    for task_id, task_sprint_ids in sprint_ids.items()
+                    for sprint_id in task_sprint_ids
+                ]
+            )
+            # Delete dependants and rows directly: a regular delete() would
+            # fetch every row and fire per-task signals
+            SubscribedEmail.objects.filter(task_id__in=task_ids).delete()
+            UploadSession.objects.filter(task_id__in=task_ids).delete()
+            Sprint.tasks.through.objects.filter(task_id__in=task_ids).delete()
+            Epic.tasks.through.objects.filter(task_id__in=task_ids).delete()
+            delete_task_rows(task_ids)
+            record_task_changes(task_ids, TaskChangeAction.DELETED)
+        moved += len(tasks)
+        batches += 1
+    return moved
+
+
 def can_add_task_to_sprint(task, sprint_id):
     """
     Checks if a task can be added to a sprint based on the
     sprint's date range.
     """
-    sprint = get_object_or_404(Sprint, id=sprint_id)
-    return sprint.start_date <= task.created_ad.date() <= sprint.end_date
+    # A task about to be created is dated today
+    day = timezone.localdate(task.created_at) if task else timezone.localdate()
+    try:
+        sprint_id = int(sprint_id)
+    except (TypeError, ValueError):
+        raise Http404("No Sprint matches the given query.")
+    # One query both finds the sprint and checks the range
+    in_range = (
+        Sprint.objects.filter(id=sprint_id)
+        .annotate(
+            in_range=ExpressionWrapper(
+                Q(start_date__lte=day, end_date__gte=day),
+                output_field=models.BooleanField(),
+            )
+        )
+        .values_list("in_range", flat=True)
+        .first()
+    )
+    if in_range is None:
+        raise Http404("No Sprint matches the given query.")
+    return in_range
 
 
 def get_task_by_date(by_date: date) -> list[Task]:
-    return Task.objects.annotate(date_created=TruncDate("created_at")).filter(
-        date_created=by_date
+    return (
+        Task.objects.using(read_db())
+        .annotate(date_created=TruncDate("created_at"))
+        .filter(date_created=by_date)
     )
 
 
@@ -108,19 +412,372 @@ def create_task_and_add_to_sprint(
     return task
 
 
+@retry_on_lock
 @transaction.atomic
 def claim_task(user_id, task_id):
-    # Lock the task row to prevent other transactions from claiming it simultaneously
-    task = Task.objects.select_for_update().get(id=task_id)
-
-    # Check if the task is already claimed
-    if task.owner_id:
+    # A single conditional UPDATE claims the task: of several concurrent
+    # claims only one can match `owner IS NULL`. The source status for the
+    # transition log is read under a row lock where the database has them.
+    previous_status = (
+        Task.objects.select_for_update()
+        .filter(id=task_id, owner__isnull=True)
+        .values_list("status", flat=True)
+        .first()
+    )
+    claimed_at = timezone.now()
+    claimed = Task.objects.filter(id=task_id, owner__isnull=True).update(
+        status=TaskStatus.IN_PROGRESS.value,
+        owner_id=user_id,
+        completed_at=None,
+        version=F("version") + 1,
+        updated_at=claimed_at,
+    )
+    if not claimed:
+        if not Task.objects.filter(id=task_id).exists():
+            raise Task.DoesNotExist("Task matching query does not exist.")
         raise TaskAlreadyClaimedException("Task is already claimed or completed.")
 
-    # Claim the task
-    task.status = TaskStatus.IN_PROGRESS
-    task.owner_id = user_id
-    task.save()
+    record_task_transitions(
+        # Without row locks the task may have been released after the read
+        [(task_id, previous_status or TaskStatus.UNASSIGNED, TaskStatus.IN_PROGRESS)],
+        user_id,
+        claimed_at,
+    )
+    task = Task(id=task_id, status=TaskStatus.IN_PROGRESS.value, owner_id=user_id)
+    task_changed(task, TaskEventType.CLAIMED)
+
+
+@retry_on_lock
+def claim_next_tasks(user_id: int, limit: int = 1) -> list[int]:
+    """
+    Work-queue style claim of up to `limit` of the oldest unassigned tasks.
+    Returns the ids that were claimed by this call.
+
+    Databases supporting SKIP LOCKED let concurrent workers pick disjoint
+    rows without waiting on each other. Elsewhere (SQLite) the candidates
+    are claimed with one conditional UPDATE and the winners are found by
+    the unique `updated_at` stamp written by this call; candidates taken
+    by another worker in between are simply retried from a fresh batch.
+    """
+    unassigned = Task.objects.filter(
+        owner__isnull=True, status=TaskStatus.UNASSIGNED.value
+    ).order_by("created_at", "id")
+    claimed: list[int] = []
+    with transaction.atomic():
+        if connection.features.has_select_for_update_skip_locked:
+            candidates = list(
+                unassigned.select_for_update(skip_locked=True).values_list(
+                    "id", flat=True
+                )[:limit]
+            )
+            Task.objects.filter(id__in=candidates).update(
+                status=TaskStatus.IN_PROGRESS.value,
+                owner_id=user_id,
+                version=F("version") + 1,
+                updated_at=timezone.now(),
+            )
+            claimed = candidates
+        else:
+            for _ in range(3):
+                candidates = list(
+                    unassigned.values_list("id", flat=True)[: limit - len(claimed)]
+                )
+                if not candidates:
+                    break
+                stamp = timezone.now()
+                Task.objects.filter(
+                    id__in=candidates, owner__isnull=True, status=TaskStatus.UNASSIGNED.value
+                ).update(
+                    status=TaskStatus.IN_PROGRESS.value,
+                    owner_id=user_id,
+                    version=F("version") + 1,
+                    updated_at=stamp,
+                )
+                claimed += Task.objects.filter(
+                    id__in=candidates, owner_id=user_id, updated_at=stamp
+                ).values_list("id", flat=True)
+                if len(claimed) >= limit:
+                    break
+
+        record_task_changes(claimed, TaskChangeAction.UPDATED)
+        record_task_transitions(
+            [
+                (task_id, TaskStatus.UNASSIGNED, TaskStatus.IN_PROGRESS)
+                for task_id in claimed
+            ],
+            user_id,
+        )
+        for task_id in claimed:
+            events.publish_task_event(
+                TaskEventType.CLAIMED,
+                Task(id=task_id, status=TaskStatus.IN_PROGRESS.value, owner_id=user_id),
+            )
+    return claimed
+
+
+@retry_on_lock
+def bulk_transition_tasks(
+    task_ids: list[int], to_status: TaskStatus, actor_id: int | None = None
+) -> dict[int, TaskTransitionResult]:
+    """
+    Moves many tasks to `to_status` with set-based UPDATEs whose WHERE
+    clause only admits the statuses allowed to transition there, and
+    reports the outcome for every requested id.
+    """
+    to_status = TaskStatus(to_status)
+    allowed_from = [
+        status.value
+        for status, targets in ALLOWED_TRANSITIONS.items()
+        if to_status in targets
+    ]
+    task_ids = list(dict.fromkeys(task_ids))
+    results = dict.fromkeys(task_ids, TaskTransitionResult.NOT_FOUND)
+    transitioned: list[int] = []
+    previous: dict[int, str] = {}
+    owner_ids: set[int] = set()
+
+    with transaction.atomic():
+        for start in range(0, len(task_ids), BULK_CHUNK_SIZE):
+            chunk = task_ids[start : start + BULK_CHUNK_SIZE]
+            # The stamp tells the rows moved by this statement from the rest
+            stamp = timezone.now()
+            movable = Task.objects.filter(id__in=chunk, status__in=allowed_from)
+            # Locked (where supported) so the logged source status stays true
+            previous.update(movable.select_for_update().values_list("id", "status"))
+            movable.update(
+                status=to_status.value,
+                version=F("version") + 1,
+                updated_at=stamp,
+                **completion_fields(to_status, stamp),
+            )
+            rows = Task.objects.filter(id__in=chunk).values_list(
+                "id", "status", "updated_at", "owner_id"
+            )
+            for task_id, status, updated_at, owner_id in rows:
+                if status == to_status.value and updated_at == stamp:
+                    results[task_id] = TaskTransitionResult.TRANSITIONED
+                    transitioned.append(task_id)
+                    if owner_id:
+                        owner_ids.add(owner_id)
+                else:
+                    results[task_id] = TaskTransitionResult.NOT_ALLOWED
+
+        if transitioned:
+            record_task_changes(transitioned, TaskChangeAction.UPDATED)
+            record_task_transitions(
+                [(task_id, previous[task_id], to_status) for task_id in transitioned],
+                actor_id,
+            )
+            events.publish_bulk_task_event(
+                TaskEventType.TRANSITIONED, transitioned, to_status.value, owner_ids
+            )
+    return results
+
+
+def bulk_create_tasks(creator: User, tasks_data: list[dict[str, Any]]) -> list[Task]:
+    """
+    Creates many tasks with batched INSERTs. Does what saving each task
+    would have triggered: the change and transition logs and the events.
+    """
+    stamp = timezone.now()
+    tasks = []
+    for task_data in tasks_data:
+        task = Task(**task_data, creator=creator)
+        for field, value in completion_fields(task.status, stamp).items():
+            setattr(task, field, value)
+        tasks.append(task)
+    with transaction.atomic():
+        Task.objects.bulk_create(tasks, batch_size=BULK_CHUNK_SIZE)
+        task_ids = [task.id for task in tasks]
+        record_task_changes(task_ids, TaskChangeAction.CREATED)
+        record_task_transitions(
+            [(task.id, None, task.status) for task in tasks], creator.pk, stamp
+        )
+        for task in tasks:
+            events.publish_task_event(TaskEventType.CREATED, task, sprint_ids=[], epic_ids=[])
+    return tasks
+
+
+@retry_on_lock
+def bulk_claim_tasks(user_id: int, task_ids: list[int]) -> dict[int, bool]:
+    """
+    Claims the given unowned tasks for the user with one conditional UPDATE
+    per chunk. Returns whether each existing task was claimed by this call;
+    missing ids are left out.
+    """
+    task_ids = list(dict.fromkeys(task_ids))
+    results: dict[int, bool] = {}
+    previous: dict[int, str] = {}
+    with transaction.atomic():
+        for start in range(0, len(task_ids), BULK_CHUNK_SIZE):
+            chunk = task_ids[start : start + BULK_CHUNK_SIZE]
+            stamp = timezone.now()
+            claimable = Task.objects.filter(id__in=chunk, owner__isnull=True)
+            previous.update(claimable.select_for_update().values_list("id", "status"))
+            claimable.update(
+                status=TaskStatus.IN_PROGRESS.value,
+                owner_id=user_id,
+                completed_at=None,
+                version=F("version") + 1,
+                updated_at=stamp,
+            )
+            rows = Task.objects.filter(id__in=chunk).values_list("id", "owner_id", "updated_at")
+            for task_id, owner_id, updated_at in rows:
+                results[task_id] = owner_id == user_id and updated_at == stamp
+
+        claimed = [task_id for task_id, was_claimed in results.items() if was_claimed]
+        if claimed:
+            record_task_changes(claimed, TaskChangeAction.UPDATED)
+            record_task_transitions(
+                [(task_id, previous[task_id], TaskStatus.IN_PROGRESS) for task_id in claimed],
+                user_id,
+            )
+            events.publish_bulk_task_event(
+                TaskEventType.CLAIMED, claimed, TaskStatus.IN_PROGRESS.value, [user_id]
+            )
+    return results
+
+
+def bulk_delete_tasks(task_ids: list[int]) -> set[int]:
+    """
+    Deletes the given tasks together and returns the ids that existed.
+    As in `archive_tasks`, dependants and rows go with set-based DELETEs
+    per chunk, and what the per-task delete signals would do (change log,
+    event, burndown and fragment invalidation) happens once for the set.
+    """
+    task_ids = list(dict.fromkeys(task_ids))
+    rows: list[tuple[int, int, int | None]] = []
+    sprint_ids: set[int] = set()
+    epic_ids: set[int] = set()
+    with transaction.atomic():
+        for start in range(0, len(task_ids), BULK_CHUNK_SIZE):
+            chunk = task_ids[start : start + BULK_CHUNK_SIZE]
+            found = list(
+                Task.objects.select_for_update()
+                .filter(id__in=chunk)
+                .values_list("id", "version", "owner_id")
+            )
+            if not found:
+                continue
+            rows += found
+            chunk = [task_id for task_id, _, _ in found]
+            sprint_ids.update(
+                Sprint.tasks.through.objects.filter(task_id__in=chunk).values_list(
+                    "sprint_id", flat=True
+                )
+            )
+            epic_ids.update(
+                Epic.tasks.through.objects.filter(task_id__in=chunk).values_list(
+                    "epic_id", flat=True
+                )
+            )
+            SubscribedEmail.objects.filter(task_id__in=chunk).delete()
+            UploadSession.objects.filter(task_id__in=chunk).delete()
+            Sprint.tasks.through.objects.filter(task_id__in=chunk).delete()
+            Epic.tasks.through.objects.filter(task_id__in=chunk).delete()
+            delete_task_rows(chunk)
+
+        deleted = [task_id for task_id, _, _ in rows]
+        if deleted:
+            record_task_changes(deleted, TaskChangeAction.DELETED)
+            events.publish_bulk_task_event(
+                TaskEventType.DELETED,
+                deleted,
+                None,
+                {owner_id for _, _, owner_id in rows if owner_id},
+                sprint_ids=sorted(sprint_ids),
+                epic_ids=sorted(epic_ids),
+            )
+            burndown.invalidate(sprint_ids)
+            delete_task_fragments([(task_id, version) for task_id, version, _ in rows])
+    return set(deleted)
+
+
+def record_task_change(task_id: int, action: TaskChangeAction) -> TaskChange:
+    # Every write to a task ends up in the change log
+    forget_tasks([task_id])
+    return TaskChange.objects.create(task_id=task_id, action=action.value)
+
+
+def record_task_changes(task_ids: list[int], action: TaskChangeAction) -> None:
+    forget_tasks(task_ids)
+    TaskChange.objects.bulk_create(
+        [TaskChange(task_id=task_id, action=action.value) for task_id in task_ids]
+    )
+
+
+def record_task_transitions(
+    transitions: list[tuple[int, str | None, str]],
+    actor_id: int | None = None,
+    at: datetime | None = None,
+) -> None:
+    """
+    Appends (task id, from status, to status) entries to the transition log
+    in one INSERT. A None source status marks the task's creation.
+    """
+    codes = TaskTransition.STATUS_CODES
+    at = at or timezone.now()
+    TaskTransition.objects.bulk_create(
+        [
+            TaskTransition(
+                task_id=task_id,
+                from_status=codes[TaskStatus(from_status).value] if from_status else None,
+                to_status=codes[TaskStatus(to_status).value],
+                actor_id=actor_id,
+                at=at,
+            )
+            for task_id, from_status, to_status in transitions
+        ],
+        batch_size=BULK_CHUNK_SIZE,
+    )
+
+
+def task_changed(task: Task, event_type: TaskEventType = TaskEventType.UPDATED):
+    """
+    Records a change made with a queryset UPDATE, which bypasses the model
+    signals that otherwise feed the change log and live events.
+    """
+    record_task_change(task.pk, TaskChangeAction.UPDATED)
+    events.publish_task_event(event_type, task)
+
+
+def get_task_changes(since: int = 0, limit: int = 100) -> dict[str, Any]:
+    """
+    Returns the task changes recorded after the `since` sync token.
+
+    Only the latest change per task is returned, together with the current
+    state of the task unless it was deleted. Clients pass `next_token` back
+    as `since` until `has_more` is False.
+    """
+    # Fetch one extra row to find out whether another page follows
+    changes = list(TaskChange.objects.filter(id__gt=since).order_by("id")[: limit + 1])
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    latest: dict[int, TaskChange] = {}
+    for change in changes:
+        latest[change.task_id] = change
+    tasks = Task.objects.in_bulk(
+        [
+            change.task_id
+            for change in latest.values()
+            if change.action != TaskChangeAction.DELETED.value
+        ]
+    )
+    return {
+        "changes": [
+            {
+                "token": change.id,
+                "task_id": change.task_id,
+                "action": change.action,
+                "changed_at": change.changed_at,
+                "task": tasks.get(change.task_id),
+            }
+            for change in sorted(latest.values(), key=lambda change: change.id)
+        ],
+        "next_token": changes[-1].id if changes else since,
+        "has_more": has_more,
+    }
 
 
 def send_contact_email(
@@ -0,0 +1,142 @@
+from django.conf import settings
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from tasks import burndown, events, services, thumbnails
+from tasks.enums import TaskChangeAction, TaskEventType, TaskStatus
+from tasks.models import Sprint, Task
+
+
+@receiver(pre_save, sender=Task)
+def bump_task_version(sender, instance, **kwargs):
+    # Full saves from forms and the admin invalidate outstanding ETags too;
+    # partial saves write the version as well (see Task.save)
+    if not instance._state.adding:
+        instance.version += 1
+
+
+@receiver(pre_save, sender=Task)
+def track_completion(sender, instance, **kwargs):
+    if instance.status == TaskStatus.DONE.value:
+        if instance.completed_at is None:
+            instance.completed_at = timezone.now()
+    elif instance.status != TaskStatus.ARCHIVED.value:
+        instance.completed_at = None
+
+
+@receiver(pre_save, sender=Task)
+def reset_image_digest(sender, instance, **kwargs):
+    # A replaced image needs its thumbnails generated again
+    image = instance.image_upload
+    if not image or not instance.image_sha256:
+        return
+    if (
+        not image._committed
+        or Task.objects.filter(pk=instance.pk).exclude(image_upload=image.name).exists()
+    ):
+        instance.image_sha256 = ""
+
+
+@receiver(post_save, sender=Task)
+def generate_image_thumbnails(sender, instance, **kwargs):
+    if instance.image_upload and not instance.image_sha256:
+        thumbnails.schedule(
+            instance, "image_upload", "image_sha256", on_saved=services.forget_task
+        )
+
+
+@receiver(post_save, sender=Task)
+def record_status_transition(sender, instance, created, **kwargs):
+    previous = getattr(instance, "_loaded_status", None)
+    if created or (previous is not None and previous != instance.status):
+        # Views and the admin name the user behind the save
+        services.record_task_transitions(
+            [(instance.pk, None if created else previous, instance.status)],
+            getattr(instance, "_actor_id", None),
+        )
+    instance._loaded_status = instance.status
+
+
+@receiver(post_save, sender=Task)
+def record_task_saved(sender, instance, created, **kwargs):
+    action = TaskChangeAction.CREATED if created else TaskChangeAction.UPDATED
+    services.record_task_change(instance.pk, action)
+    event_type = TaskEventType.CREATED if created else TaskEventType.UPDATED
+    events.publish_task_event(event_type, instance)
+
+
+@receiver(pre_delete, sender=Task)
+def publish_task_deleted(sender, instance, **kwargs):
+    # Sprint and epic membership is gone once the delete has run
+    events.publish_task_event(
+        TaskEventType.DELETED,
+        instance,
+        sprint_ids=list(instance.sprints.values_list("id", flat=True)),
+        epic_ids=list(instance.epics.values_list("id", flat=True)),
+    )
+
+
+@receiver(post_delete, sender=Task)
+def record_task_deleted(sender, instance, **kwargs):
+    # Covers services.delete_task, TaskDeleteView and the admin alike
+    services.record_task_change(instance.pk, TaskChangeAction.DELETED)
+
+
+@receiver(post_delete, sender=Task)
+def invalidate_deleted_task_fragments(sender, instance, **kwargs):
+    services.delete_task_fragments([(instance.pk, instance.version)])
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_owned_task_fragments(sender, instance, created, update_fields, **kwargs):
+    # Saves of the task itself bump its version and so change the key;
+    # only a renamed owner leaves cached cards stale
+    if created or (update_fields is not None and "username" not in update_fields):
+        return
+    services.delete_task_fragments(
+        Task.objects.filter(owner=instance).values_list("id", "version")
+    )
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def collect_owned_task_fragments(sender, instance, **kwargs):
+    # The owner is set to NULL by a queryset update that leaves the version
+    # alone, and by post_delete the tasks can no longer be found by owner
+    instance._owned_task_versions = list(
+        Task.objects.filter(owner=instance).values_list("id", "version")
+    )
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_deleted_owner_task_fragments(sender, instance, **kwargs):
+    services.delete_task_fragments(getattr(instance, "_owned_task_versions", ()))
+
+
+@receiver(post_save, sender=Sprint)
+@receiver(post_delete, sender=Sprint)
+def invalidate_sprint_burndown(sender, instance, **kwargs):
+    burndown.invalidate([instance.pk])
+
+
+@receiver(m2m_changed, sender=Sprint.tasks.through)
+def invalidate_member_sprint_burndowns(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action.startswith("post_"):
+            burndown.invalidate([instance.pk])
+    elif action == "pre_clear":
+        # Membership is gone by post_clear and pk_set is None for clears
+        burndown.invalidate(instance.sprints.values_list("id", flat=True))
+    elif action in ("post_add", "post_remove"):
+        burndown.invalidate(pk_set)
+
+
+@receiver(pre_delete, sender=Task)
+def invalidate_task_sprint_burndowns(sender, instance, **kwargs):
+    burndown.invalidate(instance.sprints.values_list("id", flat=True))
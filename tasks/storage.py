@@ -0,0 +1,181 @@
+"""
+Content-addressed storage for task attachments.
+
+`ContentAddressedStorage` wraps another storage backend (the local file
+system, or any `django-storages` backend) and stores every file under the
+SHA-256 of its content. A file that is already stored is not uploaded
+again, so an attachment added to many tasks occupies one blob. Blobs are
+never deleted along with a task; the `collect_attachment_blobs` command
+counts the references per blob and removes the unreferenced ones.
+
+Since the stored name says nothing about the uploaded file, the attachment
+fields keep the original file name next to it, in `<field>_name`.
+"""
+import hashlib
+import os
+import tempfile
+from collections import Counter
+from datetime import timedelta
+
+from django.core.files import File
+from django.core.files.storage import Storage, storages
+from django.db import models
+from django.db.models import Count
+from django.db.models.fields.files import FieldFile, ImageFieldFile
+from django.utils import timezone
+from django.utils.deconstruct import deconstructible
+from django.utils.module_loading import import_string
+
+BLOB_PREFIX = "blobs"
+
+
+def attachment_storage():
+    """Storage of the Task attachment fields, see the `attachments` alias."""
+    return storages["attachments"]
+
+
+@deconstructible
+class ContentAddressedStorage(Storage):
+    def __init__(self, backend="django.core.files.storage.FileSystemStorage", options=None):
+        self.backend = import_string(backend)(**(options or {}))
+
+    def blob_name(self, digest: str, name: str) -> str:
+        extension = os.path.splitext(name)[1].lower()
+        return f"{BLOB_PREFIX}/{digest[:2]}/{digest}{extension}"
+
+    def get_available_name(self, name, max_length=None):
+        # Names are derived from the content in _save, never made unique
+        return name
+
+    def _save(self, name, content):
+        from tasks.models import AttachmentBlob
+
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            content.seek(0)
+            source = content
+        except (AttributeError, OSError):
+            # Streams cannot be read twice; spool them while hashing
+            source = File(tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024))
+        for chunk in content.chunks():
+            digest.update(chunk)
+            size += len(chunk)
+            if source is not content:
+                source.write(chunk)
+        source.seek(0)
+
+        blob_name = self.blob_name(digest.hexdigest(), name)
+        # Marked as seen before the file is checked, so that a collection
+        # running meanwhile keeps the blob for another grace period
+        now = timezone.now()
+        if not AttachmentBlob.objects.filter(sha256=digest.hexdigest()).update(
+            last_seen_at=now
+        ):
+            AttachmentBlob.objects.get_or_create(
+                sha256=digest.hexdigest(),
+                defaults={"name": blob_name, "size": size, "last_seen_at": now},
+            )
+        if not self.backend.exists(blob_name):
+            self.backend.save(blob_name, source)
+        if source is not content:
+            source.close()
+        return blob_name
+
+    def delete(self, name):
+        # Other tasks may share the blob; collect_attachment_blobs removes it
+        pass
+
+    def delete_blob(self, name):
+        self.backend.delete(name)
+
+    def _open(self, name, mode="rb"):
+        return self.backend.open(name, mode)
+
+    def exists(self, name):
+        return self.backend.exists(name)
+
+    def listdir(self, path):
+        return self.backend.listdir(path)
+
+    def size(self, name):
+        return self.backend.size(name)
+
+    def url(self, name):
+        return self.backend.url(name)
+
+    def path(self, name):
+        return self.backend.path(name)
+
+    def get_accessed_time(self, name):
+        return self.backend.get_accessed_time(name)
+
+    def get_created_time(self, name):
+        return self.backend.get_created_time(name)
+
+    def get_modified_time(self, name):
+        return self.backend.get_modified_time(name)
+
+
+class OriginalNameMixin:
+    """Remembers the name a file is saved under on `<field>_name` of the instance."""
+
+    def save(self, name, content, save=True):
+        setattr(self.instance, f"{self.field.name}_name", os.path.basename(name))
+        super().save(name, content, save)
+
+
+class AttachmentFieldFile(OriginalNameMixin, FieldFile):
+    pass
+
+
+class AttachmentImageFieldFile(OriginalNameMixin, ImageFieldFile):
+    pass
+
+
+class AttachmentFileField(models.FileField):
+    attr_class = AttachmentFieldFile
+
+
+class AttachmentImageField(models.ImageField):
+    attr_class = AttachmentImageFieldFile
+
+
+def collect_blobs(grace: timedelta, dry_run: bool = False) -> dict[str, int]:
+    """
+    Recounts the task references of every blob and deletes the blobs no
+    live or archived task refers to. Blobs saved (or saved again) within
+    `grace` are kept, as the task referencing them may not be saved yet.
+    """
+    from tasks.models import ArchivedTask, AttachmentBlob, Task
+
+    counts: Counter[str] = Counter()
+    for model in (Task, ArchivedTask):
+        for field in ("file_upload", "image_upload"):
+            rows = (
+                model.objects.filter(**{f"{field}__startswith": f"{BLOB_PREFIX}/"})
+                .values_list(field)
+                .annotate(references=Count("pk"))
+                .order_by()
+            )
+            counts.update(dict(rows))
+
+    cutoff = timezone.now() - grace
+    changed, garbage = [], []
+    for blob in AttachmentBlob.objects.iterator():
+        references = counts.get(blob.name, 0)
+        if references == 0 and blob.last_seen_at < cutoff:
+            garbage.append(blob)
+        elif references != blob.ref_count:
+            blob.ref_count = references
+            changed.append(blob)
+
+    if not dry_run:
+        AttachmentBlob.objects.bulk_update(changed, ["ref_count"], batch_size=500)
+        storage = attachment_storage()
+        for blob in garbage:
+            storage.delete_blob(blob.name)
+        AttachmentBlob.objects.filter(
+            sha256__in=[blob.sha256 for blob in garbage]
+        ).delete()
+    return {"referenced": len(counts), "updated": len(changed), "deleted": len(garbage)}
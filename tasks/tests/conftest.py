@@ -0,0 +1,44 @@
+import pytest
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+
+from accounts.models import ApiToken
+from tasks.tests.factories import UserFactory
+
+
+@pytest.fixture
+def clear_cache():
+    """Starts from an empty cache: no cached permissions, pages or rate limits."""
+    cache.clear()
+
+
+def user_who_can_change_tasks(username):
+    user = UserFactory(username=username)
+    user.user_permissions.add(Permission.objects.get(codename="change_task"))
+    return user
+
+
+@pytest.fixture
+def editor(db):
+    return user_who_can_change_tasks("editor")
+
+
+@pytest.fixture
+def api_user(db, clear_cache):
+    """A user allowed to change tasks, starting with fresh rate limits."""
+    return user_who_can_change_tasks("api-user")
+
+
+@pytest.fixture
+def make_auth_headers(db):
+    """Builds bearer token headers for the given user."""
+
+    def make(user) -> dict[str, str]:
+        return {"Authorization": f"Bearer {ApiToken.objects.create(user=user).token}"}
+
+    return make
+
+
+@pytest.fixture
+def auth_headers(api_user, make_auth_headers):
+    return make_auth_headers(api_user)
@@ -0,0 +1,50 @@
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from tasks.tests.factories import TaskFactory
+
+
+@pytest.mark.django_db
+def test_token_api_request_skips_session_but_keeps_security_headers(client, auth_headers):
+    task = TaskFactory()
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(f"/api/v1/tasks/{task.id}", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["X-Frame-Options"] == "DENY"
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert "sessionid" not in response.cookies
+    assert not any("django_session" in query["sql"] for query in queries.captured_queries)
+
+
+@pytest.mark.django_db
+def test_token_api_request_is_exempt_from_csrf(auth_headers, api_user):
+    client = Client(enforce_csrf_checks=True)
+    task = TaskFactory(owner=None)
+
+    response = client.post(
+        "/api/v1/tasks/transitions",
+        {"ids": [task.id], "status": "DONE"},
+        content_type="application/json",
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_browser_requests_keep_csrf_protection(api_user):
+    client = Client(enforce_csrf_checks=True)
+    client.force_login(api_user)
+    task = TaskFactory(creator=api_user, owner=None)
+
+    response = client.post(
+        reverse("tasks:task-update", kwargs={"pk": task.pk}),
+        {"title": "Renamed", "description": ""},
+    )
+
+    assert response.status_code == 403
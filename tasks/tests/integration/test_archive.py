@@ -0,0 +1,67 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from tasks import services
+from tasks.enums import TaskChangeAction
+from tasks.models import ArchivedTask, Sprint, SubscribedEmail, Task, TaskChange, TaskStatus
+from tasks.tests.factories import TaskFactory
+
+
+@pytest.mark.django_db
+def test_archive_tasks_moves_old_archived_tasks_in_batches():
+    old = TaskFactory.create_batch(3, status=TaskStatus.ARCHIVED.value)
+    recent = TaskFactory(status=TaskStatus.ARCHIVED.value)
+    live = TaskFactory(status=TaskStatus.DONE.value)
+    sprint = Sprint.objects.create(
+        name="Sprint",
+        start_date=timezone.now().date(),
+        end_date=timezone.now().date() + timedelta(days=14),
+        creator=live.creator,
+    )
+    sprint.tasks.add(old[0])
+    Task.objects.filter(id__in=[task.id for task in old + [live]]).update(
+        updated_at=timezone.now() - timedelta(days=100)
+    )
+
+    moved = services.archive_tasks(timedelta(days=90), batch_size=2, max_batches=1)
+    assert moved == 2
+    moved = services.archive_tasks(timedelta(days=90), batch_size=2)
+    assert moved == 1
+
+    assert set(Task.objects.values_list("id", flat=True)) == {recent.id, live.id}
+    assert ArchivedTask.objects.count() == 3
+    assert ArchivedTask.objects.get(id=old[0].id).sprint_ids == [sprint.id]
+
+
+@pytest.mark.django_db
+def test_archive_tasks_deletes_rows_without_signals(django_assert_max_num_queries):
+    old = TaskFactory.create_batch(2, status=TaskStatus.ARCHIVED.value)
+    SubscribedEmail.objects.create(email="watcher@example.com", task=old[0])
+    task_ids = [task.id for task in old]
+    Task.objects.filter(id__in=task_ids).update(updated_at=timezone.now() - timedelta(days=100))
+    TaskChange.objects.all().delete()
+
+    # No per-task fetches or delete signals, whatever the batch size
+    with django_assert_max_num_queries(15):
+        assert services.archive_tasks(timedelta(days=90)) == 2
+
+    assert not Task.objects.filter(id__in=task_ids).exists()
+    assert not SubscribedEmail.objects.exists()
+    assert sorted(TaskChange.objects.values_list("task_id", "action")) == [
+        (task_id, TaskChangeAction.DELETED.value) for task_id in sorted(task_ids)
+    ]
+
+
+@pytest.mark.django_db
+def test_search_archived_tasks_reads_hot_and_cold_tables():
+    hot, cold = TaskFactory.create_batch(2, status=TaskStatus.ARCHIVED.value)
+    Task.objects.filter(id=cold.id).update(
+        updated_at=timezone.now() - timedelta(days=100)
+    )
+    services.archive_tasks(timedelta(days=90))
+
+    tasks = services.search_archived_tasks(timezone.now().date())
+
+    assert tasks.count() == 2
+    assert [task["id"] for task in tasks[0:5]] == [hot.id, cold.id]
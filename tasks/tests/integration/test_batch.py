@@ -0,0 +1,141 @@
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tasks import events, services
+from tasks.models import SubscribedEmail, Sprint, Task, TaskChange, TaskStatus, TaskTransition
+from tasks.tests.factories import TaskFactory, UserFactory
+
+
+def post_batch(client, headers, operations, atomic=False):
+    """(status, error) of each operation in the batch."""
+    response = client.post(
+        "/api/v1/tasks/batch",
+        {"operations": operations, "atomic": atomic},
+        content_type="application/json",
+        headers=headers,
+    )
+    assert response.status_code == 200, response.content
+    return [(item["status"], item["error"]) for item in response.json()]
+
+
+@pytest.mark.django_db
+def test_batch_reports_result_per_operation(client, auth_headers, api_user):
+    mine = TaskFactory(creator=api_user, owner=None, status=TaskStatus.UNASSIGNED.value)
+    taken = TaskFactory(creator=api_user, owner=UserFactory(username="other"))
+    doomed = TaskFactory(creator=api_user, owner=None)
+
+    results = post_batch(client, auth_headers, [
+        {"op": "update", "id": mine.id, "data": {"title": "Renamed", "description": ""}},
+        {"op": "claim", "id": mine.id},
+        {"op": "claim", "id": taken.id},
+        {"op": "delete", "id": doomed.id},
+        {"op": "delete", "id": 999999},
+        {"op": "update", "id": taken.id, "version": 99, "data": {"title": "x", "description": ""}},
+        {"op": "claim"},
+    ])
+
+    assert results == [
+        (200, None),
+        (200, None),
+        (400, "Task already claimed"),
+        (200, None),
+        (404, "Task not found."),
+        (412, "Task was modified by someone else"),
+        (400, "id is required"),
+    ]
+    mine.refresh_from_db()
+    assert (mine.title, mine.owner_id) == ("Renamed", api_user.id)
+    assert not Task.objects.filter(id=doomed.id).exists()
+
+
+@pytest.mark.django_db
+def test_creates_need_permission_and_run_as_one_insert(client, auth_headers, api_user):
+    operations = [
+        {"op": "create", "data": {"title": f"Task {number}", "description": ""}}
+        for number in range(20)
+    ]
+    assert post_batch(client, auth_headers, operations[:1]) == [
+        (403, "You don't have the required permission!")
+    ]
+
+    api_user.is_superuser = True
+    api_user.save()
+    with CaptureQueriesContext(connection) as queries:
+        results = post_batch(client, auth_headers, operations)
+
+    assert results == [(201, None)] * 20
+    inserts = [
+        query for query in queries.captured_queries
+        if query["sql"].startswith('INSERT INTO "tasks_task"')
+    ]
+    assert len(inserts) == 1
+    assert TaskChange.objects.filter(action="CREATED").count() == 20
+    assert TaskTransition.objects.filter(from_status=None, actor_id=api_user.id).count() == 20
+
+
+@pytest.mark.django_db
+def test_atomic_batch_applies_nothing_on_failure(client, auth_headers, api_user):
+    task = TaskFactory(creator=api_user, owner=None)
+
+    results = post_batch(
+        client,
+        auth_headers,
+        [{"op": "delete", "id": task.id}, {"op": "claim", "id": 999999}],
+        atomic=True,
+    )
+
+    assert [status for status, _ in results] == [424, 404]
+    assert Task.objects.filter(id=task.id).exists()
+
+
+@pytest.mark.django_db
+def test_batch_creates_share_the_create_rate_limit(client, auth_headers, api_user):
+    api_user.is_superuser = True
+    api_user.save()
+    operations = [
+        {"op": "create", "data": {"title": f"Task {number}", "description": ""}}
+        for number in range(101)
+    ]
+
+    results = post_batch(client, auth_headers, operations)
+
+    assert results[:100] == [(201, None)] * 100
+    assert results[100] == (429, "Task creation rate limit exceeded")
+    assert Task.objects.count() == 100
+
+
+@pytest.mark.django_db
+def test_deletes_cost_the_same_queries_for_any_number_of_tasks(
+    monkeypatch, django_capture_on_commit_callbacks
+):
+    published = []
+    monkeypatch.setattr(events, "publish", published.append)
+    sprint = Sprint.objects.create(
+        name="Sprint", start_date=date(2025, 3, 3), end_date=date(2025, 3, 14),
+        creator=UserFactory(username="planner"),
+    )
+
+    def delete(count):
+        tasks = TaskFactory.create_batch(count)
+        sprint.tasks.add(*tasks)
+        SubscribedEmail.objects.bulk_create(
+            SubscribedEmail(email="watcher@example.com", task=task) for task in tasks
+        )
+        task_ids = [task.id for task in tasks]
+        with CaptureQueriesContext(connection) as queries:
+            with django_capture_on_commit_callbacks(execute=True):
+                assert services.bulk_delete_tasks(task_ids + [999999]) == set(task_ids)
+        return task_ids, len(queries)
+
+    _, few = delete(2)
+    task_ids, many = delete(20)
+
+    assert many == few
+    assert not Task.objects.filter(id__in=task_ids).exists()
+    assert not SubscribedEmail.objects.exists()
+    assert TaskChange.objects.filter(task_id__in=task_ids, action="DELETED").count() == 20
+    assert published[-1].task_count == 20
+    assert published[-1].sprint_ids == [sprint.id]
@@ -0,0 +1,58 @@
+import pytest
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from tasks import services
+from tasks.tests.factories import TaskFactory
+
+
+def get_bulk(client, headers, params):
+    """The response and the number of queries it made on the task table."""
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/api/v1/tasks/bulk", params, headers=headers)
+    task_queries = [
+        query for query in queries.captured_queries if 'FROM "tasks_task"' in query["sql"]
+    ]
+    return response, len(task_queries)
+
+
+@pytest.mark.django_db
+def test_tasks_in_requested_order_with_missing_ids(client, auth_headers):
+    tasks = TaskFactory.create_batch(3, owner=None)
+    ids = [tasks[2].id, 999999, tasks[0].id, tasks[2].id]
+    params = {"ids": ",".join(map(str, ids)), "expand": "creator"}
+
+    response, task_queries = get_bulk(client, auth_headers, params)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [task["id"] for task in body["tasks"]] == [tasks[2].id, tasks[0].id]
+    assert body["tasks"][0]["creator"]["username"] == tasks[2].creator.username
+    assert body["missing"] == [999999]
+    assert task_queries == 1
+
+
+@pytest.mark.django_db
+def test_invalid_ids_are_rejected(client, auth_headers):
+    response, _ = get_bulk(client, auth_headers, {"ids": "1,two"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+@override_settings(TASK_CACHE_TIMEOUT=60)
+def test_cached_tasks_are_dropped_on_write(client, auth_headers):
+    task = TaskFactory(owner=None, title="Before")
+    params = {"ids": str(task.id)}
+    get_bulk(client, auth_headers, params)
+
+    response, task_queries = get_bulk(client, auth_headers, params)
+    assert task_queries == 0
+    assert response.json()["tasks"][0]["title"] == "Before"
+
+    services.update_task(task.id, {"title": "After"})
+
+    response, task_queries = get_bulk(client, auth_headers, params)
+    assert task_queries == 1
+    assert response.json()["tasks"][0]["title"] == "After"
@@ -0,0 +1,142 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from tasks import burndown, services
+from tasks.enums import TaskStatus
+from tasks.models import ArchivedSprintTask, ArchivedTask, Sprint, Task, TaskTransition
+from tasks.tests.factories import TaskFactory, UserFactory
+
+CODES = TaskTransition.STATUS_CODES
+MONDAY = date(2025, 3, 3)
+
+
+pytestmark = pytest.mark.usefixtures("clear_cache")
+
+
+def at(day: int, hour: int = 12) -> datetime:
+    start = MONDAY + timedelta(days=day)
+    return datetime(start.year, start.month, start.day, hour, tzinfo=timezone.utc)
+
+
+def make_task(user, created: int, *changes):
+    """A task created on day `created` going through (day, from, to) `changes`."""
+    task = TaskFactory(creator=user, owner=None, status=TaskStatus.UNASSIGNED.value)
+    status = changes[-1][2] if changes else TaskStatus.UNASSIGNED.value
+    Task.objects.filter(id=task.id).update(created_at=at(created, 9), status=status)
+    TaskTransition.objects.filter(task_id=task.id).update(at=at(created, 9))
+    TaskTransition.objects.bulk_create(
+        TaskTransition(
+            task_id=task.id,
+            from_status=CODES[from_status],
+            to_status=CODES[to_status],
+            at=at(day),
+        )
+        for day, from_status, to_status in changes
+    )
+    return task
+
+
+@pytest.fixture
+def sprint():
+    user = UserFactory(username="planner")
+    sprint = Sprint.objects.create(
+        name="Sprint 1", start_date=MONDAY, end_date=MONDAY + timedelta(days=4), creator=user
+    )
+    sprint.tasks.set([
+        # Done on day 1
+        make_task(user, -2, (1, "UNASSIGNED", "IN_PROGRESS"), (1, "IN_PROGRESS", "DONE")),
+        # Done on day 3, then archived
+        make_task(user, -1, (3, "UNASSIGNED", "DONE"), (4, "DONE", "ARCHIVED")),
+        # Added on day 2, never done
+        make_task(user, 2),
+        # Done before the sprint started
+        make_task(user, -3, (-1, "UNASSIGNED", "DONE")),
+    ])
+    return sprint
+
+
+@pytest.mark.django_db
+def test_burndown_series(sprint):
+    [result] = burndown.sprint_burndowns([sprint])
+
+    assert [day["remaining"] for day in result["burndown"]] == [2, 1, 2, 1, 1]
+    assert result["burndown"][0]["day"] == MONDAY
+    assert result["finished"]
+    assert (result["scope"], result["velocity"]) == (4, 2)
+
+
+@pytest.mark.django_db
+def test_running_sprint_is_computed_up_to_today(sprint):
+    result = burndown.compute([sprint], today=MONDAY + timedelta(days=1))[sprint.id]
+
+    assert [day["remaining"] for day in result["burndown"]] == [2, 1]
+    assert not result["finished"]
+
+
+@pytest.mark.django_db
+def test_many_sprints_in_constant_queries(sprint, django_assert_num_queries):
+    sprints = [sprint]
+    for number in range(2, 6):
+        other = Sprint.objects.create(
+            name=f"Sprint {number}",
+            start_date=MONDAY + timedelta(days=7 * number),
+            end_date=MONDAY + timedelta(days=7 * number + 4),
+            creator=sprint.creator,
+        )
+        other.tasks.set(sprint.tasks.all())
+        sprints.append(other)
+
+    with django_assert_num_queries(4):
+        results = burndown.sprint_burndowns(sprints)
+
+    assert [result["sprint_id"] for result in results] == [s.id for s in sprints]
+    # Finished sprints are cached for good
+    with django_assert_num_queries(0):
+        assert burndown.sprint_burndowns(sprints) == results
+
+
+@pytest.mark.django_db
+def test_archived_tasks_stay_in_burndown(sprint):
+    before = burndown.compute([sprint])[sprint.id]
+
+    assert services.archive_tasks(timedelta(0)) == 1
+    assert ArchivedTask.objects.get().sprint_ids == [sprint.id]
+    assert list(ArchivedSprintTask.objects.values_list("sprint_id", flat=True)) == [sprint.id]
+
+    assert burndown.compute([sprint])[sprint.id] == before
+
+
+@pytest.mark.django_db
+def test_membership_change_invalidates_cache(sprint):
+    burndown.sprint_burndowns([sprint])
+    task = sprint.tasks.filter(status=TaskStatus.UNASSIGNED.value).get()
+
+    task.sprints.remove(sprint)
+
+    [result] = burndown.sprint_burndowns([sprint])
+    assert result["scope"] == 3
+    assert [day["remaining"] for day in result["burndown"]] == [2, 1, 1, 0, 0]
+
+
+@pytest.mark.django_db
+def test_sprint_reports_api(client, sprint, make_auth_headers):
+    headers = make_auth_headers(sprint.creator)
+
+    response = client.get("/api/v1/reports/sprints", {"ids": [sprint.id]}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()[0]["burndown"][0] == {"day": "2025-03-03", "remaining": 2}
+
+    response = client.get("/api/v1/reports/sprints/velocity", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "sprint_id": sprint.id,
+            "name": "Sprint 1",
+            "start_date": "2025-03-03",
+            "end_date": "2025-03-07",
+            "finished": True,
+            "scope": 4,
+            "velocity": 2,
+        }
+    ]
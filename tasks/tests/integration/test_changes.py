@@ -0,0 +1,47 @@
+import pytest
+from tasks import services
+from tasks.enums import TaskChangeAction
+from tasks.tests.factories import TaskFactory
+
+
+@pytest.mark.django_db
+def test_change_feed_returns_only_latest_change_per_task():
+    task = TaskFactory()
+    other = TaskFactory()
+    task.title = "Renamed"
+    task.save()
+
+    feed = services.get_task_changes()
+
+    assert [change["task_id"] for change in feed["changes"]] == [other.id, task.id]
+    assert feed["changes"][1]["action"] == TaskChangeAction.UPDATED.value
+    assert feed["changes"][1]["task"].title == "Renamed"
+    assert feed["has_more"] is False
+
+
+@pytest.mark.django_db
+def test_change_feed_records_deletions():
+    task = TaskFactory()
+    task_id = task.id
+    token = services.get_task_changes()["next_token"]
+    services.delete_task(task_id)
+
+    feed = services.get_task_changes(since=token)
+
+    assert len(feed["changes"]) == 1
+    assert feed["changes"][0]["task_id"] == task_id
+    assert feed["changes"][0]["action"] == TaskChangeAction.DELETED.value
+    assert feed["changes"][0]["task"] is None
+
+
+@pytest.mark.django_db
+def test_change_feed_is_paginated_by_token():
+    TaskFactory.create_batch(3)
+
+    first = services.get_task_changes(limit=2)
+    second = services.get_task_changes(since=first["next_token"], limit=2)
+
+    assert len(first["changes"]) == 2
+    assert first["has_more"] is True
+    assert len(second["changes"]) == 1
+    assert second["has_more"] is False
@@ -0,0 +1,115 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from tasks import services
+from tasks.models import Task, TaskStatus
+from tasks.tests.factories import TaskFactory, UserFactory
+
+
+@pytest.mark.django_db
+def test_update_task_bumps_version_and_writes_changed_fields():
+    task = TaskFactory(title="Old")
+
+    updated = services.update_task(task.id, {"title": "New"}, expected_version=1)
+
+    task.refresh_from_db()
+    assert updated.version == task.version == 2
+    assert task.title == "New"
+
+
+@pytest.mark.django_db
+def test_update_task_rejects_stale_version():
+    task = TaskFactory()
+    services.update_task(task.id, {"title": "First"})
+
+    with pytest.raises(services.TaskVersionConflictException):
+        services.update_task(task.id, {"title": "Second"}, expected_version=1)
+
+
+@pytest.mark.django_db
+def test_claim_task_is_a_single_conditional_update():
+    task = TaskFactory(status=TaskStatus.UNASSIGNED.value, owner=None)
+    first, second = UserFactory(), UserFactory()
+
+    services.claim_task(first.id, task.id)
+    with pytest.raises(services.TaskAlreadyClaimedException):
+        services.claim_task(second.id, task.id)
+    with pytest.raises(Task.DoesNotExist):
+        services.claim_task(first.id, task.id + 1000)
+
+    task.refresh_from_db()
+    assert task.owner == first
+    assert task.status == TaskStatus.IN_PROGRESS.value
+    assert task.version == 2
+
+
+@pytest.mark.django_db
+def test_claim_update_only_requires_an_unowned_task():
+    task = TaskFactory(status=TaskStatus.UNASSIGNED.value, owner=None)
+
+    with CaptureQueriesContext(connection) as queries:
+        services.claim_task(UserFactory().id, task.id)
+
+    [update] = [
+        query["sql"] for query in queries.captured_queries
+        if query["sql"].startswith('UPDATE "tasks_task"')
+    ]
+    # A status changed since the read must not fail the claim
+    assert '"status" =' not in update.split("WHERE")[1]
+
+
+@pytest.mark.django_db
+def test_partial_save_bumps_version():
+    task = TaskFactory()
+
+    task.title = "Renamed"
+    task.save(update_fields=["title"])
+
+    assert task.version == Task.objects.get(pk=task.pk).version == 2
+    task.save()
+    assert task.version == Task.objects.get(pk=task.pk).version == 3
+
+
+@pytest.mark.django_db
+def test_put_missing_task_is_not_found(client, auth_headers):
+    response = client.put(
+        "/api/v1/tasks/999999",
+        {"title": "Edited", "description": "Edited"},
+        content_type="application/json",
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_put_honours_if_match(client, auth_headers):
+    task = TaskFactory()
+    url = f"/api/v1/tasks/{task.id}"
+    etag = client.get(url, headers=auth_headers)["ETag"]
+    body = {"title": "Edited", "description": "Edited"}
+
+    response = client.put(
+        url, body, content_type="application/json", headers={**auth_headers, "If-Match": etag}
+    )
+    assert response.status_code == 204
+    assert response["ETag"] == '"2"'
+
+    response = client.put(
+        url, body, content_type="application/json", headers={**auth_headers, "If-Match": etag}
+    )
+    assert response.status_code == 412
+
+
+@pytest.mark.django_db
+def test_claim_next_tasks_takes_oldest_unassigned_tasks():
+    worker = UserFactory()
+    first, second, third = TaskFactory.create_batch(
+        3, status=TaskStatus.UNASSIGNED.value, owner=None
+    )
+    TaskFactory(status=TaskStatus.IN_PROGRESS.value, owner=UserFactory())
+
+    assert services.claim_next_tasks(worker.id, limit=2) == [first.id, second.id]
+    assert services.claim_next_tasks(worker.id, limit=2) == [third.id]
+    assert services.claim_next_tasks(worker.id, limit=2) == []
+    assert Task.objects.filter(owner=worker).count() == 3
@@ -0,0 +1,65 @@
+import pytest
+from django.core.files.base import ContentFile
+from tasks.tests.factories import TaskFactory, UserFactory
+
+
+@pytest.fixture
+def task_with_file(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    task = TaskFactory()
+    task.file_upload.save("report.txt", ContentFile(b"0123456789"))
+    return task
+
+
+@pytest.fixture
+def url(client, task_with_file):
+    client.force_login(UserFactory())
+    return f"/tasks/{task_with_file.id}/attachments/file/"
+
+
+@pytest.mark.django_db
+def test_download_streams_whole_file(client, url):
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content) == b"0123456789"
+    assert response["Accept-Ranges"] == "bytes"
+
+
+@pytest.mark.django_db
+def test_download_serves_byte_ranges(client, url):
+    response = client.get(url, HTTP_RANGE="bytes=2-5")
+
+    assert response.status_code == 206
+    assert b"".join(response.streaming_content) == b"2345"
+    assert response["Content-Range"] == "bytes 2-5/10"
+
+    response = client.get(url, HTTP_RANGE="bytes=-3")
+    assert b"".join(response.streaming_content) == b"789"
+
+    response = client.get(url, HTTP_RANGE="bytes=20-")
+    assert response.status_code == 416
+
+
+@pytest.mark.django_db
+def test_download_honours_conditional_requests(client, url):
+    etag = client.get(url)["ETag"]
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+
+@pytest.mark.django_db
+def test_download_can_hand_off_to_web_server(client, url, settings, task_with_file):
+    settings.TASK_ATTACHMENT_SENDFILE = "X-Accel-Redirect"
+
+    response = client.get(url)
+
+    assert response["X-Accel-Redirect"] == f"/protected/{task_with_file.file_upload.name}"
+    assert response.content == b""
+
+
+@pytest.mark.django_db
+def test_download_keeps_the_uploaded_file_name(client, url):
+    response = client.get(url)
+
+    assert response["Content-Disposition"] == 'inline; filename="report.txt"'
@@ -0,0 +1,45 @@
+import pytest
+from django.template.loader import render_to_string
+from tasks.tests.factories import TaskFactory, UserFactory
+
+
+pytestmark = pytest.mark.usefixtures("clear_cache")
+
+
+@pytest.mark.django_db
+def test_task_card_is_served_from_cache_until_the_task_changes(django_assert_num_queries):
+    task = TaskFactory(owner=UserFactory(username="alice"))
+    render_to_string("tasks/_task_card.html", {"task": task})
+
+    task.title = "Changed behind the cache's back"
+    with django_assert_num_queries(0):
+        html = render_to_string("tasks/_task_card.html", {"task": task})
+    assert "Changed" not in html
+
+    task.save()
+    assert "Changed" in render_to_string("tasks/_task_card.html", {"task": task})
+
+
+@pytest.mark.django_db
+def test_renaming_owner_invalidates_cards():
+    owner = UserFactory(username="alice")
+    task = TaskFactory(owner=owner)
+    render_to_string("tasks/_task_card.html", {"task": task})
+
+    owner.username = "bob"
+    owner.save()
+
+    task.refresh_from_db()
+    assert "bob" in render_to_string("tasks/_task_card.html", {"task": task})
+
+
+@pytest.mark.django_db
+def test_task_list_is_paginated(client):
+    user = UserFactory(is_superuser=True)
+    client.force_login(user)
+    TaskFactory.create_batch(30, creator=user, owner=None)
+
+    response = client.get("/tasks/?page=2")
+
+    assert response.status_code == 200
+    assert len(response.context["tasks"]) == 5
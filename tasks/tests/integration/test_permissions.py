@@ -0,0 +1,62 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts import permissions
+from tasks.tests.factories import TaskFactory, UserFactory
+
+
+pytestmark = pytest.mark.usefixtures("clear_cache")
+
+
+@pytest.mark.django_db
+def test_permission_set_is_cached_across_requests(editor, django_assert_num_queries):
+    assert permissions.has_perm(editor, "tasks.change_task")
+
+    # A fresh instance, as loaded by the next request
+    user = get_user_model().objects.get(pk=editor.pk)
+    with django_assert_num_queries(0):
+        assert user.has_perm("tasks.change_task")
+        assert not user.has_perm("tasks.delete_task")
+
+
+@pytest.mark.django_db
+def test_group_permission_change_invalidates_cache(editor):
+    group = Group.objects.create(name="cleaners")
+    editor.groups.add(group)
+    assert not permissions.has_perm(editor, "tasks.delete_task")
+
+    group.permissions.add(Permission.objects.get(codename="delete_task"))
+
+    user = get_user_model().objects.get(pk=editor.pk)
+    assert permissions.has_perm(user, "tasks.delete_task")
+
+
+@pytest.mark.django_db
+def test_update_view_fetches_task_once(client, editor):
+    task = TaskFactory(creator=editor, owner=None)
+    client.force_login(editor)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("tasks:task-update", kwargs={"pk": task.pk}))
+
+    assert response.status_code == 200
+    task_selects = [
+        query["sql"]
+        for query in queries.captured_queries
+        if query["sql"].startswith("SELECT") and 'FROM "tasks_task"' in query["sql"]
+    ]
+    assert len(task_selects) == 1
+
+
+@pytest.mark.django_db
+def test_update_view_rejects_other_users(client, editor):
+    task = TaskFactory(creator=UserFactory(username="someone"), owner=None)
+    client.force_login(editor)
+
+    response = client.get(reverse("tasks:task-update", kwargs={"pk": task.pk}))
+
+    assert response.status_code == 403
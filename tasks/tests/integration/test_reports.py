@@ -0,0 +1,135 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from tasks import reports, services
+from tasks.enums import ReportPeriod, TaskStatus
+from tasks.models import Task, TaskDailyStats
+from tasks.tests.factories import TaskFactory, UserFactory
+
+
+def at(day: date, hour: int = 12) -> datetime:
+    return datetime(day.year, day.month, day.day, hour, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def history():
+    """Tasks created and completed over the week starting Monday 2025-03-03."""
+    alice, bob = UserFactory(username="alice"), UserFactory(username="bob")
+    monday = date(2025, 3, 3)
+    rows = [
+        # (created, completed, owner)
+        (monday, monday, alice),
+        (monday, monday + timedelta(days=2), alice),
+        (monday + timedelta(days=1), monday + timedelta(days=8), bob),
+        (monday + timedelta(days=1), None, None),
+    ]
+    for created, completed, owner in rows:
+        task = TaskFactory(creator=alice, owner=owner, status=TaskStatus.UNASSIGNED.value)
+        Task.objects.filter(id=task.id).update(
+            created_at=at(created, 9),
+            completed_at=at(completed, 17) if completed else None,
+            status=TaskStatus.DONE.value if completed else TaskStatus.UNASSIGNED.value,
+        )
+    return monday, alice, bob
+
+
+@pytest.mark.django_db
+def test_completed_at_follows_status():
+    task = TaskFactory(status=TaskStatus.IN_PROGRESS.value, owner=None)
+    assert task.completed_at is None
+
+    task = services.update_task(task.id, {"status": TaskStatus.DONE.value})
+    task.refresh_from_db()
+    assert task.completed_at is not None
+
+    services.bulk_transition_tasks([task.id], TaskStatus.IN_PROGRESS)
+    task.refresh_from_db()
+    assert task.completed_at is None
+
+    task.status = TaskStatus.DONE.value
+    task.save()
+    assert task.completed_at is not None
+
+
+@pytest.mark.django_db
+def test_daily_throughput(history):
+    monday, _, _ = history
+
+    series = reports.throughput(monday, monday + timedelta(days=2))
+
+    assert series == [
+        {"period": monday, "created": 2, "completed": 1, "avg_cycle_seconds": 8 * 3600},
+        {"period": monday + timedelta(days=1), "created": 2, "completed": 0, "avg_cycle_seconds": None},
+        {
+            "period": monday + timedelta(days=2),
+            "created": 0,
+            "completed": 1,
+            "avg_cycle_seconds": (2 * 24 + 8) * 3600,
+        },
+    ]
+
+
+@pytest.mark.django_db
+def test_rollup_gives_the_same_reports(history):
+    monday, _, _ = history
+    end = monday + timedelta(days=13)
+    live_daily = reports.throughput(monday, end)
+    live_weekly = reports.throughput(monday, end, ReportPeriod.WEEK)
+    live_owners = reports.owner_throughput(monday, end)
+
+    # Roll up part of the range; the rest is still aggregated live
+    assert reports.rollup_daily_stats(monday, monday + timedelta(days=5)) > 0
+    assert reports.watermark() == monday + timedelta(days=2)
+
+    assert reports.throughput(monday, end) == live_daily
+    assert reports.throughput(monday, end, ReportPeriod.WEEK) == live_weekly
+    assert reports.owner_throughput(monday, end) == live_owners
+
+
+@pytest.mark.django_db
+def test_weekly_and_owner_throughput(history):
+    monday, alice, bob = history
+    end = monday + timedelta(days=13)
+
+    weekly = reports.throughput(monday, end, ReportPeriod.WEEK)
+    owners = reports.owner_throughput(monday, end)
+
+    assert [(row["period"], row["created"], row["completed"]) for row in weekly] == [
+        (monday, 4, 2),
+        (monday + timedelta(days=7), 0, 1),
+    ]
+    assert [(row["owner_id"], row["username"], row["completed"]) for row in owners] == [
+        (alice.id, "alice", 2),
+        (bob.id, "bob", 1),
+    ]
+
+
+@pytest.mark.django_db
+def test_rollup_is_incremental(history):
+    monday, _, _ = history
+    reports.rollup_daily_stats(monday, monday + timedelta(days=8))
+    TaskDailyStats.objects.filter(day=monday).update(created=99)
+
+    # Recomputes from the lookback window before the watermark only
+    reports.rollup_daily_stats(end=monday + timedelta(days=9))
+
+    assert TaskDailyStats.objects.get(day=monday, user_id__gt=0, created__gt=0).created == 99
+
+
+@pytest.mark.django_db
+def test_reports_api(client, history, make_auth_headers):
+    monday, alice, _ = history
+    headers = make_auth_headers(alice)
+
+    response = client.get(
+        "/api/v1/reports/throughput",
+        {"start": monday, "end": monday + timedelta(days=6), "period": "week"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.json()[0]["created"] == 4
+
+    response = client.get(
+        "/api/v1/reports/owners", {"start": monday, "end": monday - timedelta(days=1)}, headers=headers
+    )
+    assert response.status_code == 400
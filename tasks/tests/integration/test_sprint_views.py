@@ -0,0 +1,75 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.http import Http404
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks import services
+from tasks.models import Sprint
+from tasks.tests.factories import TaskFactory
+
+
+pytestmark = pytest.mark.usefixtures("clear_cache")
+
+
+def make_sprint(creator, start_offset, end_offset):
+    today = timezone.localdate()
+    return Sprint.objects.create(
+        name="Sprint",
+        creator=creator,
+        start_date=today + timedelta(days=start_offset),
+        end_date=today + timedelta(days=end_offset),
+    )
+
+
+def selects_from(queries, table):
+    return [
+        query["sql"]
+        for query in queries.captured_queries
+        if query["sql"].startswith("SELECT") and f'FROM "{table}"' in query["sql"]
+    ]
+
+
+@pytest.mark.django_db
+def test_update_with_sprint_fetches_each_row_once(client, editor):
+    task = TaskFactory(creator=editor, owner=None)
+    sprint = make_sprint(editor, -1, 1)
+    client.force_login(editor)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(
+            reverse("tasks:task-update", kwargs={"pk": task.pk}),
+            {"title": "Renamed", "description": "", "sprint": sprint.pk},
+        )
+
+    assert response.status_code == 302
+    assert len(selects_from(queries, "tasks_task")) == 1
+    assert len(selects_from(queries, "tasks_sprint")) == 1
+
+
+@pytest.mark.django_db
+def test_update_outside_sprint_range_is_rejected(client, editor):
+    task = TaskFactory(creator=editor, owner=None)
+    sprint = make_sprint(editor, 5, 10)
+    client.force_login(editor)
+
+    response = client.post(
+        reverse("tasks:task-update", kwargs={"pk": task.pk}),
+        {"title": "Renamed", "description": "", "sprint": sprint.pk},
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_sprint_range_check_for_new_and_missing(editor):
+    sprint = make_sprint(editor, -1, 1)
+
+    assert services.can_add_task_to_sprint(None, sprint.pk)
+    with pytest.raises(Http404):
+        services.can_add_task_to_sprint(None, sprint.pk + 1)
+    with pytest.raises(Http404):
+        services.can_add_task_to_sprint(None, "not-a-sprint")
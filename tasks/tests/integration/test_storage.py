@@ -0,0 +1,58 @@
+from datetime import timedelta
+
+import pytest
+from django.core.files.base import ContentFile
+from django.utils import timezone
+from tasks.models import AttachmentBlob
+from tasks.storage import collect_blobs
+from tasks.tests.factories import TaskFactory
+
+
+@pytest.mark.django_db
+def test_identical_attachments_share_one_blob(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    first, second = TaskFactory.create_batch(2)
+
+    first.file_upload.save("spec.pdf", ContentFile(b"same content"))
+    second.file_upload.save("copy-of-spec.pdf", ContentFile(b"same content"))
+
+    assert first.file_upload.name == second.file_upload.name
+    assert (first.file_upload_name, second.file_upload_name) == ("spec.pdf", "copy-of-spec.pdf")
+    assert first.file_upload.name.startswith("blobs/")
+    assert len(list(tmp_path.rglob("*.pdf"))) == 1
+    assert AttachmentBlob.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_collect_blobs_deletes_unreferenced_blobs(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    kept, dropped = TaskFactory.create_batch(2)
+    kept.file_upload.save("a.txt", ContentFile(b"a"))
+    dropped.file_upload.save("b.txt", ContentFile(b"b"))
+    dropped.delete()
+
+    assert collect_blobs(timedelta(hours=1))["deleted"] == 0
+
+    stats = collect_blobs(timedelta(0))
+
+    assert stats == {"referenced": 1, "updated": 0, "deleted": 1}
+    assert AttachmentBlob.objects.get().ref_count == 1
+    assert [path.name for path in tmp_path.rglob("*.txt")] == [
+        kept.file_upload.name.rsplit("/", 1)[1]
+    ]
+
+
+@pytest.mark.django_db
+def test_saving_known_content_again_keeps_the_blob(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    first, second = TaskFactory.create_batch(2)
+    first.file_upload.save("a.txt", ContentFile(b"a"))
+    first.delete()
+    yesterday = timezone.now() - timedelta(days=1)
+    AttachmentBlob.objects.update(created_at=yesterday, last_seen_at=yesterday)
+
+    # Uploaded again while unreferenced, just before the task is saved
+    second.file_upload.save("again.txt", ContentFile(b"a"), save=False)
+
+    assert collect_blobs(timedelta(hours=1))["deleted"] == 0
+    assert second.file_upload.storage.exists(second.file_upload.name)
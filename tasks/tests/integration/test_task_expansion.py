@@ -0,0 +1,75 @@
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tasks.models import Epic, Sprint
+from tasks.tests.factories import TaskFactory, UserFactory
+
+
+def make_tasks(user, count):
+    epic = Epic.objects.create(name="Epic", creator=user)
+    sprint = Sprint.objects.create(
+        name="Sprint", start_date=date(2025, 3, 3), end_date=date(2025, 3, 7), creator=user
+    )
+    owner = UserFactory(username=f"owner-{count}")
+    tasks = [TaskFactory(creator=user, owner=owner) for _ in range(count)]
+    epic.tasks.set(tasks)
+    sprint.tasks.set(tasks)
+    return tasks
+
+
+def count_queries(client, headers, params):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/api/v1/tasks/", params, headers=headers)
+    assert response.status_code == 200
+    return len(queries), response.json()["items"]
+
+
+@pytest.mark.django_db
+def test_expanded_list_costs_constant_queries(client, api_user, auth_headers):
+    make_tasks(api_user, 1)
+    params = {"expand": "owner,creator,epics,sprints", "limit": 20}
+    few, _ = count_queries(client, auth_headers, params)
+
+    make_tasks(api_user, 9)
+    many, items = count_queries(client, auth_headers, params)
+
+    assert many == few
+    assert len(items) == 10
+    assert items[-1]["owner"]["username"] == "owner-9"
+    assert items[-1]["creator"]["username"] == "api-user"
+    assert [epic["name"] for epic in items[-1]["epics"]] == ["Epic"]
+    assert items[-1]["sprints"][0]["start_date"] == "2025-03-03"
+
+
+@pytest.mark.django_db
+def test_related_objects_only_when_expanded(client, api_user, auth_headers):
+    [task] = make_tasks(api_user, 1)
+
+    response = client.get(f"/api/v1/tasks/{task.id}", {"expand": "owner"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["owner"]["username"] == "owner-1"
+    assert body["creator"] is None and body["epics"] is None
+
+
+@pytest.mark.django_db
+def test_unknown_expansion_is_rejected(client, auth_headers):
+    response = client.get("/api/v1/tasks/", {"expand": "watchers"}, headers=auth_headers)
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_task_list_pages_with_limit_and_offset(client, api_user, auth_headers):
+    tasks = make_tasks(api_user, 8)
+
+    response = client.get("/api/v1/tasks/", {"limit": 7, "offset": 1}, headers=auth_headers)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 8
+    assert [item["id"] for item in body["items"]] == [task.id for task in tasks[1:]]
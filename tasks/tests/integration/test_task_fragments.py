@@ -0,0 +1,22 @@
+import pytest
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+
+from tasks.tests.factories import TaskFactory, UserFactory
+
+
+def card_key(task):
+    return make_template_fragment_key("task_card", [task.id, task.version])
+
+
+@pytest.mark.django_db
+def test_deleting_owner_drops_cached_cards():
+    owner = UserFactory(username="leaving")
+    task = TaskFactory(owner=owner)
+    cache.set(card_key(task), "leaving")
+
+    owner.delete()
+
+    task.refresh_from_db()
+    assert task.owner_id is None
+    assert cache.get(card_key(task)) is None
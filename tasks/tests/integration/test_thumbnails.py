@@ -0,0 +1,63 @@
+import io
+
+import pytest
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.test import override_settings
+from PIL import Image
+from tasks import services, thumbnails
+from tasks.models import Task
+from tasks.tests.factories import TaskFactory
+
+
+def png(width, height):
+    output = io.BytesIO()
+    Image.new("RGB", (width, height), "teal").save(output, "PNG")
+    return ContentFile(output.getvalue())
+
+
+@pytest.mark.django_db
+def test_thumbnails_are_stored_by_content_hash(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    first, second = TaskFactory.create_batch(2)
+    first.image_upload.save("cat.png", png(1200, 800))
+    second.image_upload.save("same-cat.png", png(1200, 800))
+
+    for task in (first, second):
+        thumbnails._process(Task, task.pk, "image_upload", "image_sha256", task.image_upload.name)
+        task.refresh_from_db()
+
+    assert first.image_sha256 == second.image_sha256
+    assert set(first.image_thumbnails) == {"small", "medium"}
+    assert len(list((tmp_path / "thumbnails").rglob("*.jpg"))) == 2
+    with Image.open(tmp_path / thumbnails.thumbnail_name(first.image_sha256, "small")) as small:
+        assert small.size == (64, 43)
+
+
+@pytest.mark.django_db
+def test_new_image_resets_digest(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    task = TaskFactory(image_sha256="stale")
+
+    task.image_upload.save("cat.png", png(10, 10))
+
+    task.refresh_from_db()
+    assert task.image_sha256 == ""
+    assert task.image_thumbnails == {}
+
+
+@pytest.mark.django_db
+@override_settings(TASK_CACHE_TIMEOUT=60)
+def test_new_digest_drops_the_cached_task(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    cache.clear()
+    task = TaskFactory()
+    task.image_upload.save("cat.png", png(100, 100))
+    assert services.get_tasks([task.pk])[task.pk].image_thumbnails == {}
+
+    thumbnails._process(
+        Task, task.pk, "image_upload", "image_sha256", task.image_upload.name,
+        on_saved=services.forget_task,
+    )
+
+    assert set(services.get_tasks([task.pk])[task.pk].image_thumbnails) == {"small", "medium"}
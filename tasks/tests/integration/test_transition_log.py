@@ -0,0 +1,85 @@
+import pytest
+from django.contrib.admin.sites import site
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from tasks import services
+from tasks.admin import TaskAdmin
+from tasks.models import Task, TaskStatus, TaskTransition
+from tasks.tests.factories import TaskFactory, UserFactory
+
+CODES = TaskTransition.STATUS_CODES
+
+
+def logged(task_id):
+    return list(
+        TaskTransition.objects.filter(task_id=task_id)
+        .order_by("id")
+        .values_list("from_status", "to_status", "actor_id")
+    )
+
+
+@pytest.mark.django_db
+def test_creation_and_saves_are_logged():
+    task = TaskFactory(status=TaskStatus.UNASSIGNED.value, owner=None)
+    task.title = "Renamed"
+    task.save()
+    task = Task.objects.get(pk=task.pk)
+    task.status = TaskStatus.DONE.value
+    task.save()
+
+    assert logged(task.id) == [
+        (None, CODES["UNASSIGNED"], None),
+        (CODES["UNASSIGNED"], CODES["DONE"], None),
+    ]
+
+
+@pytest.mark.django_db
+def test_admin_change_form_records_actor():
+    user = UserFactory(username="admin")
+    task = TaskFactory(status=TaskStatus.UNASSIGNED.value, owner=None)
+    request = RequestFactory().post("/admin/tasks/task/")
+    request.user = user
+
+    task = Task.objects.get(pk=task.pk)
+    task.status = TaskStatus.DONE.value
+    TaskAdmin(Task, site).save_model(request, task, form=None, change=True)
+
+    assert logged(task.id)[-1] == (CODES["UNASSIGNED"], CODES["DONE"], user.id)
+
+
+@pytest.mark.django_db
+def test_service_transitions_record_actor():
+    user = UserFactory(username="claimer")
+    task = TaskFactory(status=TaskStatus.UNASSIGNED.value, owner=None)
+
+    services.claim_task(user.id, task.id)
+    services.update_task(task.id, {"status": TaskStatus.DONE.value}, actor_id=user.id)
+    services.update_task(task.id, {"title": "No status change"}, actor_id=user.id)
+
+    assert logged(task.id)[1:] == [
+        (CODES["UNASSIGNED"], CODES["IN_PROGRESS"], user.id),
+        (CODES["IN_PROGRESS"], CODES["DONE"], user.id),
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_transition_logs_in_one_insert():
+    tasks = [
+        TaskFactory(status=TaskStatus.DONE.value),
+        TaskFactory(status=TaskStatus.IN_PROGRESS.value),
+        TaskFactory(status=TaskStatus.ARCHIVED.value),
+    ]
+
+    with CaptureQueriesContext(connection) as queries:
+        services.bulk_transition_tasks([task.id for task in tasks], TaskStatus.ARCHIVED, actor_id=7)
+
+    inserts = [
+        query for query in queries.captured_queries
+        if query["sql"].startswith('INSERT INTO "tasks_tasktransition"')
+    ]
+    assert len(inserts) == 1
+    assert logged(tasks[0].id)[1:] == [(CODES["DONE"], CODES["ARCHIVED"], 7)]
+    assert logged(tasks[1].id)[1:] == [(CODES["IN_PROGRESS"], CODES["ARCHIVED"], 7)]
+    assert logged(tasks[2].id)[1:] == []
@@ -0,0 +1,40 @@
+import pytest
+from tasks import services
+from tasks.enums import TaskTransitionResult
+from tasks.models import Task, TaskChange, TaskStatus
+from tasks.tests.factories import TaskFactory
+
+
+@pytest.mark.django_db
+def test_bulk_transition_reports_result_per_task():
+    done = TaskFactory(status=TaskStatus.DONE.value)
+    archived = TaskFactory(status=TaskStatus.ARCHIVED.value)
+    token = TaskChange.objects.latest("id").id
+
+    results = services.bulk_transition_tasks(
+        [done.id, archived.id, 999999], TaskStatus.ARCHIVED
+    )
+
+    assert results == {
+        done.id: TaskTransitionResult.TRANSITIONED,
+        archived.id: TaskTransitionResult.NOT_ALLOWED,
+        999999: TaskTransitionResult.NOT_FOUND,
+    }
+    done.refresh_from_db()
+    assert done.status == TaskStatus.ARCHIVED.value
+    assert done.version == 2
+    assert list(
+        TaskChange.objects.filter(id__gt=token).values_list("task_id", flat=True)
+    ) == [done.id]
+
+
+@pytest.mark.django_db
+def test_bulk_transition_validates_transitions_in_sql():
+    tasks = TaskFactory.create_batch(3, status=TaskStatus.ARCHIVED.value)
+
+    results = services.bulk_transition_tasks(
+        [task.id for task in tasks], TaskStatus.DONE
+    )
+
+    assert set(results.values()) == {TaskTransitionResult.NOT_ALLOWED}
+    assert Task.objects.filter(status=TaskStatus.ARCHIVED.value).count() == 3
@@ -0,0 +1,117 @@
+import hashlib
+import io
+
+import pytest
+from tasks import uploads
+from tasks.models import UploadSession
+from tasks.tests.factories import TaskFactory
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+@pytest.mark.django_db
+def test_chunked_upload_resumes_and_attaches_file(client, auth_headers, media_root):
+    task = TaskFactory()
+    content = b"0123456789" * 100
+    response = client.post(
+        f"/api/v1/tasks/{task.id}/uploads",
+        {
+            "filename": "data.bin",
+            "size": len(content),
+            "sha256": hashlib.sha256(content).hexdigest(),
+        },
+        content_type="application/json",
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    url = f"/api/v1/tasks/uploads/{response.json()['id']}"
+
+    def put(offset, chunk):
+        return client.put(
+            f"{url}?offset={offset}",
+            chunk,
+            content_type="application/octet-stream",
+            headers=auth_headers,
+        )
+
+    assert put(0, content[:600]).json()["received"] == 600
+    # A retry of an already stored chunk is rejected with the resume point
+    assert put(0, content[:600]).status_code == 409
+    assert client.get(url, headers=auth_headers).json()["received"] == 600
+    assert put(600, content[600:]).json()["received"] == len(content)
+
+    response = client.post(f"{url}/complete", headers=auth_headers)
+
+    assert response.status_code == 200
+    task.refresh_from_db()
+    assert task.file_upload.name == response.json()["name"]
+    assert task.file_upload.read() == content
+    assert task.file_upload_name == "data.bin"
+    assert not any(media_root.rglob("*.part"))
+
+
+@pytest.mark.django_db
+def test_chunked_upload_rejects_hash_mismatch(client, auth_headers, media_root):
+    task = TaskFactory()
+    response = client.post(
+        f"/api/v1/tasks/{task.id}/uploads",
+        {"filename": "data.bin", "size": 4, "sha256": "0" * 64},
+        content_type="application/json",
+        headers=auth_headers,
+    )
+    url = f"/api/v1/tasks/uploads/{response.json()['id']}"
+    client.put(
+        f"{url}?offset=0", b"abcd", content_type="application/octet-stream", headers=auth_headers
+    )
+
+    response = client.post(f"{url}/complete", headers=auth_headers)
+
+    assert response.status_code == 422
+    task.refresh_from_db()
+    assert not task.file_upload
+
+
+@pytest.mark.django_db
+def test_completing_twice_keeps_the_attachment(client, auth_headers, media_root):
+    task = TaskFactory()
+    response = client.post(
+        f"/api/v1/tasks/{task.id}/uploads",
+        {"filename": "data.bin", "size": 4},
+        content_type="application/json",
+        headers=auth_headers,
+    )
+    url = f"/api/v1/tasks/uploads/{response.json()['id']}"
+    client.put(
+        f"{url}?offset=0", b"abcd", content_type="application/octet-stream", headers=auth_headers
+    )
+    assert client.post(f"{url}/complete", headers=auth_headers).status_code == 200
+    task.refresh_from_db()
+    name, version = task.file_upload.name, task.version
+
+    response = client.post(f"{url}/complete", headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Upload is already complete."
+    task.refresh_from_db()
+    assert (task.file_upload.name, task.version) == (name, version)
+    assert task.file_upload.read() == b"abcd"
+
+
+@pytest.mark.django_db
+def test_concurrent_completion_is_claimed_once(media_root):
+    task = TaskFactory()
+    session = uploads.start_upload(task, task.creator, "file_upload", "data.bin", 4)
+    uploads.append_chunk(session, 0, io.BytesIO(b"abcd"), 4)
+    # Both requests loaded the session before either completed it
+    stale = UploadSession.objects.get(id=session.id)
+
+    uploads.complete_upload(session)
+    with pytest.raises(uploads.UploadError, match="already complete"):
+        uploads.complete_upload(stale)
+
+    task.refresh_from_db()
+    assert task.file_upload.read() == b"abcd"
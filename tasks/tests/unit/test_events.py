@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from tasks import events
+from tasks.enums import TaskEventType, TaskStatus
+from tasks.events import EventHub, LocalBroadcaster, SQLiteBroadcaster, TaskEvent
+from tasks.models import Sprint
+from tasks.tests.factories import TaskFactory
+
+
+def test_subscribers_only_receive_matching_events():
+    async def scenario():
+        hub = EventHub()
+        broadcaster = LocalBroadcaster(hub)
+        sprint_board = hub.subscribe(sprint=1)
+        owner_board = hub.subscribe(owner=7)
+
+        broadcaster.publish(TaskEvent(TaskEventType.CLAIMED, 10, owner_id=7))
+        broadcaster.publish(TaskEvent(TaskEventType.UPDATED, 11, sprint_ids=[1, 2]))
+
+        assert (await sprint_board.get(timeout=1)).task_id == 11
+        assert (await owner_board.get(timeout=1)).task_id == 10
+        assert await owner_board.get(timeout=0.01) is None
+
+    asyncio.run(scenario())
+
+
+def test_closed_subscription_stops_receiving():
+    async def scenario():
+        hub = EventHub()
+        subscription = hub.subscribe()
+        subscription.close()
+        hub.dispatch(TaskEvent(TaskEventType.CREATED, 1))
+        assert await subscription.get(timeout=0.01) is None
+
+    asyncio.run(scenario())
+
+
+def test_sqlite_broadcaster_delivers_across_instances(tmp_path):
+    async def scenario():
+        path = tmp_path / "events.sqlite3"
+        listening_hub = EventHub()
+        listener = SQLiteBroadcaster(listening_hub, path=path, poll_interval=0.01)
+        subscription = listening_hub.subscribe()
+        listener.start()
+        await asyncio.sleep(0.05)
+
+        SQLiteBroadcaster(EventHub(), path=path).publish(
+            TaskEvent(TaskEventType.DELETED, 5, status="DONE")
+        )
+
+        event = await subscription.get(timeout=2)
+        assert event == TaskEvent(TaskEventType.DELETED, 5, status="DONE")
+
+    asyncio.run(scenario())
+
+
+def test_subscriber_with_closed_loop_is_dropped():
+    hub = EventHub()
+
+    async def subscribe():
+        return hub.subscribe()
+
+    loop = asyncio.new_event_loop()
+    subscription = loop.run_until_complete(subscribe())
+    loop.close()
+
+    hub.dispatch(TaskEvent(TaskEventType.CREATED, 1))
+
+    assert subscription not in hub._subscriptions
+
+
+def test_event_stream_needs_asgi(client):
+    response = client.get("/tasks/events/")
+
+    assert response.status_code == 501
+
+
+@pytest.mark.django_db
+def test_bulk_event_caps_listed_task_ids(monkeypatch, django_capture_on_commit_callbacks):
+    published = []
+    monkeypatch.setattr(events, "publish", published.append)
+    monkeypatch.setattr(events, "MAX_EVENT_TASK_IDS", 2)
+    monkeypatch.setattr(events, "LOOKUP_CHUNK_SIZE", 2)
+    tasks = TaskFactory.create_batch(3)
+    sprint = Sprint.objects.create(
+        name="Sprint", start_date="2025-01-01", end_date="2025-01-14", creator=tasks[0].creator
+    )
+    sprint.tasks.add(tasks[2])
+    task_ids = [task.id for task in tasks]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        events.publish_bulk_task_event(TaskEventType.TRANSITIONED, task_ids, TaskStatus.DONE.value)
+
+    [event] = published
+    assert event.task_ids == task_ids[:2]
+    assert event.task_count == 3
+    assert event.sprint_ids == [sprint.id]
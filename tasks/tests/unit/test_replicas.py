@@ -0,0 +1,116 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from taskmanager import routers
+from tasks.middlewares import ReplicaStickinessMiddleware
+from tasks.models import Task
+
+
+@pytest.fixture
+def request_context():
+    tokens = routers.start_request()
+    yield
+    routers.end_request(tokens)
+
+
+@override_settings(DATABASE_REPLICAS=["replica1"])
+def test_reads_use_replica_until_write(request_context):
+    router = routers.ReplicaRouter()
+    assert routers.read_db() == "replica1"
+
+    assert router.db_for_write(Task) == "default"
+
+    assert routers.read_db() == "default"
+
+
+@override_settings(DATABASE_REPLICAS=[])
+def test_reads_use_primary_without_replicas(request_context):
+    assert routers.read_db() == "default"
+
+
+@override_settings(DATABASE_REPLICAS=["replica1"])
+def test_related_reads_follow_instance(request_context):
+    router = routers.ReplicaRouter()
+    task = Task(id=1)
+    task._state.db = "replica1"
+
+    assert router.db_for_read(Task, instance=task) == "replica1"
+    assert router.db_for_read(Task) == "default"
+
+
+@override_settings(DATABASE_REPLICAS=["replica1"], REPLICA_STICKY_SECONDS=10)
+def test_middleware_sticks_client_to_primary_after_write():
+    router = routers.ReplicaRouter()
+    reads = []
+
+    def write_view(request):
+        reads.append(routers.read_db())
+        router.db_for_write(Task)
+        return HttpResponse()
+
+    def read_view(request):
+        reads.append(routers.read_db())
+        return HttpResponse()
+
+    factory = RequestFactory()
+    response = ReplicaStickinessMiddleware(write_view)(factory.post("/"))
+    cookie = response.cookies[ReplicaStickinessMiddleware.cookie_name]
+    assert float(cookie.value) > time.time()
+
+    request = factory.get("/")
+    request.COOKIES[ReplicaStickinessMiddleware.cookie_name] = cookie.value
+    ReplicaStickinessMiddleware(read_view)(request)
+    response = ReplicaStickinessMiddleware(read_view)(factory.get("/"))
+
+    assert reads == ["replica1", "default", "replica1"]
+    assert ReplicaStickinessMiddleware.cookie_name not in response.cookies
+    assert not routers.primary_pinned()
+
+
+@override_settings(DATABASE_REPLICAS=["replica1"])
+def test_middleware_sets_no_cookie_on_token_api_requests():
+    def write_view(request):
+        routers.ReplicaRouter().db_for_write(Task)
+        return HttpResponse()
+
+    request = RequestFactory().post("/api/v1/tasks/", HTTP_AUTHORIZATION="Bearer token")
+    response = ReplicaStickinessMiddleware(write_view)(request)
+
+    assert ReplicaStickinessMiddleware.cookie_name not in response.cookies
+
+
+def load_settings(**env) -> dict:
+    code = (
+        "import json, taskmanager.settings as s; "
+        "print(json.dumps([sorted(s.DATABASES), s.DATABASE_REPLICAS, s.DATABASE_ROUTERS]))"
+    )
+    environ = {key: value for key, value in os.environ.items() if key != "DB_REPLICAS"}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[3],
+        env={**environ, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def test_replicas_come_only_from_db_replicas():
+    assert load_settings(DB_READ_CONNECTION="1") == [
+        ["default", "read"], [], ["taskmanager.routers.SQLiteReadRouter"]
+    ]
+    # The replica router wins; the read-only connection isn't set up
+    assert load_settings(DB_READ_CONNECTION="1", DB_REPLICAS="a.sqlite3,b.sqlite3") == [
+        ["default", "replica1", "replica2"],
+        ["replica1", "replica2"],
+        ["taskmanager.routers.ReplicaRouter"],
+    ]
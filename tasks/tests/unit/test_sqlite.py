@@ -0,0 +1,86 @@
+import pytest
+from django.db import OperationalError, connection, transaction
+
+from taskmanager import sqlite
+from taskmanager.routers import SQLiteReadRouter
+from tasks.models import Task
+
+
+@pytest.mark.django_db
+def test_pragmas_applied_on_connect():
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA busy_timeout")
+        assert cursor.fetchone()[0] == sqlite.DEFAULT_PRAGMAS["busy_timeout"]
+        cursor.execute("PRAGMA synchronous")
+        # NORMAL
+        assert cursor.fetchone()[0] == 1
+
+
+def test_retry_on_lock_retries_locked_errors():
+    calls = []
+
+    @sqlite.retry_on_lock(attempts=3, backoff=0.001)
+    def write():
+        calls.append(1)
+        if len(calls) < 3:
+            raise OperationalError("database is locked")
+        return "written"
+
+    assert write() == "written"
+    assert len(calls) == 3
+
+
+def test_retry_on_lock_gives_up():
+    calls = []
+
+    @sqlite.retry_on_lock(attempts=2, backoff=0.001)
+    def write():
+        calls.append(1)
+        raise OperationalError("database is locked")
+
+    with pytest.raises(OperationalError):
+        write()
+    assert len(calls) == 2
+
+
+def test_retry_on_lock_ignores_other_errors():
+    calls = []
+
+    @sqlite.retry_on_lock(attempts=3, backoff=0.001)
+    def write():
+        calls.append(1)
+        raise OperationalError("no such table: tasks_task")
+
+    with pytest.raises(OperationalError):
+        write()
+    assert len(calls) == 1
+
+
+@pytest.mark.django_db
+def test_retry_on_lock_not_inside_transaction():
+    calls = []
+
+    @sqlite.retry_on_lock(attempts=3, backoff=0.001)
+    def write():
+        calls.append(1)
+        raise OperationalError("database is locked")
+
+    with transaction.atomic(), pytest.raises(OperationalError):
+        write()
+    assert len(calls) == 1
+
+
+def test_read_router_uses_read_connection():
+    router = SQLiteReadRouter()
+
+    assert router.db_for_read(Task) == "read"
+    assert router.db_for_write(Task) == "default"
+    assert router.allow_migrate("read", "tasks") is False
+
+
+@pytest.mark.django_db
+def test_read_router_keeps_reads_in_transaction():
+    router = SQLiteReadRouter()
+
+    with transaction.atomic():
+        assert router.db_for_read(Task) == "default"
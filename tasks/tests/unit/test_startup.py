@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from tasks.management.commands.import_report import parse_import_times
+
+
+def test_parse_import_times():
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |     ninja.conf",
+            "import time:       300 |        420 |   ninja",
+            "some unrelated line",
+        ]
+    )
+
+    assert parse_import_times(output) == [
+        ("ninja.conf", 120, 120, 2),
+        ("ninja", 300, 420, 1),
+    ]
+
+
+def test_project_urls_do_not_import_the_api():
+    code = (
+        "import sys, django; django.setup(); import taskmanager.urls; "
+        "print('ninja' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[3],
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": "taskmanager.settings"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,9 @@
+from taskmanager.templating import warm_templates
+
+
+def test_all_templates_compile():
+    result = warm_templates()
+
+    assert result["failed"] == {}
+    assert "tasks/home.html" in result["compiled"]
+    assert "tasks/_task_card.html" in result["compiled"]
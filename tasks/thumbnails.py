@@ -0,0 +1,113 @@
+"""
+Derivative images for `Task.image_upload` and `UserProfile.photo`.
+
+Thumbnails are generated by a small background worker pool after the
+upload commits. They are stored under the SHA-256 of the original, as
+`thumbnails/<sha256>/<size>.jpg`, so identical images share their
+thumbnails. The digest is recorded on the owning row, which lets list
+pages build thumbnail URLs without touching storage or the database.
+"""
+import hashlib
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = {"small": (64, 64), "medium": (320, 320)}
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="thumbnails")
+
+
+def sizes() -> dict[str, tuple[int, int]]:
+    return getattr(settings, "THUMBNAIL_SIZES", DEFAULT_SIZES)
+
+
+def thumbnail_name(digest: str, size_name: str) -> str:
+    return f"thumbnails/{digest}/{size_name}.jpg"
+
+
+def thumbnail_urls(image, digest: str) -> dict[str, str]:
+    """URLs of every thumbnail size, or {} until they have been generated."""
+    if not image or not digest:
+        return {}
+    return {
+        size_name: default_storage.url(thumbnail_name(digest, size_name))
+        for size_name in sizes()
+    }
+
+
+def file_digest(image) -> str:
+    digest = hashlib.sha256()
+    with image.storage.open(image.name, "rb") as source:
+        for chunk in iter(lambda: source.read(64 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def generate_thumbnails(image) -> str:
+    """
+    Writes the missing thumbnails of `image` and returns the original's
+    SHA-256.
+    """
+    digest = file_digest(image)
+    missing = {
+        size_name: size
+        for size_name, size in sizes().items()
+        if not default_storage.exists(thumbnail_name(digest, size_name))
+    }
+    if not missing:
+        return digest
+
+    # Imported here so processes that never resize an image skip loading Pillow
+    from PIL import Image, ImageOps
+
+    with image.storage.open(image.name, "rb") as source:
+        original = ImageOps.exif_transpose(Image.open(source))
+        original = original.convert("RGB")
+    for size_name, size in missing.items():
+        thumbnail = original.copy()
+        thumbnail.thumbnail(size, Image.Resampling.LANCZOS)
+        output = io.BytesIO()
+        thumbnail.save(output, "JPEG", quality=80, optimize=True, progressive=True)
+        default_storage.save(
+            thumbnail_name(digest, size_name), ContentFile(output.getvalue())
+        )
+    return digest
+
+
+def _process(model, pk, field, digest_field, name, on_saved=None):
+    try:
+        image = getattr(model(pk=pk, **{field: name}), field)
+        digest = generate_thumbnails(image)
+        # Guard against the image having been replaced in the meantime
+        updated = model.objects.filter(pk=pk, **{field: name}).update(
+            **{digest_field: digest}
+        )
+        if updated and on_saved is not None:
+            on_saved(pk)
+    except Exception:
+        logger.exception("Could not generate thumbnails for %s", name)
+    finally:
+        close_old_connections()
+
+
+def schedule(instance, field: str, digest_field: str, on_saved=None) -> None:
+    """
+    Generates thumbnails in the background once the upload commits.
+    `on_saved(pk)` is called after the digest is written, e.g. to drop
+    cached copies of the row.
+    """
+    name = getattr(instance, field).name
+    if not name:
+        return
+    transaction.on_commit(
+        lambda: _executor.submit(
+            _process, type(instance), instance.pk, field, digest_field, name, on_saved
+        )
+    )
@@ -0,0 +1,196 @@
+"""
+Chunked, resumable attachment uploads.
+
+A client starts an `UploadSession`, sends the file as a sequence of chunks
+at increasing offsets and finally completes the session. Every chunk is
+streamed from the request straight into the storage backend as its own
+part, so neither the request body nor the whole file is held in memory.
+After a disconnect the client asks for `received` and resumes there. On
+completion the parts are streamed into the final file, hashed on the way
+and attached to the task.
+"""
+import hashlib
+import io
+import os
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db.models import F
+from django.utils import timezone
+
+from tasks import services, thumbnails
+from tasks.models import Task, UploadSession
+
+
+class UploadError(Exception):
+    pass
+
+
+class UploadOffsetMismatch(UploadError):
+    pass
+
+
+class UploadIncomplete(UploadError):
+    pass
+
+
+class UploadIntegrityError(UploadError):
+    pass
+
+
+def chunk_size() -> int:
+    return getattr(settings, "TASK_UPLOAD_CHUNK_SIZE", 8 * 1024 * 1024)
+
+
+class _CountingReader(io.RawIOBase):
+    """Reads at most `limit` bytes from a stream, hashing what passes."""
+
+    def __init__(self, streams, limit=None, digest=None):
+        self.streams = iter(streams)
+        self.current = next(self.streams, None)
+        self.limit = limit
+        self.digest = digest
+        self.count = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while self.current is not None:
+            size = len(buffer)
+            if self.limit is not None:
+                size = min(size, self.limit - self.count)
+                if size <= 0:
+                    return 0
+            data = self.current.read(size)
+            if data:
+                buffer[: len(data)] = data
+                self.count += len(data)
+                if self.digest is not None:
+                    self.digest.update(data)
+                return len(data)
+            self.current = next(self.streams, None)
+        return 0
+
+
+def _stream_file(reader: _CountingReader, size: int) -> File:
+    content = File(io.BufferedReader(reader, buffer_size=64 * 1024))
+    # Storages that need the size up front cannot seek to find it out
+    content.size = size
+    return content
+
+
+def start_upload(
+    task: Task, user, field: str, filename: str, size: int, sha256: str = ""
+) -> UploadSession:
+    if field not in dict(UploadSession.FIELD_CHOICES):
+        raise UploadError(f"Unknown attachment field {field!r}.")
+    return UploadSession.objects.create(
+        task=task,
+        user=user,
+        field=field,
+        filename=os.path.basename(filename),
+        size=size,
+        sha256=sha256.lower(),
+    )
+
+
+def append_chunk(session: UploadSession, offset: int, stream, length: int) -> int:
+    """
+    Streams `length` bytes from `stream` into a new part at `offset` and
+    returns the number of bytes received so far.
+    """
+    if session.completed_at:
+        raise UploadError("Upload is already complete.")
+    if offset != session.received:
+        raise UploadOffsetMismatch(f"Expected offset {session.received}.")
+    if length <= 0 or offset + length > session.size:
+        raise UploadError("Chunk does not fit the announced file size.")
+
+    reader = _CountingReader([stream], limit=length)
+    part = default_storage.save(
+        f"uploads/{session.id}/{offset:016d}.part", _stream_file(reader, length)
+    )
+    if reader.count != length:
+        # The client went away mid-chunk; it resumes from `received`
+        default_storage.delete(part)
+        raise UploadIncomplete("Chunk was cut short.")
+
+    # Concurrent retries of the same chunk: only one may advance the offset
+    advanced = UploadSession.objects.filter(id=session.id, received=offset).update(
+        received=offset + length, parts=session.parts + [part]
+    )
+    if not advanced:
+        default_storage.delete(part)
+        session.refresh_from_db()
+        raise UploadOffsetMismatch(f"Expected offset {session.received}.")
+    session.received = offset + length
+    session.parts.append(part)
+    return session.received
+
+
+def _assemble(session: UploadSession) -> str:
+    """Streams the parts into the attachment file and verifies its SHA-256."""
+
+    digest = hashlib.sha256()
+    parts = [default_storage.open(part) for part in session.parts]
+    try:
+        reader = _CountingReader(parts, digest=digest)
+        field = Task._meta.get_field(session.field)
+        name = field.storage.save(
+            os.path.join(field.upload_to, session.filename),
+            _stream_file(reader, session.size),
+        )
+    finally:
+        for part in parts:
+            part.close()
+    if session.sha256 and digest.hexdigest() != session.sha256:
+        field.storage.delete(name)
+        raise UploadIntegrityError("SHA-256 of the upload does not match.")
+    return name
+
+
+def complete_upload(session: UploadSession) -> str:
+    """
+    Assembles the parts into the attachment, verifies its SHA-256 and
+    attaches it to the task. Returns the storage name of the attachment.
+    """
+    if session.completed_at:
+        raise UploadError("Upload is already complete.")
+    if session.received != session.size:
+        raise UploadIncomplete(f"Received {session.received} of {session.size} bytes.")
+
+    # Claim the session first: a repeated or concurrent completion would
+    # otherwise assemble the (by then deleted) parts into an empty file
+    completed_at = timezone.now()
+    claimed = UploadSession.objects.filter(id=session.id, completed_at__isnull=True).update(
+        completed_at=completed_at
+    )
+    if not claimed:
+        raise UploadError("Upload is already complete.")
+    try:
+        name = _assemble(session)
+    except Exception:
+        # Let the client retry
+        UploadSession.objects.filter(id=session.id).update(completed_at=None)
+        raise
+
+    attachment = {session.field: name, f"{session.field}_name": session.filename}
+    if session.field == "image_upload":
+        attachment["image_sha256"] = ""
+    Task.objects.filter(id=session.task_id).update(
+        **attachment, version=F("version") + 1, updated_at=timezone.now()
+    )
+    task = Task.objects.get(id=session.task_id)
+    services.task_changed(task)
+    if session.field == "image_upload":
+        thumbnails.schedule(
+            task, "image_upload", "image_sha256", on_saved=services.forget_task
+        )
+    for part in session.parts:
+        default_storage.delete(part)
+    session.completed_at = completed_at
+    session.parts = []
+    session.save(update_fields=["completed_at", "parts"])
+    return name
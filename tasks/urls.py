@@ -28,10 +28,16 @@ urlpatterns = [
     path('example-form/', contact_form_view, name='example-form'),
     path("tasks/new/", TaskCreateView.as_view(), name="task-create"),  # POST
     path("tasks/home/", task_home, name="task-home"),
+    path("tasks/events/", views.task_event_stream, name="task-events"),
     path("tasks/<int:pk>/", TaskDetailView.as_view(), name="task-detail"),
     path(
         "tasks/<int:pk>/edit/", TaskUpdateView.as_view(), name="task-update"
     ),  # PUT/PATCH
+    path(
+        "tasks/<int:pk>/attachments/<str:name>/",
+        views.task_attachment,
+        name="task-attachment",
+    ),
     path(
         "tasks/<int:pk>/delete/", TaskDeleteView.as_view(), name="task-delete"
     ),  # DELETE
@@ -6,7 +6,9 @@ from django.http import (
     HttpResponseRedirect,
     Http404,
     JsonResponse,
+    StreamingHttpResponse,
 )
+from django.core.handlers.asgi import ASGIRequest
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.contrib.auth.decorators import login_required, permission_required
 from django.shortcuts import get_object_or_404, render, redirect
@@ -16,8 +18,8 @@ from django.views.generic.edit import CreateView, DeleteView, UpdateView
 from django.template import loader
 
 from .models import Task
-from .mixins import SprintTaskMixin
-from . import services
+from .mixins import ObjectCacheMixin, SprintTaskMixin
+from . import downloads, events, services
 from .forms import TaskForm, ContactForm, EpicFormSet
 
 # Added LoginRequiredMixin for authenticate user
@@ -25,8 +27,10 @@ class TaskListView(PermissionRequiredMixin, ListView):
     """A view that display a list of objects from a Task model"""
     permission_required = ("task.view_task", "tasks.custom_task")
     model = Task
-    template_name = "task_list.html"
+    template_name = "tasks/task_list.html"
     context_object_name = "tasks"
+    ordering = ("-created_at", "-id")
+    paginate_by = 25
     login_url = '/login/'
     raise_exception = True
 
@@ -53,10 +57,13 @@ class TaskCreateView(LoginRequiredMixin, CreateView):
     def form_valid(self, form):
         # Set the creator to the currently logged in user
         form.instance.creator = self.request.user
+        form.instance._actor_id = self.request.user.pk
         return super().form_valid(form)
 
 
-class TaskUpdateView(PermissionRequiredMixin, SprintTaskMixin, UpdateView):
+class TaskUpdateView(
+    PermissionRequiredMixin, SprintTaskMixin, ObjectCacheMixin, UpdateView
+):
     """A view that shows a form for updating an existing object, which is saved to a model"""
     permission_required = ("tasks.change_task",)
     model = Task
@@ -66,21 +73,19 @@ class TaskUpdateView(PermissionRequiredMixin, SprintTaskMixin, UpdateView):
     def get_success_url(self):
         return reverse_lazy("tasks:task-detail", kwargs={"pk": self.object.id})
 
+    def form_valid(self, form):
+        form.instance._actor_id = self.request.user.pk
+        return super().form_valid(form)
+
     def has_permission(self):
         # First, check if the user has the general permission to edit tasks
-        has_general_permission = super().has_permission()
-        
+        if not super().has_permission():
+            return False
+
         # Then check if the user is either the
-        # creator or teh owner of this task
-        task_id = self.kwargs.get("pk")
-        task = get_object_or_404(Task, id=task_id)
-        
-        is_creator_or_owner = (
-            task.creator == self.request.user or task.owner == self.request.user
-        )
-        
-        # Return True only if both conditions are met
-        return has_general_permission and is_creator_or_owner
+        # creator or the owner of this task
+        task = self.get_object()
+        return self.request.user.pk in (task.creator_id, task.owner_id)
 
 class TaskDeleteView(DeleteView):
     """A view that shows a confirmation page and deletes an existing object."""
@@ -93,9 +98,9 @@ class TaskDeleteView(DeleteView):
 # @login_required
 def task_home(request):
     # Fetch all tasks at once
-    tasks = Task.objects.filter(
+    tasks = services.list_tasks().filter(
         status__in=["UNASSIGNED", "IN_PROGRESS", "DONE", "ARCHIVED"]
-    )
+    ).select_related("owner")
     # initialize dictionaries to hold tasks by status
     context = defaultdict(list)
     # Categorize tasks into their respective lists for task in tasks:
@@ -169,6 +174,51 @@ def claim_task_view(request, task_id):
         return HttpResponse("Task does not exist.", status=400)
 
 
+async def task_event_stream(request):
+    """
+    Server-sent events with task create/update/claim/delete notifications.
+    Boards may narrow the stream with `sprint`, `epic` and `owner` ids.
+
+    Needs an ASGI server: under WSGI the endless response would tie up a
+    worker for good, so it is refused there.
+    """
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse("Task events need the ASGI server.", status=501)
+    user = await request.auser()
+    if not user.is_authenticated:
+        return HttpResponse("Authentication required.", status=401)
+    filters = {
+        name: int(request.GET[name])
+        for name in ("sprint", "epic", "owner")
+        if request.GET.get(name, "").isdigit()
+    }
+    subscription = events.subscribe(**filters)
+
+    async def stream():
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                event = await subscription.get(timeout=15)
+                if event is None:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                else:
+                    yield event.to_sse()
+        finally:
+            subscription.close()
+
+    response = StreamingHttpResponse(stream(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+@login_required
+def task_attachment(request, pk, name):
+    task = get_object_or_404(Task, pk=pk)
+    return downloads.attachment_response(request, downloads.get_attachment(task, name))
+
+
 def custom_404(request, exception):
     return render(request, "404.html", {}, status=404)
 